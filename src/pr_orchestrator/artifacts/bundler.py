@@ -8,10 +8,37 @@ import tempfile
 import zipfile
 from pathlib import Path
 
+from ..constants import ARTIFACT_COMPRESSION
 from ..policy.redaction import redact_secrets
 
 logger = logging.getLogger(__name__)
 
+# Zip compression settings selectable via ``ARTIFACT_COMPRESSION``.
+_COMPRESSION: dict[str, tuple[int, int | None]] = {
+    "stored": (zipfile.ZIP_STORED, None),
+    "deflate1": (zipfile.ZIP_DEFLATED, 1),
+    "deflate6": (zipfile.ZIP_DEFLATED, 6),
+    "lzma": (zipfile.ZIP_LZMA, None),
+}
+
+# Size of the text slices encoded and written to a zip entry at a time.
+_WRITE_CHUNK_CHARS = 64 * 1024
+
+
+def _write_redacted(
+    zf: zipfile.ZipFile, name: str, text: str, secrets: list[str]
+) -> None:
+    """Redact ``text`` and stream it into the archive entry ``name``.
+
+    Redaction runs over the whole text because token patterns have no upper
+    length bound, but the result is encoded and written in slices so the
+    full encoded payload is never held in memory alongside the string.
+    """
+    redacted = redact_secrets(text, secrets)
+    with zf.open(name, "w", force_zip64=True) as fh:
+        for start in range(0, len(redacted), _WRITE_CHUNK_CHARS):
+            fh.write(redacted[start : start + _WRITE_CHUNK_CHARS].encode("utf-8"))
+
 
 def bundle_artifacts(
     diff_text: str,
@@ -29,16 +56,24 @@ def bundle_artifacts(
     """
     tmpdir = Path(tempfile.mkdtemp(prefix="mcp_artifacts_"))
     archive_path = tmpdir / "artifacts.zip"
-    with zipfile.ZipFile(archive_path, "w") as zf:
-        zf.writestr("diff.patch", redact_secrets(diff_text, secrets))
+    try:
+        compression, compresslevel = _COMPRESSION[ARTIFACT_COMPRESSION]
+    except KeyError as exc:
+        raise ValueError(
+            f"Unknown ARTIFACT_COMPRESSION '{ARTIFACT_COMPRESSION}'; "
+            f"expected one of {', '.join(_COMPRESSION)}"
+        ) from exc
+    with zipfile.ZipFile(
+        archive_path, "w", compression=compression, compresslevel=compresslevel
+    ) as zf:
+        _write_redacted(zf, "diff.patch", diff_text, secrets)
         # Serialize and redact metadata and failure objects
-        meta_str = json.dumps(metadata)
-        before_str = json.dumps(before_failures)
-        after_str = json.dumps(after_failures)
-        zf.writestr("metadata.json", redact_secrets(meta_str, secrets))
-        zf.writestr("before_failures.json", redact_secrets(before_str, secrets))
-        zf.writestr("after_failures.json", redact_secrets(after_str, secrets))
+        _write_redacted(zf, "metadata.json", json.dumps(metadata), secrets)
+        _write_redacted(
+            zf, "before_failures.json", json.dumps(before_failures), secrets
+        )
+        _write_redacted(zf, "after_failures.json", json.dumps(after_failures), secrets)
         for name, log in logs.items():
-            zf.writestr(f"logs/{name}.txt", redact_secrets(log, secrets))
+            _write_redacted(zf, f"logs/{name}.txt", log, secrets)
     logger.debug("Created artifact bundle at %s", archive_path)
     return archive_path
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import json
 
-def generate_report(before_failures: dict[str, object], after_failures: dict[str, object]) -> str:
-    """Generate a simple report summarising test results before and after."""
-    report_lines = []
-    report_lines.append("### Before Failures\n")
-    report_lines.append(str(before_failures) + "\n\n")
-    report_lines.append("### After Failures\n")
-    report_lines.append(str(after_failures) + "\n")
-    return "".join(report_lines)
+
+def generate_report(
+    before_failures: dict[str, object], after_failures: dict[str, object]
+) -> str:
+    """Generate a simple report summarising test results before and after.
+
+    Failure objects are rendered as JSON; values that are not JSON
+    serializable fall back to ``str``.
+    """
+    before = json.dumps(before_failures, default=str)
+    after = json.dumps(after_failures, default=str)
+    return f"### Before Failures\n{before}\n\n### After Failures\n{after}\n"
@@ -16,11 +16,15 @@ Optional variables with defaults:
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cache
+
+from .policy.allowlist import normalize_allowlist
 
 try:
     from dotenv import load_dotenv
 except ImportError:
+
     def load_dotenv(*args, **kwargs):  # type: ignore[override]
         return False
 
@@ -34,6 +38,10 @@ class Config:
     allowed_repos: list[str]
     e2b_api_key: str
     log_level: str
+    allowed_repos_normalized: frozenset[str] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.allowed_repos_normalized = normalize_allowlist(self.allowed_repos)
 
     @classmethod
     def load_from_env(cls) -> Config:
@@ -56,7 +64,9 @@ class Config:
             missing.append("E2B_API_KEY")
 
         if missing:
-            raise RuntimeError(f"Missing required environment variables: {', '.join(missing)}")
+            raise RuntimeError(
+                f"Missing required environment variables: {', '.join(missing)}"
+            )
 
         # Optional: GITHUB_USERNAME with default
         github_username = os.getenv("GITHUB_USERNAME")
@@ -67,7 +77,9 @@ class Config:
         # Optional: ALLOWED_REPOS with default
         allowed_repos_str = os.getenv("ALLOWED_REPOS")
         if allowed_repos_str:
-            allowed_repos = [repo.strip() for repo in allowed_repos_str.split(",") if repo.strip()]
+            allowed_repos = [
+                repo.strip() for repo in allowed_repos_str.split(",") if repo.strip()
+            ]
         else:
             # Default: allow all repos under the configured username
             allowed_repos = [f"{github_username}/*"]
@@ -82,3 +94,14 @@ class Config:
             e2b_api_key=e2b_api_key,
             log_level=log_level,
         )
+
+
+@cache
+def get_config() -> Config:
+    """Return the process-wide configuration, loading it on first use.
+
+    The environment is process-scoped, so repeated callers share one
+    ``Config`` instead of re-reading `.env` each time.  Call
+    ``get_config.cache_clear()`` to force a reload.
+    """
+    return Config.load_from_env()
@@ -22,6 +22,16 @@ MAX_PATCH_LINES = int(os.environ.get("MAX_PATCH_LINES", 5000))
 FIX_LOOP_MAX_ITERS = int(os.environ.get("FIX_LOOP_MAX_ITERS", 5))
 RETRY_COUNT = int(os.environ.get("RETRY_COUNT", 1))
 
+# Artifact bundles: one of "stored", "deflate1", "deflate6" or "lzma".
+# Level-1 deflate keeps most of the ratio on JSON/diff/log text for a
+# fraction of the CPU spent at the default level 6.
+ARTIFACT_COMPRESSION = os.environ.get("ARTIFACT_COMPRESSION", "deflate1")
+
+# Sandboxes: number of fresh E2B sandboxes kept provisioned ahead of
+# workspace creation.  Idle pooled sandboxes are billed, so this is off by
+# default.
+E2B_SANDBOX_POOL_SIZE = int(os.environ.get("E2B_SANDBOX_POOL_SIZE", 0))
+
 # Transport
 MCP_TRANSPORT = os.environ.get("MCP_TRANSPORT", "stdio")
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from typing import TypedDict, cast
 
 import httpx
 
@@ -11,11 +12,19 @@ from .auth import get_github_client
 
 logger = logging.getLogger(__name__)
 
+# Every request goes to this host; callers pass only the path.
+_GH_BASE = "https://api.github.com"
+
+
+def _fork_owner(fork_repo_slug: str) -> str:
+    """Return the owner part of an ``owner/repo`` slug."""
+    return fork_repo_slug.split("/", 1)[0]
+
 
 def _github_request(
     config: Config,
     method: str,
-    url: str,
+    path: str,
     *,
     params: dict[str, object] | None = None,
     json: dict[str, object] | None = None,
@@ -27,15 +36,17 @@ def _github_request(
     headers and basic error handling.  If the request returns a non-2xx
     response (other than 404 when ``allow_404=True``), an error is raised.
 
-    All requests go only to https://api.github.com/...
+    ``path`` is appended to ``_GH_BASE`` so all requests go only to
+    https://api.github.com/...; it must start with ``/`` so that nothing in
+    it can be read as userinfo or a different host.
     """
-    # Ensure we only talk to GitHub API
-    if not url.startswith("https://api.github.com/"):
-        raise ValueError(f"Invalid GitHub API URL: {url}")
+    if not path.startswith("/"):
+        raise ValueError(f"Invalid GitHub API path: {path}")
 
     try:
-        with get_github_client(config) as client:
-            resp = client.request(method, url, params=params, json=json)
+        resp = get_github_client(config).request(
+            method, _GH_BASE + path, params=params, json=json
+        )
     except httpx.HTTPError as exc:
         logger.error("GitHub API request failed: %s", exc)
         raise RuntimeError(f"GitHub API request failed: {exc}") from exc
@@ -57,44 +68,89 @@ def _github_request(
 
 def get_issue(config: Config, repo_slug: str, issue_number: int) -> dict[str, object]:
     """Retrieve a GitHub issue.  Returns a dict with `title`, `body`, `url` or `{missing: True}`."""
-    url = f"https://api.github.com/repos/{repo_slug}/issues/{issue_number}"
-    data = _github_request(config, "GET", url, allow_404=True)
+    data = _github_request(
+        config, "GET", f"/repos/{repo_slug}/issues/{issue_number}", allow_404=True
+    )
     if data is None:
         return {"missing": True}
-    return {"title": data.get("title"), "body": data.get("body"), "url": data.get("html_url")}
+    issue = cast("dict[str, object]", data)
+    return {
+        "title": issue.get("title"),
+        "body": issue.get("body"),
+        "url": issue.get("html_url"),
+    }
+
+
+class _RepoRef(TypedDict):
+    full_name: str
+
+
+class _PullHead(TypedDict):
+    ref: str
+    repo: _RepoRef
+
+
+class _UserRef(TypedDict):
+    login: str
 
 
-def find_prs_for_issue(config: Config, repo_slug: str, issue_number: int) -> dict[str, list[dict[str, object]]]:
+class _PullRequest(TypedDict):
+    """The fields of a ``GET /repos/{slug}/pulls`` item this module reads."""
+
+    number: int
+    html_url: str
+    title: str | None
+    body: str | None
+    head: _PullHead
+    user: _UserRef
+    state: str
+
+
+def _pr_descriptor(pr: _PullRequest) -> dict[str, object]:
+    """Reduce a pull request payload to the fields returned to clients."""
+    return {
+        "number": pr["number"],
+        "url": pr["html_url"],
+        "head_branch": pr["head"]["ref"],
+        "head_repo": pr["head"]["repo"]["full_name"],
+        "author_login": pr["user"]["login"],
+        "state": pr["state"],
+    }
+
+
+def _mentions_issue(pr: _PullRequest, repo_slug: str, issue_number: int) -> bool:
+    """Return True if the PR title or body references the issue."""
+    issue_ref = f"#{issue_number}"
+    issue_url = f"https://github.com/{repo_slug}/issues/{issue_number}"
+    title = pr.get("title") or ""
+    body = pr.get("body") or ""
+    search_text = f"{title}\n{body}".lower()
+    return issue_ref.lower() in search_text or issue_url.lower() in search_text
+
+
+def find_prs_for_issue(
+    config: Config, repo_slug: str, issue_number: int
+) -> dict[str, list[dict[str, object]]]:
     """Find pull requests linked to an issue.
 
     This implementation searches the repository's pull requests and filters by issue number in the PR body.
+    The pulls listing is used rather than the search API: the search index
+    lags behind writes, so a just-opened PR could be missed.
     It returns a list of PR descriptors.
     """
     prs: list[dict[str, object]] = []
     page = 1
     while True:
-        url = f"https://api.github.com/repos/{repo_slug}/pulls"
         params = {"state": "all", "per_page": 100, "page": page}
-        items = _github_request(config, "GET", url, params=params)
+        data = _github_request(
+            config, "GET", f"/repos/{repo_slug}/pulls", params=params
+        )
+        items = cast("list[_PullRequest] | None", data)
         if not items:
             break
-        issue_ref = f"#{issue_number}"
-        issue_url = f"https://github.com/{repo_slug}/issues/{issue_number}"
         for pr in items:
-            title = pr.get("title", "") or ""
-            body = pr.get("body", "") or ""
-            search_text = f"{title}\n{body}".lower()
-            if issue_ref.lower() in search_text or issue_url.lower() in search_text:
-                prs.append(
-                    {
-                        "number": pr["number"],
-                        "url": pr["html_url"],
-                        "head_branch": pr["head"]["ref"],
-                        "head_repo": pr["head"]["repo"]["full_name"],
-                        "author_login": pr["user"]["login"],
-                        "state": pr["state"],
-                    }
-                )
+            if _mentions_issue(pr, repo_slug, issue_number):
+                prs.append(_pr_descriptor(pr))
         page += 1
     return {"prs": prs}
 
@@ -112,15 +168,11 @@ def open_pr(
     """Open a pull request on the upstream repository.
 
     Returns the PR URL and number.
-    
+
     The head format is: fork_owner:head_branch
     """
-    url = f"https://api.github.com/repos/{upstream_repo_slug}/pulls"
-
     # Correctly compute PR head: fork_owner:branch
-    # fork_repo_slug is "owner/repo", so split on "/" and take first part
-    fork_owner = fork_repo_slug.split("/", 1)[0]
-    head = f"{fork_owner}:{head_branch}"
+    head = f"{_fork_owner(fork_repo_slug)}:{head_branch}"
 
     payload = {
         "title": title,
@@ -130,5 +182,7 @@ def open_pr(
         "draft": draft,
     }
 
-    data = _github_request(config, "POST", url, json=payload)
+    data = _github_request(
+        config, "POST", f"/repos/{upstream_repo_slug}/pulls", json=payload
+    )
     return {"pr_url": data["html_url"], "pr_number": data["number"]}
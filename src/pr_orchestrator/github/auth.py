@@ -2,18 +2,41 @@
 
 from __future__ import annotations
 
+import atexit
+
 import httpx
 
 from ..config import Config
 
+# Shared clients keyed by credentials so that connections (and their TLS
+# sessions) to api.github.com are kept alive across requests.
+_CLIENTS: dict[tuple[str, str], httpx.Client] = {}
+
 
 def get_github_client(config: Config) -> httpx.Client:
-    """Return a configured GitHub httpx client with the Authorization header set."""
-    return httpx.Client(
-        headers={
-            "Authorization": f"token {config.github_token}",
-            "Accept": "application/vnd.github+json",
-            "User-Agent": f"pr-orchestrator-mcp/{config.github_username}",
-        },
-        timeout=10.0,
-    )
+    """Return a configured GitHub httpx client with the Authorization header set.
+
+    The client is created once per token/username pair and reused; callers
+    must not close it.
+    """
+    key = (config.github_token, config.github_username)
+    client = _CLIENTS.get(key)
+    if client is None or client.is_closed:
+        client = httpx.Client(
+            headers={
+                "Authorization": f"token {config.github_token}",
+                "Accept": "application/vnd.github+json",
+                "User-Agent": f"pr-orchestrator-mcp/{config.github_username}",
+            },
+            timeout=10.0,
+        )
+        _CLIENTS[key] = client
+    return client
+
+
+@atexit.register
+def _close_clients() -> None:
+    """Close all shared clients at interpreter exit."""
+    for client in _CLIENTS.values():
+        client.close()
+    _CLIENTS.clear()
@@ -23,41 +23,22 @@ def generate_pr_body(
     relevant issue instead of relying on the caller to insert the URL in
     ``related_issue``.
     """
-    body_parts: list[str] = []
-    # Include the base template if provided
-    if base_template:
-        base = base_template.strip()
-        if base:
-            body_parts.append(base)
-            # Ensure separation
-            if not base.endswith("\n\n"):
-                body_parts.append("\n\n")
-    # Core sections
-    body_parts.append("### Summary\n")
-    body_parts.append(summary.strip() + "\n\n")
-    body_parts.append("### Changes\n")
-    for change in changes:
-        body_parts.append(f"- {change}\n")
-    body_parts.append("\n### Unit Tests Added/Updated\n")
-    if unit_tests:
-        for test in unit_tests:
-            body_parts.append(f"- {test}\n")
-    else:
-        body_parts.append("None\n")
-    body_parts.append("\n### Verification\n")
-    for cmd in verification_commands:
-        body_parts.append(f"- `{cmd}`\n")
-    body_parts.append("\n### Related to\n")
-    # Always include the issue reference line with the prefix "Related to".
-    # The related_issue argument should contain the issue number prefixed with '#'.
-    body_parts.append(f"Related to {related_issue}\n")
-    # On the next line, include the issue URL if available.  Leave a blank line
-    # afterwards to separate from the notes section.
-    if issue_url:
-        body_parts.append(f"{issue_url}\n\n")
-    else:
-        # If no URL provided, still insert a blank line to maintain spacing.
-        body_parts.append("\n")
-    body_parts.append("### Notes/Risks\n")
-    body_parts.append(notes.strip() + "\n")
-    return "".join(body_parts)
+    # A stripped base template never ends in a blank line, so it is always
+    # followed by a separator.
+    base = base_template.strip() if base_template else ""
+    header = f"{base}\n\n" if base else ""
+    change_lines = "".join(f"- {change}\n" for change in changes)
+    test_lines = "".join(f"- {test}\n" for test in unit_tests) or "None\n"
+    verification_lines = "".join(f"- `{cmd}`\n" for cmd in verification_commands)
+    # The "Related to" line takes the issue number prefixed with '#' (never an
+    # auto-close keyword); the issue URL, when available, goes on the next line.
+    url_line = f"{issue_url}\n" if issue_url else ""
+    return (
+        f"{header}"
+        f"### Summary\n{summary.strip()}\n\n"
+        f"### Changes\n{change_lines}\n"
+        f"### Unit Tests Added/Updated\n{test_lines}\n"
+        f"### Verification\n{verification_lines}\n"
+        f"### Related to\nRelated to {related_issue}\n{url_line}\n"
+        f"### Notes/Risks\n{notes.strip()}\n"
+    )
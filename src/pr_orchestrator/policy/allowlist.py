@@ -8,9 +8,28 @@ This module centralises logic for checking whether a repository is allowed.
 from __future__ import annotations
 
 from collections.abc import Iterable
+from functools import lru_cache
 
 
-def is_repo_allowed(repo_slug: str, allowed: Iterable[str], owner_prefix: str = "saakshigupta2002") -> bool:
+def normalize_allowlist(allowed: Iterable[str]) -> frozenset[str]:
+    """Return ``allowed`` lower-cased and stripped as a frozenset.
+
+    The checks below treat a ``frozenset`` argument as already normalized,
+    so callers holding a long-lived allowlist (``Config``) normalize it once
+    here instead of on every check.
+    """
+    return frozenset(r.lower().strip() for r in allowed)
+
+
+def _normalized(allowed: Iterable[str]) -> frozenset[str]:
+    if isinstance(allowed, frozenset):
+        return allowed
+    return normalize_allowlist(allowed)
+
+
+def is_repo_allowed(
+    repo_slug: str, allowed: Iterable[str], owner_prefix: str = "saakshigupta2002"
+) -> bool:
     """Return ``True`` if ``repo_slug`` is explicitly permitted.
 
     This helper retains backward compatibility with the original allowlist
@@ -21,7 +40,7 @@ def is_repo_allowed(repo_slug: str, allowed: Iterable[str], owner_prefix: str =
     repositories.
     """
     normalized = repo_slug.lower().strip()
-    allowed_normalized = {r.lower().strip() for r in allowed}
+    allowed_normalized = _normalized(allowed)
     # Must begin with owner_prefix
     if not normalized.startswith(f"{owner_prefix.lower()}/"):
         return False
@@ -39,7 +58,7 @@ def upstream_allowed(repo_slug: str, allowed: Iterable[str]) -> bool:
     owner are permitted.  An entry of ``*/*`` or ``*`` allows any upstream.
     """
     normalized = repo_slug.lower().strip()
-    allowed_normalized = {r.lower().strip() for r in allowed}
+    allowed_normalized = _normalized(allowed)
     if "*" in allowed_normalized or "*/*" in allowed_normalized:
         return True
     if normalized in allowed_normalized:
@@ -72,35 +91,25 @@ def fork_owner_allowed(repo_slug: str, username: str, allowed: Iterable[str]) ->
         _owner_prefix, repo_name = normalized.split("/", 1)
     except ValueError:
         return False
-    allowed_normalized = {r.lower().strip() for r in allowed}
-    # Global wildcard
-    if "*" in allowed_normalized or "*/*" in allowed_normalized:
-        return True
-    # Match on repo name from any owner
-    for entry in allowed_normalized:
-        if entry.endswith("/*"):
-            # owner wildcard
-            # e.g. "org/*" allows any project under org
-            continue
-    # Check direct match: if upstream 'owner/repo' is allowed, then fork is allowed
+    admits_any, repo_names = _fork_index(_normalized(allowed))
+    return admits_any or repo_name in repo_names
+
+
+@lru_cache(maxsize=32)
+def _fork_index(allowed_normalized: frozenset[str]) -> tuple[bool, frozenset[str]]:
+    """Return whether ``allowed_normalized`` admits any fork, and its repo names.
+
+    A global wildcard or an owner wildcard (``org/*``) admits any fork under
+    the username; otherwise the fork's repo name must match an entry's.
+    Keyed on the frozenset itself, so a reloaded config gets a fresh entry.
+    """
+    admits_any = False
+    repo_names: set[str] = set()
     for entry in allowed_normalized:
-        # skip wildcard entries
-        if entry.endswith("/*"):
-            # extract owner
-            continue
-        try:
-            _allowed_owner, allowed_repo = entry.split("/", 1)
-        except ValueError:
+        if entry == "*" or entry.endswith("/*"):
+            admits_any = True
             continue
-        if allowed_repo == repo_name:
-            return True
-    # Check owner wildcard: e.g. "org/*" means any repo of org is allowed
-    # In this case, the fork owner must match username and repo name from that org
-    for entry in allowed_normalized:
-        if entry.endswith("/*"):
-            # entry form: "owner/*"
-            owner_prefix = entry[:-2]
-            # if upstream owner wildcard matches, any repo with that name is allowed
-            # Accept the fork because upstream check will have validated earlier
-            return True
-    return False
+        _allowed_owner, sep, allowed_repo = entry.partition("/")
+        if sep:
+            repo_names.add(allowed_repo)
+    return admits_any, frozenset(repo_names)
@@ -2,24 +2,44 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Sized
 
 from ..constants import MAX_CHANGED_FILES, MAX_PATCH_LINES
 
 
-def enforce_patch_limits(files_modified: Iterable[str], diff_lines: int) -> None:
+def enforce_patch_limits(
+    files_modified: Iterable[str],
+    diff_lines: int,
+    *,
+    max_files: int = MAX_CHANGED_FILES,
+    max_lines: int = MAX_PATCH_LINES,
+) -> None:
     """Ensure that the patch does not exceed configured limits.
 
     :param files_modified: names of files modified by the patch
     :param diff_lines: total number of added and removed lines
+    :param max_files: maximum number of modified files
+        (defaults to ``MAX_CHANGED_FILES``)
+    :param max_lines: maximum number of changed lines (defaults to ``MAX_PATCH_LINES``)
     :raises ValueError: if the patch exceeds configured limits
     """
-    file_count = len(list(files_modified))
-    if file_count > MAX_CHANGED_FILES:
+    if isinstance(files_modified, Sized):
+        file_count = len(files_modified)
+        if file_count > max_files:
+            raise ValueError(
+                f"Patch modifies {file_count} files "
+                f"which exceeds the limit of {max_files}"
+            )
+    else:
+        # Count lazily and stop as soon as the limit is exceeded; the true
+        # total is then unknown
+        for file_count, _ in enumerate(files_modified, 1):
+            if file_count > max_files:
+                raise ValueError(
+                    f"Patch modifies more than {max_files} files "
+                    f"which exceeds the limit of {max_files}"
+                )
+    if diff_lines > max_lines:
         raise ValueError(
-            f"Patch modifies {file_count} files which exceeds the limit of {MAX_CHANGED_FILES}"
-        )
-    if diff_lines > MAX_PATCH_LINES:
-        raise ValueError(
-            f"Patch has {diff_lines} lines which exceeds the limit of {MAX_PATCH_LINES}"
+            f"Patch has {diff_lines} lines which exceeds the limit of {max_lines}"
         )
@@ -7,27 +7,201 @@ that substitutes secrets with the string ``"<REDACTED>"``.
 
 from __future__ import annotations
 
+import importlib
 import re
-from collections.abc import Iterable
+import threading
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+from types import ModuleType
+from typing import Protocol
 
-_TOKEN_PATTERNS = [
+
+def _load_hyperscan() -> ModuleType | None:
+    """Return the optional ``hyperscan`` accelerator, see _may_match."""
+    try:
+        return importlib.import_module("hyperscan")
+    except ImportError:
+        return None
+
+
+hyperscan = _load_hyperscan()
+
+
+class _HyperscanDatabase(Protocol):
+    """The part of ``hyperscan.Database`` used here."""
+
+    def compile(
+        self, expressions: list[bytes], ids: list[int], flags: list[int]
+    ) -> None: ...
+
+    def scan(self, data: bytes, match_event_handler: Callable[..., bool]) -> object: ...
+
+
+# Token formats are matched case-insensitively, as they always have been, but
+# only on the literal prefixes (and AWS key bodies) that need it, via scoped
+# ``(?i:...)`` groups: a global ``re.IGNORECASE`` would also case fold every
+# character tried against the generic patterns.  Every token format is ASCII,
+# so ``\b``, ``\s`` and case folding use ASCII semantics; this also matches how
+# Hyperscan reads the same patterns.
+_FLAGS = re.ASCII
+
+_PREFIXED_PATTERNS = [
+    # Private key blocks (BEGIN/END markers)
+    re.compile(
+        r"(?i:-----BEGIN [A-Z ]+ PRIVATE KEY-----"
+        r"[\s\S]+?-----END [A-Z ]+ PRIVATE KEY-----)",
+        _FLAGS,
+    ),
     # GitHub personal access tokens: ghp_xxx or github_pat_xxx
-    re.compile(r"gh[pousr]_[A-Za-z0-9]{30,}", re.IGNORECASE),
-    re.compile(r"github_pat_[A-Za-z0-9_]{20,}", re.IGNORECASE),
+    re.compile(r"(?i:gh[pousr]_)[A-Za-z0-9]{30,}", _FLAGS),
+    re.compile(r"(?i:github_pat_)[A-Za-z0-9_]{20,}", _FLAGS),
     # OpenAI and other API keys (e.g., sk-...)
-    re.compile(r"sk-[A-Za-z0-9]{20,}", re.IGNORECASE),
+    re.compile(r"(?i:sk-)[A-Za-z0-9]{20,}", _FLAGS),
     # AWS access keys (e.g., AKIA... or ASIA... 20 chars)
-    re.compile(r"A(KIA|SIA)[A-Z0-9]{16}", re.IGNORECASE),
-    # AWS secret keys (40 base64-like chars)
-    re.compile(r"[A-Za-z0-9/+=]{40}", re.IGNORECASE),
+    re.compile(r"(?i:A(?:KIA|SIA)[A-Z0-9]{16})", _FLAGS),
     # Bearer tokens (JWT or opaque strings following 'Bearer ')
-    re.compile(r"Bearer\s+[A-Za-z0-9\-\._~\+/]+=*", re.IGNORECASE),
-    # Generic long hex/base64 strings (32+ chars)
-    re.compile(r"[A-Za-z0-9_-]{32,}", re.IGNORECASE),
-    # Private key blocks (BEGIN/END markers)
-    re.compile(r"-----BEGIN [A-Z ]+ PRIVATE KEY-----[\s\S]+?-----END [A-Z ]+ PRIVATE KEY-----", re.IGNORECASE),
+    re.compile(r"(?i:Bearer)\s+[A-Za-z0-9\-\._~\+/]+=*", _FLAGS),
+]
+
+# Lower-cased literal substrings, one of which must be present in the
+# lower-cased text for any prefixed pattern to match.  Checking them with
+# ``in`` is far cheaper than a regex scan.
+_SENTINELS = (
+    "-----begin ",
+    "ghp_",
+    "gho_",
+    "ghu_",
+    "ghs_",
+    "ghr_",
+    "github_pat_",
+    "sk-",
+    "akia",
+    "asia",
+    "bearer",
+)
+
+# Patterns without a literal prefix; these always have to be scanned for.
+_GENERIC_PATTERNS = [
+    # AWS secret keys (40 base64-like chars)
+    re.compile(r"[A-Za-z0-9/+=]{40}", _FLAGS),
+    # Generic long hex/base64 strings (32+ chars), anchored on word boundaries
+    # so the scan does not retry inside every long run of word characters
+    re.compile(r"\b[A-Za-z0-9_-]{32,}\b", _FLAGS),
 ]
 
+_TOKEN_PATTERNS = _PREFIXED_PATTERNS + _GENERIC_PATTERNS
+
+# Length of the shortest possible token match ("Bearer x"); shorter text
+# cannot contain a token and skips the pattern scan.
+_MIN_TOKEN_LEN = 8
+
+
+def _fuse(patterns: list[re.Pattern[str]]) -> re.Pattern[str]:
+    return re.compile("|".join(f"(?:{p.pattern})" for p in patterns), _FLAGS)
+
+
+# Token patterns fused into a single alternation so that the input is scanned
+# once instead of once per pattern.  Alternatives are tried in list order at
+# each position, so private key blocks come first and are replaced whole
+# rather than line by line, and every literal-prefixed format is tried before
+# the generic classes can claim the same span.  Common leading literals need
+# no hand factoring: ``re`` already hoists a prefix shared by all branches.
+# Text containing none of the sentinels is scanned with the smaller
+# generic-only alternation.
+_TOKEN_RE = _fuse(_TOKEN_PATTERNS)
+_GENERIC_RE = _fuse(_GENERIC_PATTERNS)
+
+
+def _hyperscan_db(patterns: list[re.Pattern[str]]) -> _HyperscanDatabase | None:
+    """Compile ``patterns`` into a Hyperscan database, or None if unavailable."""
+    if hyperscan is None:
+        return None
+    try:
+        db: _HyperscanDatabase = hyperscan.Database()
+        db.compile(
+            expressions=[p.pattern.encode() for p in patterns],
+            ids=list(range(len(patterns))),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(patterns),
+        )
+    except hyperscan.error:
+        return None
+    return db
+
+
+# When the optional ``hyperscan`` package is installed, each fused regex gets
+# a companion database that scans the input with a SIMD DFA.  It is used only
+# to decide whether the regex pass can be skipped, so the replacements
+# themselves (and their semantics) always come from ``re``.  Databases are
+# compiled on first use so importing this module stays cheap; the lock keeps
+# concurrent first callers from compiling the same database twice.
+_HYPERSCAN_PATTERNS: dict[re.Pattern[str], list[re.Pattern[str]]] = {
+    _TOKEN_RE: _TOKEN_PATTERNS,
+    _GENERIC_RE: _GENERIC_PATTERNS,
+}
+_HYPERSCAN_DBS: dict[re.Pattern[str], _HyperscanDatabase | None] = {}
+_HYPERSCAN_LOCK = threading.Lock()
+
+
+def _stop_scan(*_args: object) -> bool:
+    return True
+
+
+def _may_match(token_re: re.Pattern[str], text: str) -> bool:
+    """Return False only if ``token_re`` certainly has no match in ``text``."""
+    if hyperscan is None:
+        return True
+    try:
+        db = _HYPERSCAN_DBS[token_re]
+    except KeyError:
+        with _HYPERSCAN_LOCK:
+            if token_re not in _HYPERSCAN_DBS:
+                patterns = _HYPERSCAN_PATTERNS[token_re]
+                _HYPERSCAN_DBS[token_re] = _hyperscan_db(patterns)
+            db = _HYPERSCAN_DBS[token_re]
+    if db is None:
+        return True
+    try:
+        db.scan(text.encode("utf-8", "surrogatepass"), match_event_handler=_stop_scan)
+    except hyperscan.ScanTerminated:
+        return True
+    except hyperscan.error:
+        # e.g. ScratchInUseError under concurrent scans; let ``re`` decide
+        return True
+    return False
+
+
+@lru_cache(maxsize=32)
+def _secrets_re(secrets: tuple[str, ...]) -> re.Pattern[str]:
+    """Return a compiled alternation matching any of ``secrets`` literally.
+
+    Longer secrets are listed first so that a secret containing another one
+    is replaced whole.  Results are cached because callers pass the same
+    configured tokens on every invocation.
+    """
+    ordered = sorted(secrets, key=len, reverse=True)
+    return re.compile("|".join(re.escape(secret) for secret in ordered))
+
+
+def _splice(text: str, spans: list[tuple[int, int]]) -> str:
+    """Replace each span of ``text`` with the placeholder in one rebuild.
+
+    Overlapping spans (an explicit secret inside a token match, say) are
+    merged so the covering region is replaced once.
+    """
+    spans.sort()
+    parts: list[str] = []
+    last = 0
+    for start, end in spans:
+        if start < last:
+            # Overlaps the previous replacement; extend it instead.
+            last = max(last, end)
+            continue
+        parts.append(text[last:start])
+        parts.append("<REDACTED>")
+        last = end
+    parts.append(text[last:])
+    return "".join(parts)
+
 
 def redact_secrets(text: str, secrets: Iterable[str]) -> str:
     """Return ``text`` with secrets and common token patterns replaced.
@@ -41,12 +215,20 @@ def redact_secrets(text: str, secrets: Iterable[str]) -> str:
     :param secrets: iterable of secret strings to redact
     :return: redacted text
     """
-    redacted = text or ""
-    # Replace explicit secrets
-    for secret in secrets:
-        if secret:
-            redacted = redacted.replace(secret, "<REDACTED>")
-    # Replace pattern matches
-    for pattern in _TOKEN_PATTERNS:
-        redacted = pattern.sub("<REDACTED>", redacted)
-    return redacted
+    if not text:
+        return ""
+    spans: list[tuple[int, int]] = []
+    explicit = tuple(sorted({s for s in secrets if s and s in text}))
+    if explicit:
+        spans.extend(m.span() for m in _secrets_re(explicit).finditer(text))
+    if len(text) >= _MIN_TOKEN_LEN:
+        lowered = text.lower()
+        if any(sentinel in lowered for sentinel in _SENTINELS):
+            token_re = _TOKEN_RE
+        else:
+            token_re = _GENERIC_RE
+        if _may_match(token_re, text):
+            spans.extend(m.span() for m in token_re.finditer(text))
+    if not spans:
+        return text
+    return _splice(text, spans)
@@ -1,5 +1,6 @@
 """Quality assurance helpers."""
 
+from .bundle import run_qa_bundle
 from .detect import detect_project
 from .install import install_deps
 from .lint import run_format, run_lint, run_precommit
@@ -13,4 +14,5 @@ __all__ = [
     "run_typecheck",
     "run_format",
     "run_precommit",
+    "run_qa_bundle",
 ]
@@ -0,0 +1,18 @@
+"""Helpers shared by the QA runners."""
+
+from __future__ import annotations
+
+
+def _text(value: object) -> str:
+    """Return an output field of a run result as text; None counts as empty."""
+    return value if isinstance(value, str) else ""
+
+
+def ok_and_logs(resp: dict[str, object]) -> tuple[bool, str]:
+    """Return whether a ``run_command`` result succeeded, and its combined logs.
+
+    A run succeeds when it exits with status 0 without timing out.  The logs
+    are stdout followed by stderr.
+    """
+    ok = resp.get("exit_code", 1) == 0 and not resp.get("timed_out", False)
+    return ok, _text(resp.get("stdout")) + _text(resp.get("stderr"))
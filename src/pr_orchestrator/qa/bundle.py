@@ -0,0 +1,35 @@
+"""Concurrent lint, type check and format check.
+
+All operations execute INSIDE the E2B sandbox.
+"""
+
+from __future__ import annotations
+
+# Result keys, in the order WorkspaceStore.run_qa_bundle prints them
+_CHECKS = ("lint", "typecheck", "format")
+
+
+def run_qa_bundle(workspace_id: str) -> dict[str, object]:
+    """Run lint, type check and format check concurrently.
+
+    Equivalent to ``run_lint``, ``run_typecheck`` and ``run_format`` with
+    ``ruff format --check .`` in place of ``ruff format .``, but the three
+    run side by side as a single sandbox run.  Returns a
+    ``{"passed", "logs"}`` result for each of ``lint``, ``typecheck`` and
+    ``format``.
+    """
+    from ..state import WORKSPACES
+
+    resp = WORKSPACES.run_qa_bundle(workspace_id)
+
+    stdout = str(resp.get("stdout") or "")
+    sections = stdout.split("\0")
+    if resp.get("timed_out", False) or len(sections) != len(_CHECKS) + 2:
+        logs = stdout + str(resp.get("stderr") or "")
+        sections = [""] + [logs] * len(_CHECKS) + [""]
+
+    codes = sections[-1].split()
+    return {
+        name: {"passed": i < len(codes) and codes[i] == "0", "logs": sections[i + 1]}
+        for i, name in enumerate(_CHECKS)
+    }
@@ -6,15 +6,30 @@ Only Python repositories are supported in v1.
 
 from __future__ import annotations
 
-import json
+# Marker files checked in order; any requirements*.txt variants are reported
+# right after requirements.txt.  A shell loop of ``test -f`` avoids starting a
+# Python interpreter inside the sandbox; an unmatched glob stays literal and
+# fails the test.
+_PYTHON_MARKERS = (
+    "pyproject.toml",
+    "setup.py",
+    "setup.cfg",
+    "requirements.txt",
+    "requirements*.txt",
+    "requirements-dev.txt",
+    "Pipfile",
+)
+_DETECT_SCRIPT = (
+    f'for f in {" ".join(_PYTHON_MARKERS)}; do [ -f "$f" ] && echo "$f"; done; exit 0'
+)
 
 
-def detect_project(workspace_id: str) -> dict[str, str]:
+def detect_project(workspace_id: str) -> dict[str, object]:
     """Detect the project type and return default QA commands.
 
     This implementation runs detection inside the E2B sandbox by executing
-    a Python script that checks for marker files.
-    
+    a shell loop that checks for marker files.
+
     Only Python repositories are supported in v1.
     """
     from ..state import WORKSPACES
@@ -24,53 +39,18 @@ def detect_project(workspace_id: str) -> dict[str, str]:
     if ws.backend is None:
         raise RuntimeError("Workspace backend is not configured")
 
-    # Run a Python script inside the sandbox to detect project type
-    detect_script = '''
-import os
-import json
-
-result = {"type": "unknown", "markers": []}
-
-# Check for Python markers
-python_markers = [
-    "pyproject.toml",
-    "setup.py",
-    "setup.cfg",
-    "requirements.txt",
-    "requirements-dev.txt",
-    "Pipfile",
-]
-
-found_markers = []
-for marker in python_markers:
-    if os.path.isfile(marker):
-        found_markers.append(marker)
-    # Also check for requirements*.txt pattern
-    if marker == "requirements.txt":
-        for f in os.listdir("."):
-            if f.startswith("requirements") and f.endswith(".txt"):
-                if f not in found_markers:
-                    found_markers.append(f)
-
-if found_markers:
-    result["type"] = "python"
-    result["markers"] = found_markers
-
-print(json.dumps(result))
-'''
-
-    result = ws.backend.run(["python", "-c", detect_script], "repo", 30)
+    # Run a shell check inside the sandbox to detect project type
+    result = ws.backend.run(["sh", "-c", _DETECT_SCRIPT], "repo", 30)
 
     if result.get("exit_code", 1) != 0:
         raise RuntimeError(f"Project detection failed: {result.get('stderr', '')}")
 
-    try:
-        detection = json.loads(result.get("stdout", "{}"))
-    except json.JSONDecodeError:
-        detection = {"type": "unknown", "markers": []}
+    # One name per line; dict keys drop the glob's repeats, keeping order
+    lines = (result.get("stdout", "") or "").splitlines()
+    markers = list(dict.fromkeys(line for line in lines if line))
 
     # Enforce Python-only in v1
-    if detection.get("type") != "python":
+    if not markers:
         raise NotImplementedError(
             "Only Python repositories are supported in v1. "
             "No pyproject.toml, setup.py, setup.cfg, or requirements*.txt found."
@@ -83,5 +63,5 @@ print(json.dumps(result))
         "lint_command": "ruff check .",
         "typecheck_command": "mypy .",
         "format_command": "ruff format .",
-        "markers": detection.get("markers", []),
+        "markers": markers,
     }
@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import re
-
 
 def parse_failing_tests(logs: str) -> list[str]:
     """Extract failing test names from pytest output.
@@ -15,11 +13,11 @@ def parse_failing_tests(logs: str) -> list[str]:
     """
     if not logs:
         return []
-    failing: list[str] = []
-    pattern = re.compile(r"^(.*?)::(.*?)\s+FAILED", re.MULTILINE)
-    for match in pattern.finditer(logs):
-        file_part, test_name = match.groups()
-        identifier = f"{file_part}::{test_name}"
-        if identifier not in failing:
-            failing.append(identifier)
-    return failing
+    # dict keys de-duplicate in O(1) while keeping first-seen order
+    failing: dict[str, None] = {}
+    for line in logs.splitlines():
+        # pytest's shape is "path::test FAILED [...]"; plain string ops suffice
+        head, sep, _ = line.partition(" FAILED")
+        if sep and "::" in head:
+            failing[head.strip()] = None
+    return list(failing)
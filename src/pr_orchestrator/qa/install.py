@@ -5,7 +5,17 @@ Installs project dependencies by running commands INSIDE the E2B sandbox.
 
 from __future__ import annotations
 
-import json
+from ._common import ok_and_logs
+
+# Prints one token naming the installer: ``uv_lock``, ``pyproject``,
+# ``pip:<requirements file>`` or ``none``.  A plain shell test avoids
+# starting a Python interpreter inside the sandbox just to stat files.
+_DETECT_SCRIPT = (
+    "if [ -f uv.lock ]; then echo uv_lock; "
+    "elif [ -f pyproject.toml ]; then echo pyproject; "
+    'else for f in requirements*.txt; do [ -f "$f" ] && echo "pip:$f" && exit 0; done; '
+    "echo none; fi"
+)
 
 
 def install_deps(workspace_id: str) -> dict[str, object]:
@@ -29,41 +39,24 @@ def install_deps(workspace_id: str) -> dict[str, object]:
         return {"success": False, "logs": "Workspace backend is not configured"}
 
     # Detect which installer to use by checking files inside sandbox
-    detect_script = '''
-import os
-import json
-
-result = {"installer": None, "file": None}
-
-if os.path.isfile("uv.lock"):
-    result = {"installer": "uv_lock", "file": "uv.lock"}
-elif os.path.isfile("pyproject.toml"):
-    result = {"installer": "pyproject", "file": "pyproject.toml"}
-else:
-    # Find requirements file
-    for f in sorted(os.listdir(".")):
-        if f.startswith("requirements") and f.endswith(".txt"):
-            result = {"installer": "pip", "file": f}
-            break
-
-print(json.dumps(result))
-'''
-
-    detect_result = ws.backend.run(["python", "-c", detect_script], "repo", 30)
+    detect_result = ws.backend.run(["sh", "-c", _DETECT_SCRIPT], "repo", 30)
 
     if detect_result.get("exit_code", 1) != 0:
-        return {"success": False, "logs": f"Detection failed: {detect_result.get('stderr', '')}"}
-
-    try:
-        detection = json.loads(detect_result.get("stdout", "{}"))
-    except json.JSONDecodeError:
-        detection = {"installer": None}
+        return {
+            "success": False,
+            "logs": f"Detection failed: {detect_result.get('stderr', '')}",
+        }
 
-    installer = detection.get("installer")
-    dep_file = detection.get("file")
+    token = (detect_result.get("stdout", "") or "").strip()
+    installer, _, dep_file = token.partition(":")
+    if installer == "none":
+        installer = ""
 
     if not installer:
-        return {"success": True, "logs": "No dependency manifests found; skipping install."}
+        return {
+            "success": True,
+            "logs": "No dependency manifests found; skipping install.",
+        }
 
     # Determine command based on installer type
     if installer == "uv_lock":
@@ -75,10 +68,11 @@ print(json.dumps(result))
     else:
         return {"success": True, "logs": "No recognized dependency format."}
 
-    # Execute command
-    logs = ""
+    # Execute command.  Detection and install stay separate calls: the
+    # installer goes through run_command so it gets the safe-mode allowlist,
+    # the pip/uv flag checks and output redaction, none of which apply to a
+    # raw ``sh -c`` script on the backend.
     resp = ws_run_command(workspace_id, cmd, cwd="repo", mode="safe")
-    logs += resp.get("stdout", "") + resp.get("stderr", "")
-    success = resp.get("exit_code", 1) == 0 and not resp.get("timed_out", False)
+    success, logs = ok_and_logs(resp)
 
     return {"success": success, "logs": logs}
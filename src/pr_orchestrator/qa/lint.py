@@ -5,7 +5,7 @@ All operations execute INSIDE the E2B sandbox.
 
 from __future__ import annotations
 
-import json
+from ._common import ok_and_logs
 
 
 def run_lint(workspace_id: str, command: str | None = None) -> dict[str, object]:
@@ -17,8 +17,7 @@ def run_lint(workspace_id: str, command: str | None = None) -> dict[str, object]
 
     cmd = command or "ruff check ."
     resp = ws_run_command(workspace_id, cmd, cwd="repo", mode="safe")
-    logs = (resp.get("stdout", "") or "") + (resp.get("stderr", "") or "")
-    passed = resp.get("exit_code", 1) == 0 and not resp.get("timed_out", False)
+    passed, logs = ok_and_logs(resp)
     return {"passed": passed, "logs": logs}
 
 
@@ -31,8 +30,7 @@ def run_format(workspace_id: str, command: str | None = None) -> dict[str, objec
 
     cmd = command or "ruff format ."
     resp = ws_run_command(workspace_id, cmd, cwd="repo", mode="safe")
-    logs = (resp.get("stdout", "") or "") + (resp.get("stderr", "") or "")
-    ran = resp.get("exit_code", 1) == 0 and not resp.get("timed_out", False)
+    ran, logs = ok_and_logs(resp)
     return {"ran": ran, "logs": logs}
 
 
@@ -47,26 +45,18 @@ def run_precommit(workspace_id: str) -> dict[str, object]:
     ws = WORKSPACES.get(workspace_id)
 
     if ws.backend is None:
-        return {"ran": False, "passed": False, "logs": "Workspace backend is not configured"}
+        return {
+            "ran": False,
+            "passed": False,
+            "logs": "Workspace backend is not configured",
+        }
 
     # Check if pre-commit config exists inside sandbox
-    check_script = '''
-import os
-import json
-print(json.dumps({"exists": os.path.isfile(".pre-commit-config.yaml")}))
-'''
-
-    check_result = ws.backend.run(["python", "-c", check_script], "repo", 10)
-
-    try:
-        check = json.loads(check_result.get("stdout", "{}"))
-    except json.JSONDecodeError:
-        check = {"exists": False}
-
-    if not check.get("exists"):
+    if not ws.backend.file_exists("repo/.pre-commit-config.yaml"):
         return {"ran": False, "passed": True, "logs": "No pre-commit config; skipped."}
 
-    resp = ws_run_command(workspace_id, "pre-commit run --all-files", cwd="repo", mode="expert")
-    logs = (resp.get("stdout", "") or "") + (resp.get("stderr", "") or "")
-    passed = resp.get("exit_code", 1) == 0 and not resp.get("timed_out", False)
+    resp = ws_run_command(
+        workspace_id, "pre-commit run --all-files", cwd="repo", mode="expert"
+    )
+    passed, logs = ok_and_logs(resp)
     return {"ran": True, "passed": passed, "logs": logs}
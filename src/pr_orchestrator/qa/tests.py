@@ -5,6 +5,12 @@ All operations execute INSIDE the E2B sandbox.
 
 from __future__ import annotations
 
+from ._common import ok_and_logs
+
+# Pytest exit codes for runs that report no test failures: interrupted or
+# collection errors, internal error, usage error and no tests collected.
+_PYTEST_NO_FAILURE_CODES = frozenset({2, 3, 4, 5})
+
 
 def run_tests(workspace_id: str, command: str | None = None) -> dict[str, object]:
     """Run the test suite in the workspace.
@@ -18,12 +24,11 @@ def run_tests(workspace_id: str, command: str | None = None) -> dict[str, object
 
     cmd = command or "pytest -q"
     resp = ws_run_command(workspace_id, cmd, cwd="repo", mode="safe")
-    logs = (resp.get("stdout", "") or "") + (resp.get("stderr", "") or "")
+    passed, logs = ok_and_logs(resp)
     exit_code = resp.get("exit_code", 1)
-    passed = exit_code == 0 and not resp.get("timed_out", False)
 
     failing_tests: list[str] = []
-    if not passed:
+    if not passed and exit_code not in _PYTEST_NO_FAILURE_CODES:
         failing_tests = parse_failing_tests(logs)
 
     return {
@@ -43,8 +48,7 @@ def run_typecheck(workspace_id: str, command: str | None = None) -> dict[str, ob
 
     cmd = command or "mypy ."
     resp = ws_run_command(workspace_id, cmd, cwd="repo", mode="safe")
-    logs = (resp.get("stdout", "") or "") + (resp.get("stderr", "") or "")
-    passed = resp.get("exit_code", 1) == 0 and not resp.get("timed_out", False)
+    passed, logs = ok_and_logs(resp)
 
     return {
         "passed": passed,
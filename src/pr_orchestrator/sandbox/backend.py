@@ -10,14 +10,22 @@ in tests/conftest.py.
 
 from __future__ import annotations
 
+import itertools
 import os
+import shlex
 import time
 from collections.abc import Sequence
+from types import MappingProxyType
 from typing import Protocol
 
 from ..config import Config
 from ..policy.redaction import redact_secrets
 
+# Run ids only correlate log lines, so a random per-process prefix plus a
+# counter is unique enough without a getrandom syscall per command.
+_RUN_PREFIX = os.urandom(4).hex()
+_RUN_COUNTER = itertools.count()
+
 
 class WorkspaceBackend(Protocol):
     """Interface for a workspace backend.
@@ -27,17 +35,17 @@ class WorkspaceBackend(Protocol):
     include exit_code, stdout, stderr, duration_ms and timed_out fields.
     """
 
-    def run(self, argv: Sequence[str], cwd: str, timeout_s: int) -> dict[str, object]:
-        ...
+    def run(
+        self, argv: Sequence[str], cwd: str, timeout_s: int
+    ) -> dict[str, object]: ...
 
-    def read_text(self, path: str) -> str:
-        ...
+    def read_text(self, path: str) -> str: ...
 
-    def write_text(self, path: str, content: str) -> None:
-        ...
+    def write_text(self, path: str, content: str) -> None: ...
 
-    def destroy(self) -> None:
-        ...
+    def file_exists(self, path: str) -> bool: ...
+
+    def destroy(self) -> None: ...
 
 
 class E2BBackend:
@@ -45,19 +53,23 @@ class E2BBackend:
 
     This backend wraps the E2B Python SDK.  It uses ``sandbox.commands.run()``
     for command execution and ``sandbox.files.read/write()`` for file operations.
-    
+
     All git operations have proper authentication environment configured.
     """
 
     def __init__(self, sandbox: object, config: Config) -> None:
         """Initialize E2B backend.
-        
+
         Args:
             sandbox: An E2B Sandbox instance from the e2b SDK
             config: Configuration containing tokens and settings
         """
         self.sandbox = sandbox
         self.config = config
+        # Both depend only on the config, so build them once per backend.  The
+        # env is shared by every run, so expose it read-only.
+        self._env = MappingProxyType(self._prepare_env())
+        self._secrets = tuple(s for s in (config.github_token, config.e2b_api_key) if s)
 
     def _prepare_env(self) -> dict[str, str]:
         """Prepare environment variables for E2B command execution."""
@@ -83,7 +95,8 @@ class E2BBackend:
 
     def run(self, argv: Sequence[str], cwd: str, timeout_s: int) -> dict[str, object]:
         """Run a command in the E2B sandbox."""
-        import shlex
+        # shlex.quote returns safe tokens unchanged, so this only quotes
+        # arguments that need it
         command = shlex.join(argv)
 
         timed_out = False
@@ -103,12 +116,13 @@ class E2BBackend:
                 command,
                 cwd=full_cwd,
                 timeout=timeout_s,
-                envs=self._prepare_env(),
+                envs=self._env,
             )
 
-            stdout = result.stdout if hasattr(result, 'stdout') else ""
-            stderr = result.stderr if hasattr(result, 'stderr') else ""
-            exit_code = result.exit_code if hasattr(result, 'exit_code') else 0
+            # The SDK returns str output; None is treated as empty
+            stdout = getattr(result, "stdout", "") or ""
+            stderr = getattr(result, "stderr", "") or ""
+            exit_code = result.exit_code if hasattr(result, "exit_code") else 0
 
         except TimeoutError:
             timed_out = True
@@ -123,12 +137,15 @@ class E2BBackend:
         duration_ms = int((time.time_ns() - start_ns) / 1_000_000)
 
         # Redact secrets
-        secrets = [self.config.github_token, self.config.e2b_api_key]
-        stdout = redact_secrets(str(stdout), secrets)
-        stderr = redact_secrets(str(stderr), secrets)
+        # Token patterns apply even without configured secrets, so only
+        # empty output skips redaction
+        if stdout:
+            stdout = redact_secrets(stdout, self._secrets)
+        if stderr:
+            stderr = redact_secrets(stderr, self._secrets)
 
         return {
-            "run_id": os.urandom(16).hex(),
+            "run_id": f"{_RUN_PREFIX}{next(_RUN_COUNTER):024x}",
             "exit_code": exit_code,
             "stdout": stdout,
             "stderr": stderr,
@@ -152,6 +169,14 @@ class E2BBackend:
             full_path = f"/home/user/{path}"
         self.sandbox.files.write(full_path, content)
 
+    def file_exists(self, path: str) -> bool:
+        """Return True if ``path`` is a regular file in the E2B sandbox.
+
+        Runs ``test -f`` (a single stat) rather than starting an interpreter.
+        Relative paths resolve against the sandbox home, as for ``read_text``.
+        """
+        return self.run(["test", "-f", path], ".", 10)["exit_code"] == 0
+
     def destroy(self) -> None:
         """Kill the E2B sandbox."""
         try:
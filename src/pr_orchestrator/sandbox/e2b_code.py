@@ -9,11 +9,23 @@ in production.
 
 from __future__ import annotations
 
+import logging
 import os
 import time
 from dataclasses import dataclass, field
 
-from ..config import Config
+from ..config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Answers git's username/password prompts from the sandbox environment
+_ASKPASS_SCRIPT = (
+    "#!/bin/sh\n"
+    'case "$1" in\n'
+    '  *Username*) echo "x-access-token" ;;\n'
+    '  *) echo "$GITHUB_TOKEN" ;;\n'
+    "esac\n"
+)
 
 
 @dataclass
@@ -22,7 +34,7 @@ class E2BCodeWorkspace:
 
     This class uses the E2B SDK to provision a remote code sandbox.
     The E2B_API_KEY MUST be configured in the environment.
-    
+
     There is NO local fallback - E2B sandbox is required for all execution.
     """
 
@@ -37,6 +49,7 @@ class E2BCodeWorkspace:
     _sandbox: object | None = field(init=False, default=None)
 
     def __post_init__(self) -> None:
+        from . import pool as sandbox_pool
         from .backend import E2BBackend
 
         api_key = os.environ.get("E2B_API_KEY")
@@ -62,23 +75,24 @@ class E2BCodeWorkspace:
             timeout_seconds = self.ttl_minutes * 60
             e2b_template = os.environ.get("E2B_TEMPLATE")  # None = use default
 
-            # Use Sandbox.create() class method with optional template/timeout
-            self._sandbox = Sandbox.create(
-                template=e2b_template,
-                timeout=timeout_seconds,
-            )
+            # Prefer a pre-provisioned sandbox; otherwise use Sandbox.create()
+            # with optional template/timeout
+            self._sandbox = sandbox_pool.acquire(e2b_template, timeout_seconds)
+            if self._sandbox is None:
+                self._sandbox = Sandbox.create(
+                    template=e2b_template,
+                    timeout=timeout_seconds,
+                )
 
             # Create backend using E2B
-            cfg = Config.load_from_env()
-            self.backend = E2BBackend(self._sandbox, cfg)
+            self.backend = E2BBackend(self._sandbox, get_config())
 
             # Write the git-askpass script to the sandbox
             self._write_askpass_script()
 
         except ImportError as exc:
             raise RuntimeError(
-                f"E2B SDK is not installed: {exc}. "
-                "Install with: pip install e2b"
+                f"E2B SDK is not installed: {exc}. Install with: pip install e2b"
             ) from exc
         except Exception as exc:
             raise RuntimeError(
@@ -91,21 +105,20 @@ class E2BCodeWorkspace:
         if self._sandbox is None:
             return
 
-        script_contents = (
-            "#!/bin/sh\n"
-            "case \"$1\" in\n"
-            "  *Username*) echo \"x-access-token\" ;;\n"
-            "  *) echo \"$GITHUB_TOKEN\" ;;\n"
-            "esac\n"
-        )
+        from e2b import SandboxException
 
         try:
-            self._sandbox.files.write("/home/user/git-askpass.sh", script_contents)
-            # Make executable
-            self._sandbox.commands.run("chmod +x /home/user/git-askpass.sh")
-        except Exception:
-            # Non-fatal if creation fails
-            pass
+            # Write and make executable in one round trip; the quoted heredoc
+            # delimiter keeps the shell from expanding $1 and $GITHUB_TOKEN
+            self._sandbox.commands.run(
+                "cat > /home/user/git-askpass.sh <<'EOF'\n"
+                f"{_ASKPASS_SCRIPT}"
+                "EOF\n"
+                "chmod +x /home/user/git-askpass.sh"
+            )
+        except (SandboxException, OSError) as exc:
+            # Non-fatal: only authenticated git operations depend on it
+            logger.warning("Failed to write git-askpass script: %s", exc)
 
     def destroy(self) -> None:
         """Kill the E2B sandbox."""
@@ -118,7 +131,7 @@ class E2BCodeWorkspace:
 
         if self.backend is not None:
             try:
-                if hasattr(self.backend, 'destroy'):
+                if hasattr(self.backend, "destroy"):
                     self.backend.destroy()
             except Exception:
                 pass
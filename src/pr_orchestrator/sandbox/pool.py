@@ -0,0 +1,127 @@
+"""Warm pool of pre-provisioned E2B sandboxes.
+
+Provisioning a sandbox is the slowest step of workspace creation, so up to
+``E2B_SANDBOX_POOL_SIZE`` fresh sandboxes are created ahead of time in a
+background thread.  A pooled sandbox is handed to at most one workspace and
+is killed, never recycled, when that workspace is destroyed: a cleanup script
+cannot undo installed packages, caches or stray processes left by a previous
+tenant.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import queue
+import threading
+from typing import Protocol
+
+from ..constants import E2B_SANDBOX_POOL_SIZE
+
+logger = logging.getLogger(__name__)
+
+# Idle lifetime of a pooled sandbox.  The workspace TTL replaces it on acquire,
+# so an unused sandbox stops costing money shortly after the server goes idle.
+_IDLE_TIMEOUT_S = 600
+
+
+class PooledSandbox(Protocol):
+    """The part of the E2B ``Sandbox`` API the pool relies on."""
+
+    def kill(self) -> object: ...
+
+    def set_timeout(self, timeout: int) -> object: ...
+
+
+# Pooled sandboxes paired with the template they were created from.
+_POOL: queue.SimpleQueue[tuple[str | None, PooledSandbox]] = queue.SimpleQueue()
+
+# Held by the refill thread so at most one runs at a time.
+_REFILL_LOCK = threading.Lock()
+
+
+def _create(template: str | None) -> PooledSandbox:
+    from e2b import Sandbox
+
+    return Sandbox.create(template=template, timeout=_IDLE_TIMEOUT_S)
+
+
+def _kill(sandbox: PooledSandbox) -> None:
+    try:
+        sandbox.kill()
+    except Exception as exc:
+        # The sandbox times out on its own; nothing more to do than report it
+        logger.warning("Failed to kill pooled E2B sandbox: %s", exc)
+
+
+def _refill_worker(template: str | None) -> None:
+    try:
+        while _POOL.qsize() < E2B_SANDBOX_POOL_SIZE:
+            try:
+                sandbox = _create(template)
+            except Exception as exc:
+                logger.warning("Failed to pre-create E2B sandbox: %s", exc)
+                return
+            _POOL.put((template, sandbox))
+    finally:
+        _REFILL_LOCK.release()
+
+
+def refill() -> None:
+    """Top the pool up to ``E2B_SANDBOX_POOL_SIZE`` in a background thread.
+
+    Does nothing when pooling is disabled, no E2B key is configured or a
+    refill is already running.
+    """
+    if E2B_SANDBOX_POOL_SIZE <= 0 or not os.environ.get("E2B_API_KEY"):
+        return
+    if not _REFILL_LOCK.acquire(blocking=False):
+        return
+    template = os.environ.get("E2B_TEMPLATE")
+    try:
+        threading.Thread(
+            target=_refill_worker,
+            args=(template,),
+            name="e2b-sandbox-pool",
+            daemon=True,
+        ).start()
+    except Exception:
+        _REFILL_LOCK.release()
+        raise
+
+
+def acquire(template: str | None, timeout_seconds: int) -> PooledSandbox | None:
+    """Return a pooled sandbox for ``template`` with its timeout set, or None.
+
+    Pooled sandboxes from another template, or that expired while idle, are
+    killed and skipped.  A refill is started either way.
+    """
+    sandbox = None
+    while sandbox is None:
+        try:
+            pooled_template, candidate = _POOL.get_nowait()
+        except queue.Empty:
+            break
+        if pooled_template != template:
+            _kill(candidate)
+            continue
+        try:
+            candidate.set_timeout(timeout_seconds)
+        except Exception:
+            _kill(candidate)
+            continue
+        sandbox = candidate
+    refill()
+    return sandbox
+
+
+@atexit.register
+def _drain() -> None:
+    """Kill pooled sandboxes at interpreter exit."""
+    while True:
+        try:
+            _template, sandbox = _POOL.get_nowait()
+        except queue.Empty:
+            return
+        _kill(sandbox)
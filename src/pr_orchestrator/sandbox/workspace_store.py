@@ -4,10 +4,15 @@ from __future__ import annotations
 
 import logging
 import posixpath
+import re
+import shlex
+import threading
 import uuid
 from dataclasses import dataclass
+from functools import lru_cache
 
 from ..config import Config
+from ..constants import RUN_TTL_MAX_MINUTES
 from ..policy.redaction import redact_secrets
 from .e2b_code import E2BCodeWorkspace
 
@@ -15,38 +20,184 @@ logger = logging.getLogger(__name__)
 
 # Internal git subcommands allowed for repo tools
 # These bypass the run_command allowlist but are still restricted to safe git operations
-INTERNAL_GIT_SUBCMDS = {
-    "clone",
-    "remote",
-    "rev-parse",
-    "symbolic-ref",
-    "checkout",
-    "branch",
-    "fetch",
-    "log",
-    "diff",
-    "status",
-    "add",
-    "commit",
-    "show",
+INTERNAL_GIT_SUBCMDS = frozenset(
+    {
+        "clone",
+        "remote",
+        "rev-parse",
+        "symbolic-ref",
+        "checkout",
+        "branch",
+        "fetch",
+        "log",
+        "diff",
+        "status",
+        "add",
+        "commit",
+        "show",
+    }
+)
+
+# Safe-mode allowlist for git subcommands via run_command (per spec).
+# The spec allows: status, diff, checkout, branch, commit, push, log, fetch
+#
+# NOTE: 'push' is NOT in this set because run_command rejects it outright:
+# push is only allowed through the approval-gated repo_push() tool, so the
+# approval gate cannot be bypassed.
+_SAFE_GIT_SUBCMDS = frozenset(
+    {
+        "status",
+        "diff",
+        "checkout",
+        "branch",
+        "commit",
+        "log",
+        "fetch",
+    }
+)
+
+# Sequences rejected anywhere in a run_command string: shell chaining and
+# redirection metacharacters, then dangerous programs.  Matching is plain
+# substring matching (no word boundaries), in one scan of the command.
+_FORBIDDEN_SEQUENCES = (";", "&&", "||", "|", "`", "$(", ">", "<")
+_FORBIDDEN_SUBSTRINGS = ("sudo", "rm -rf", "curl", "bash", "wget", "ssh")
+_FORBIDDEN_RE = re.compile(
+    "|".join(map(re.escape, _FORBIDDEN_SEQUENCES + _FORBIDDEN_SUBSTRINGS))
+)
+# Internal git argv may legitimately contain e.g. "ssh" in remote URLs
+_FORBIDDEN_SEQUENCE_RE = re.compile("|".join(map(re.escape, _FORBIDDEN_SEQUENCES)))
+
+# pip/uv flags blocked in safe mode, alone or in ``--flag=value`` form
+_BLOCKED_FLAG_RE = re.compile(
+    r"(--index-url|--extra-index-url|-i|--trusted-host|--find-links|-f)(?:=|$)"
+)
+
+# pip/uv flags blocked even in expert mode, matched as token prefixes
+_EXPERT_BLOCKED_FLAGS = ("--trusted-host",)
+
+# Programs run_command may start, by mode
+_SAFE_COMMANDS = frozenset(
+    {
+        "git",  # git operations
+        "python",  # python commands and modules
+        "python3",
+        "pytest",  # pytest
+        "ruff",  # lint/format
+        "mypy",  # type check
+        "uv",  # uv commands
+        "pip",  # pip install
+    }
+)
+_EXPERT_COMMANDS = _SAFE_COMMANDS | {
+    "pre-commit",
+    # Additional expert tools can be added here
 }
 
+# Applies the patch at $1, then prints the changed file names and the
+# per-file added/deleted counts separated by a NUL byte
+_GIT_APPLY_SCRIPT = """
+git apply --whitespace=nowarn -- "$1" || exit
+git diff --name-only
+printf '\\0'
+git diff --numstat
+"""
+
+# Literal search under the cwd for edit_tools.search_repo: ripgrep when the
+# sandbox has it, else grep.  $1 is the match limit, $2 the query and any
+# further arguments are filename globs.  Like the original Python walk, hidden
+# directories are skipped but hidden and git-ignored files are searched;
+# binary files are skipped.  Each hit prints as ``path<NUL>line:text``.  The
+# output is capped after the search finishes, so the exit status is the
+# search's own, with "no matches" (1) reported as success.
+_SEARCH_SCRIPT = """
+n=$1; q=$2; shift 2
+out=$(mktemp) || exit
+if command -v rg >/dev/null 2>&1; then
+  for g; do set -- "$@" -g "$g"; shift; done
+  rg -F -n --null --hidden --no-ignore --no-heading --color never \\
+    -g '!.*/' -e "$q" "$@" . >"$out"
+else
+  for g; do set -- "$@" --include="$g"; shift; done
+  grep -rnIFZ --exclude-dir='.?*' -e "$q" "$@" . >"$out"
+fi
+rc=$?
+head -n "$n" "$out"
+rm -f "$out"
+[ "$rc" -eq 1 ] && exit 0
+exit "$rc"
+"""
+
+# Lint, type check and format check for qa.bundle, run side by side as one
+# run.  Only allowlisted tools are started and none of them modify the working
+# tree.  The format check skips ruff's cache so it never shares .ruff_cache
+# with the concurrent ``ruff check``.  Each check's combined output (with any
+# NUL bytes dropped) is printed preceded by a NUL byte, then the exit codes.
+_QA_BUNDLE_SCRIPT = """
+d=$(mktemp -d) || exit
+ruff check . >"$d/lint" 2>&1 & p1=$!
+mypy . >"$d/typecheck" 2>&1 & p2=$!
+ruff format --check --no-cache . >"$d/format" 2>&1 & p3=$!
+wait $p1; e1=$?
+wait $p2; e2=$?
+wait $p3; e3=$?
+for n in lint typecheck format; do printf '\\0'; tr -d '\\000' <"$d/$n"; done
+printf '\\0%s %s %s' $e1 $e2 $e3
+rm -rf "$d"
+"""
+
+# Longest command string run_command will consider
+_MAX_COMMAND_LEN = 4096
+
+# A command with no quotes or escapes, separated only by the whitespace shlex
+# recognises, tokenizes identically under str.split().
+_PLAIN_COMMAND_RE = re.compile(
+    r"[ \t\r\n]*[^\"'\\\s]+(?:[ \t\r\n]+[^\"'\\\s]+)*[ \t\r\n]*"
+)
+
+
+def _tokenize(command: str) -> list[str]:
+    """Split ``command`` like ``shlex.split``, skipping shlex for plain commands."""
+    if _PLAIN_COMMAND_RE.fullmatch(command):
+        return command.split()
+    return shlex.split(command)
+
 
 def _validate_pip_uv_command(tokens: list[str], mode: str) -> None:
     """Validate pip/uv install commands for safe mode restrictions.
-    
+
+    Raises PermissionError if command violates safe mode restrictions.
+    """
+    violation = _pip_uv_violation(tuple(tokens), mode)
+    if violation is not None:
+        raise PermissionError(violation)
+
+
+@lru_cache(maxsize=512)
+def _pip_uv_violation(tokens: tuple[str, ...], mode: str) -> str | None:
+    # The same install commands recur across runs. Cache the rejection
+    # message rather than the exception so each caller raises a fresh one.
+    try:
+        _check_pip_uv_command(tokens, mode)
+    except PermissionError as e:
+        return str(e)
+    return None
+
+
+def _check_pip_uv_command(tokens: tuple[str, ...], mode: str) -> None:
+    """Check pip/uv install commands against safe mode restrictions.
+
     In safe mode, only allow:
     - uv sync [--dev]
     - pip install -r <file>
     - pip install . / pip install -e .
     - pip install <package-name> (simple package names only)
-    
+
     Block:
     - Direct URL installs: pip install https://...
     - Custom index URLs: --index-url, --extra-index-url
     - Trusted hosts: --trusted-host
     - Git installs: git+https://... (unless expert mode)
-    
+
     Raises PermissionError if command violates safe mode restrictions.
     """
     if not tokens:
@@ -55,7 +206,9 @@ def _validate_pip_uv_command(tokens: list[str], mode: str) -> None:
     first = tokens[0]
 
     # Only check pip and uv commands
-    is_pip = first == "pip" or (first == "python" and "-m" in tokens and "pip" in tokens)
+    is_pip = first == "pip" or (
+        first in {"python", "python3"} and "-m" in tokens and "pip" in tokens
+    )
     is_uv = first == "uv"
 
     if not is_pip and not is_uv:
@@ -64,32 +217,23 @@ def _validate_pip_uv_command(tokens: list[str], mode: str) -> None:
     # In expert mode, allow more flexibility (but still block truly dangerous patterns)
     if mode == "expert":
         # Even in expert mode, block certain dangerous patterns
-        dangerous_patterns = ["--trusted-host"]
         for tok in tokens:
-            for pattern in dangerous_patterns:
+            for pattern in _EXPERT_BLOCKED_FLAGS:
                 if tok.startswith(pattern):
-                    raise PermissionError(f"'{pattern}' is not allowed even in expert mode")
+                    raise PermissionError(
+                        f"'{pattern}' is not allowed even in expert mode"
+                    )
         return
 
     # Safe mode restrictions
-    # Block dangerous flags
-    blocked_flags = [
-        "--index-url",
-        "--extra-index-url",
-        "-i",  # short for --index-url
-        "--trusted-host",
-        "--find-links",
-        "-f",  # short for --find-links
-    ]
-
     for tok in tokens:
-        # Check for blocked flags
-        for flag in blocked_flags:
-            if tok == flag or tok.startswith(f"{flag}="):
-                raise PermissionError(
-                    f"'{flag}' is not allowed in safe mode. "
-                    "Only standard PyPI installs are permitted."
-                )
+        # Block dangerous flags (--index-url, -i, --trusted-host, --find-links, ...)
+        blocked = _BLOCKED_FLAG_RE.match(tok)
+        if blocked:
+            raise PermissionError(
+                f"'{blocked.group(1)}' is not allowed in safe mode. "
+                "Only standard PyPI installs are permitted."
+            )
 
         # Block direct URL installs
         if tok.startswith("http://") or tok.startswith("https://"):
@@ -108,21 +252,28 @@ def _validate_pip_uv_command(tokens: list[str], mode: str) -> None:
 
 def normalize_repo_cwd(cwd: str | None) -> str:
     """Normalize and validate cwd to ensure it's within repo/.
-    
+
     This uses pure string operations - no host filesystem access.
-    
+
     Args:
         cwd: The working directory path (relative)
-        
+
     Returns:
         Normalized path within repo/
-        
+
     Raises:
         PermissionError: If cwd escapes repo/ or is invalid
     """
-    # Default to repo root
-    if not cwd:
-        cwd = "repo"
+    # Default to repo root; the common case needs no normalization
+    if not cwd or cwd == "repo" or cwd == ".":
+        return "repo"
+    return _normalize_repo_subpath(cwd)
+
+
+@lru_cache(maxsize=256)
+def _normalize_repo_subpath(cwd: str) -> str:
+    # Pure function of cwd, and a run only touches a handful of directories.
+    # Rejections raise and are therefore never cached.
 
     # Reject absolute paths
     if cwd.startswith("/") or cwd.startswith("~"):
@@ -146,7 +297,7 @@ def normalize_repo_cwd(cwd: str | None) -> str:
     return norm
 
 
-@dataclass
+@dataclass(slots=True)
 class Workspace:
     """Represent an active workspace.
 
@@ -168,9 +319,11 @@ class WorkspaceStore:
 
     def __init__(self, config: Config) -> None:
         self.config = config
+        # Secrets redacted from every command's output; fixed for the config
+        self._secrets = tuple(s for s in (config.github_token, config.e2b_api_key) if s)
         self._store: dict[str, Workspace] = {}
         # Single run lock (v1 requirement - one run at a time)
-        self._run_active: bool = False
+        self._run_lock = threading.Lock()
 
     def create(self, mode: str = "code", ttl_minutes: int = 60) -> Workspace:
         """Create a new workspace and register it.
@@ -183,7 +336,6 @@ class WorkspaceStore:
         The TTL is clamped to the maximum allowed value from configuration.
         """
         # Clamp TTL to within [1, RUN_TTL_MAX_MINUTES]
-        from ..constants import RUN_TTL_MAX_MINUTES
         ttl_minutes = max(1, min(ttl_minutes, RUN_TTL_MAX_MINUTES))
 
         # Instantiate the appropriate workspace implementation
@@ -192,6 +344,7 @@ class WorkspaceStore:
         elif mode == "desktop":
             # Desktop workspaces are not supported in v1
             from .e2b_desktop import E2BDesktopWorkspace
+
             impl = E2BDesktopWorkspace(ttl_minutes=ttl_minutes)
         else:
             raise NotImplementedError(f"Unsupported workspace mode: {mode}")
@@ -202,37 +355,15 @@ class WorkspaceStore:
         # Attach the backend from the workspace implementation
         try:
             workspace.backend = impl.backend
-        except Exception:
+        except AttributeError:
             workspace.backend = None
 
         self._store[ws_id] = workspace
 
-        # Write git-askpass script to sandbox via backend
-        self._write_askpass_script(workspace)
-
+        # The git-askpass script is installed by the workspace implementation
+        # (see E2BCodeWorkspace._write_askpass_script)
         return workspace
 
-    def _write_askpass_script(self, workspace: Workspace) -> None:
-        """Write git-askpass script to the sandbox via backend."""
-        if workspace.backend is None:
-            return
-
-        script_contents = (
-            "#!/bin/sh\n"
-            "case \"$1\" in\n"
-            "  *Username*) echo \"x-access-token\" ;;\n"
-            "  *) echo \"$GITHUB_TOKEN\" ;;\n"
-            "esac\n"
-        )
-
-        try:
-            workspace.backend.write_text("git-askpass.sh", script_contents)
-            # Make executable via command
-            workspace.backend.run(["chmod", "+x", "git-askpass.sh"], ".", 10)
-        except Exception:
-            # Non-fatal if creation fails
-            pass
-
     def destroy(self, workspace_id: str) -> bool:
         """Destroy a workspace by ID."""
         ws = self._store.pop(workspace_id, None)
@@ -260,6 +391,23 @@ class WorkspaceStore:
             )
         return ws
 
+    def _finalize_result(self, result: dict[str, object]) -> dict[str, object]:
+        """Build the public result of a backend run, with secrets redacted."""
+        # Many git commands print nothing; skip redaction for empty output
+        stdout = result.get("stdout") or ""
+        stderr = result.get("stderr") or ""
+        # Backends report ints; anything else counts as a failed, untimed run
+        exit_code = result.get("exit_code", 1)
+        duration_ms = result.get("duration_ms", 0)
+        return {
+            "run_id": uuid.uuid4().hex,
+            "exit_code": exit_code if isinstance(exit_code, int) else 1,
+            "stdout": redact_secrets(str(stdout), self._secrets) if stdout else "",
+            "stderr": redact_secrets(str(stderr), self._secrets) if stderr else "",
+            "duration_ms": duration_ms if isinstance(duration_ms, int) else 0,
+            "timed_out": bool(result.get("timed_out", False)),
+        }
+
     def run_command(
         self,
         workspace_id: str,
@@ -278,54 +426,50 @@ class WorkspaceStore:
         directory must be within the ``repo`` directory.  Concurrency is
         limited to one active run at a time.
         """
-        import shlex
-
         workspace = self.get(workspace_id)
 
         # Validate mode
         if mode not in {"safe", "expert"}:
             raise ValueError("mode must be 'safe' or 'expert'")
 
-        # Build allowlists
-        safe_prefixes = (
-            "git",  # git operations
-            "python",  # python commands and modules
-            "pytest",  # pytest
-            "ruff",  # lint/format
-            "mypy",  # type check
-            "uv",  # uv commands
-            "pip",  # pip install
-        )
-        expert_prefixes = safe_prefixes + (
-            "pre-commit",
-            # Additional expert tools can be added here
-        )
-        prefixes = safe_prefixes if mode == "safe" else expert_prefixes
+        allowed = _SAFE_COMMANDS if mode == "safe" else _EXPERT_COMMANDS
+
+        # Cheap rejects before tokenizing: every allowlisted program starts
+        # with a letter, and overlong input is never a legitimate command
+        stripped = command.strip()
+        if not stripped:
+            raise PermissionError("Empty command is not allowed")
+        if len(stripped) > _MAX_COMMAND_LEN:
+            raise PermissionError(f"Command exceeds {_MAX_COMMAND_LEN} characters")
+        if not stripped[0].isalpha():
+            raise PermissionError(f"Command '{command}' is not allowed in {mode} mode")
 
         # Parse the command into tokens
         try:
-            tokens = shlex.split(command)
+            tokens = _tokenize(command)
         except ValueError as exc:
-            raise PermissionError(f"Failed to parse command '{command}': {exc}") from exc
+            raise PermissionError(
+                f"Failed to parse command '{command}': {exc}"
+            ) from exc
 
         if not tokens:
             raise PermissionError("Empty command is not allowed")
 
         first = tokens[0]
-        if not any(first.startswith(prefix) for prefix in prefixes):
+        # Exact match: a prefix test would also admit e.g. "pythonx" or "pip3",
+        # which the pip/uv validation below does not recognise
+        if first not in allowed:
             raise PermissionError(f"Command '{command}' is not allowed in {mode} mode")
 
-        # Reject metacharacters that could lead to injection
-        forbidden_chars = [";", "&&", "||", "|", "`", "$(", ">", "<"]
-        for frag in forbidden_chars:
-            if frag in command:
-                raise PermissionError(f"Command '{command}' contains forbidden sequence '{frag}'")
-
-        # Additional forbidden substrings
-        forbidden_substrings = ["sudo", "rm -rf", "curl", "bash", "wget", "ssh"]
-        for forbidden in forbidden_substrings:
-            if forbidden in command:
-                raise PermissionError(f"Command '{command}' contains forbidden substring '{forbidden}'")
+        # Reject metacharacters that could lead to injection, and dangerous
+        # programs, in a single scan
+        forbidden = _FORBIDDEN_RE.search(command)
+        if forbidden:
+            frag = forbidden.group(0)
+            kind = "sequence" if frag in _FORBIDDEN_SEQUENCES else "substring"
+            raise PermissionError(
+                f"Command '{command}' contains forbidden {kind} '{frag}'"
+            )
 
         # Validate pip/uv commands for safe mode restrictions
         _validate_pip_uv_command(tokens, mode)
@@ -337,64 +481,49 @@ class WorkspaceStore:
 
             # Disallow dangerous subcommands regardless of mode
             if subcmd_lower == "push":
-                raise PermissionError("Direct 'git push' is not permitted; use repo_push tool with approval")
+                raise PermissionError(
+                    "Direct 'git push' is not permitted; "
+                    "use repo_push tool with approval"
+                )
             if subcmd_lower == "apply":
-                raise PermissionError("Direct 'git apply' is not permitted; use apply_patch tool")
+                raise PermissionError(
+                    "Direct 'git apply' is not permitted; use apply_patch tool"
+                )
             if subcmd_lower == "clone":
-                raise PermissionError("Direct 'git clone' is not permitted; use repo_clone tool")
+                raise PermissionError(
+                    "Direct 'git clone' is not permitted; use repo_clone tool"
+                )
             if subcmd_lower == "remote" and len(tokens) >= 3:
                 if tokens[2].lower() in {"set-url"}:
-                    raise PermissionError("Changing remote URLs is not permitted via run_command")
+                    raise PermissionError(
+                        "Changing remote URLs is not permitted via run_command"
+                    )
             if subcmd_lower in {"config", "reset", "clean"}:
-                raise PermissionError(f"git {subcmd_lower} is not permitted via run_command")
-
-            # Safe-mode allowlist for git subcommands via run_command (per spec).
-            # The spec allows: status, diff, checkout, branch, commit, push, log, fetch
-            #
-            # NOTE: 'push' is NOT in this set because it's handled specially above:
-            # - Direct 'git push' via run_command is BLOCKED (line ~339)
-            # - Push is only allowed through the approval-gated repo_push() tool
-            # This ensures the approval gate cannot be bypassed.
-            allowed_git_safe_run_command = {
-                "status",
-                "diff",
-                "checkout",
-                "branch",
-                "commit",
-                "log",
-                "fetch",
-            }
-            if mode == "safe" and subcmd_lower not in allowed_git_safe_run_command:
+                raise PermissionError(
+                    f"git {subcmd_lower} is not permitted via run_command"
+                )
+
+            if mode == "safe" and subcmd_lower not in _SAFE_GIT_SUBCMDS:
                 raise PermissionError(f"git {subcmd_lower} is not allowed in safe mode")
 
         # Validate and normalize cwd (pure string validation, no host filesystem)
         norm_cwd = normalize_repo_cwd(cwd)
 
         # Enforce single active run
-        if self._run_active:
-            raise RuntimeError("Another command is currently running; only one run is allowed at a time")
-        self._run_active = True
+        if not self._run_lock.acquire(blocking=False):
+            raise RuntimeError(
+                "Another command is currently running; "
+                "only one run is allowed at a time"
+            )
 
         try:
-            if getattr(workspace, "backend", None) is None:
+            if workspace.backend is None:
                 raise RuntimeError("Workspace backend is not configured")
             result = workspace.backend.run(tokens, norm_cwd, timeout_s)
         finally:
-            self._run_active = False
+            self._run_lock.release()
 
-        # Redact secrets from output
-        secrets = [self.config.github_token, self.config.e2b_api_key]
-        stdout = redact_secrets(str(result.get("stdout", "")), secrets)
-        stderr = redact_secrets(str(result.get("stderr", "")), secrets)
-
-        return {
-            "run_id": str(uuid.uuid4()),
-            "exit_code": int(result.get("exit_code", 1)),
-            "stdout": stdout,
-            "stderr": stderr,
-            "duration_ms": int(result.get("duration_ms", 0)),
-            "timed_out": bool(result.get("timed_out", False)),
-        }
+        return self._finalize_result(result)
 
     def run_internal_git(
         self,
@@ -421,21 +550,26 @@ class WorkspaceStore:
 
         # Validate argv structure
         if not argv or len(argv) < 2:
-            raise PermissionError("Internal git commands require at least 'git <subcommand>'")
+            raise PermissionError(
+                "Internal git commands require at least 'git <subcommand>'"
+            )
 
         if argv[0] != "git":
             raise PermissionError("Internal git runner only accepts git commands")
 
         subcmd = argv[1].lower()
         if subcmd not in INTERNAL_GIT_SUBCMDS:
-            raise PermissionError(f"git {subcmd} is not allowed via internal git runner")
+            raise PermissionError(
+                f"git {subcmd} is not allowed via internal git runner"
+            )
 
         # Check for forbidden patterns in arguments
-        forbidden_chars = [";", "&&", "||", "|", "`", "$(", ">", "<"]
-        for arg in argv:
-            for frag in forbidden_chars:
-                if frag in arg:
-                    raise PermissionError(f"Argument contains forbidden sequence '{frag}'")
+        # NUL never occurs in argv, so no sequence can match across arguments
+        forbidden = _FORBIDDEN_SEQUENCE_RE.search("\x00".join(argv))
+        if forbidden:
+            raise PermissionError(
+                f"Argument contains forbidden sequence '{forbidden.group()}'"
+            )
 
         # Normalize cwd - allow workspace root for initial clone, otherwise repo/
         if cwd is None or cwd == "" or cwd == ".":
@@ -449,24 +583,96 @@ class WorkspaceStore:
             norm_cwd = normalize_repo_cwd(cwd)
 
         # Execute via backend
-        if getattr(workspace, "backend", None) is None:
+        if workspace.backend is None:
             raise RuntimeError("Workspace backend is not configured")
 
         result = workspace.backend.run(argv, norm_cwd, timeout_s)
 
-        # Redact secrets
-        secrets = [self.config.github_token, self.config.e2b_api_key]
-        stdout = redact_secrets(str(result.get("stdout", "")), secrets)
-        stderr = redact_secrets(str(result.get("stderr", "")), secrets)
+        return self._finalize_result(result)
 
-        return {
-            "run_id": str(uuid.uuid4()),
-            "exit_code": int(result.get("exit_code", 1)),
-            "stdout": stdout,
-            "stderr": stderr,
-            "duration_ms": int(result.get("duration_ms", 0)),
-            "timed_out": bool(result.get("timed_out", False)),
-        }
+    def run_internal_git_script(
+        self,
+        workspace_id: str,
+        script: str,
+        args: list[str],
+        *,
+        timeout_s: int = 600,
+    ) -> dict[str, object]:
+        """Run a fixed multi-step git script for repo tools in one round-trip.
+
+        ``script`` must be a trusted constant; user-controlled values are only
+        ever passed through ``args`` as positional parameters (``$1``, ``$2``,
+        ...), so they are never interpreted by the shell.  The same
+        forbidden-sequence check as :meth:`run_internal_git` is applied to
+        ``args`` and the script runs from the workspace root.
+        """
+        forbidden = _FORBIDDEN_SEQUENCE_RE.search("\x00".join(args))
+        if forbidden:
+            raise PermissionError(
+                f"Argument contains forbidden sequence '{forbidden.group()}'"
+            )
+
+        return self._run_script(workspace_id, script, args, ".", timeout_s)
+
+    def _run_script(
+        self,
+        workspace_id: str,
+        script: str,
+        args: list[str],
+        cwd: str,
+        timeout_s: int,
+    ) -> dict[str, object]:
+        """Run a trusted constant ``sh`` script as a single active run.
+
+        ``args`` become the positional parameters, so they are never parsed
+        by the shell.  Like :meth:`run_command`, the run holds the
+        single-run lock and its stdout and stderr are redacted.
+        """
+        workspace = self.get(workspace_id)
+
+        if workspace.backend is None:
+            raise RuntimeError("Workspace backend is not configured")
+
+        if not self._run_lock.acquire(blocking=False):
+            raise RuntimeError(
+                "Another command is currently running; "
+                "only one run is allowed at a time"
+            )
+
+        try:
+            result = workspace.backend.run(
+                ["sh", "-c", script, "sh", *args], cwd, timeout_s
+            )
+        finally:
+            self._run_lock.release()
+
+        return self._finalize_result(result)
+
+    def run_search(
+        self,
+        workspace_id: str,
+        query: str,
+        globs: list[str],
+        max_matches: int,
+        timeout_s: int = 30,
+    ) -> dict[str, object]:
+        """Search files under repo/ for the literal ``query`` as one run.
+
+        ``globs`` restrict the file names searched.  stdout holds at most
+        ``max_matches`` hits, one ``path<NUL>line:text`` per line.
+        """
+        args = [str(max_matches), query, *globs]
+        return self._run_script(workspace_id, _SEARCH_SCRIPT, args, "repo", timeout_s)
+
+    def run_qa_bundle(
+        self, workspace_id: str, timeout_s: int = 600
+    ) -> dict[str, object]:
+        """Run lint, type check and format check concurrently as one run.
+
+        stdout holds the lint, type check and format check output, then the
+        three exit codes, each section preceded by a NUL byte.
+        """
+        return self._run_script(workspace_id, _QA_BUNDLE_SCRIPT, [], "repo", timeout_s)
 
     def run_git_push(
         self,
@@ -483,21 +689,12 @@ class WorkspaceStore:
         workspace = self.get(workspace_id)
         argv = ["git", "push", remote, refspec]
 
-        if getattr(workspace, "backend", None) is None:
+        if workspace.backend is None:
             raise RuntimeError("Workspace backend is not configured")
 
         result = workspace.backend.run(argv, "repo", timeout_s)
 
-        # Redact secrets
-        secrets = [self.config.github_token, self.config.e2b_api_key]
-        return {
-            "run_id": str(uuid.uuid4()),
-            "exit_code": int(result.get("exit_code", 1)),
-            "stdout": redact_secrets(str(result.get("stdout", "")), secrets),
-            "stderr": redact_secrets(str(result.get("stderr", "")), secrets),
-            "duration_ms": int(result.get("duration_ms", 0)),
-            "timed_out": bool(result.get("timed_out", False)),
-        }
+        return self._finalize_result(result)
 
     def run_git_apply(
         self,
@@ -508,21 +705,9 @@ class WorkspaceStore:
         """Apply a patch file using git apply.
 
         The patch_path should be relative to repo/ (e.g., ".pr_orchestrator/tmp.patch").
+        On success stdout holds the changed file names and ``git diff
+        --numstat``, separated by a NUL byte.
         """
-        workspace = self.get(workspace_id)
-        argv = ["git", "apply", "--whitespace=nowarn", patch_path]
-
-        if getattr(workspace, "backend", None) is None:
-            raise RuntimeError("Workspace backend is not configured")
-
-        result = workspace.backend.run(argv, "repo", timeout_s)
-
-        secrets = [self.config.github_token, self.config.e2b_api_key]
-        return {
-            "run_id": str(uuid.uuid4()),
-            "exit_code": int(result.get("exit_code", 1)),
-            "stdout": redact_secrets(str(result.get("stdout", "")), secrets),
-            "stderr": redact_secrets(str(result.get("stderr", "")), secrets),
-            "duration_ms": int(result.get("duration_ms", 0)),
-            "timed_out": bool(result.get("timed_out", False)),
-        }
+        return self._run_script(
+            workspace_id, _GIT_APPLY_SCRIPT, [patch_path], "repo", timeout_s
+        )
@@ -12,18 +12,12 @@ from __future__ import annotations
 import logging
 import sys
 from collections.abc import Callable
+from functools import cache
 from typing import Any
 
 from .constants import DEFAULT_LOG_LEVEL
-from .tools import (
-    approval_tools,
-    artifact_tools,
-    edit_tools,
-    github_tools,
-    qa_tools,
-    repo_tools,
-    workspace_tools,
-)
+from .sandbox import pool as sandbox_pool
+from .telemetry import configure_logging
 
 # Import MCP SDK - required, no fallback
 try:
@@ -33,17 +27,29 @@ except ImportError as exc:
         "ERROR: MCP SDK is required but not installed.\n"
         "Install with: pip install mcp\n"
         f"Import error: {exc}",
-        file=sys.stderr
+        file=sys.stderr,
     )
     sys.exit(1)
 
 
+@cache
 def build_tools_dispatch() -> dict[str, Callable[..., dict[str, Any]]]:
     """Return a mapping from tool names to callables.
 
     Each callable accepts keyword arguments as specified in docs/tool-spec.md and
-    returns a JSON-serializable dictionary.
+    returns a JSON-serializable dictionary.  The tool modules are imported and
+    the mapping built on first call; later calls return the same dict.
     """
+    from .tools import (
+        approval_tools,
+        artifact_tools,
+        edit_tools,
+        github_tools,
+        qa_tools,
+        repo_tools,
+        workspace_tools,
+    )
+
     return {
         # Workspace
         "workspace_create": workspace_tools.workspace_create,
@@ -51,6 +57,7 @@ def build_tools_dispatch() -> dict[str, Callable[..., dict[str, Any]]]:
         "run_command": workspace_tools.run_command,
         # Repo / Git
         "ensure_fork": repo_tools.ensure_fork,
+        "ensure_forks": repo_tools.ensure_forks,
         "repo_clone": repo_tools.repo_clone,
         "repo_setup_remotes": repo_tools.repo_setup_remotes,
         "repo_add_remote": repo_tools.repo_add_remote,
@@ -76,6 +83,7 @@ def build_tools_dispatch() -> dict[str, Callable[..., dict[str, Any]]]:
         "run_typecheck": qa_tools.run_typecheck,
         "run_format": qa_tools.run_format,
         "run_precommit": qa_tools.run_precommit,
+        "run_qa_bundle": qa_tools.run_qa_bundle,
         # GitHub
         "github_ensure_fork": github_tools.github_ensure_fork,
         "github_get_issue": github_tools.github_get_issue,
@@ -90,18 +98,17 @@ def build_tools_dispatch() -> dict[str, Callable[..., dict[str, Any]]]:
 
 def main() -> None:
     """Entrypoint for the PR Orchestrator MCP server.
-    
+
     This starts an MCP stdio server. The MCP SDK is required.
     """
     # Configure logging to stderr (stdout is used for MCP protocol)
-    logging.basicConfig(
-        level=getattr(logging, DEFAULT_LOG_LEVEL, logging.INFO),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        stream=sys.stderr,
-    )
+    configure_logging(DEFAULT_LOG_LEVEL)
     logger = logging.getLogger(__name__)
     logger.info("Starting PR Orchestrator MCP server")
 
+    # Start provisioning pooled sandboxes (no-op unless E2B_SANDBOX_POOL_SIZE > 0)
+    sandbox_pool.refill()
+
     # Create MCP server
     mcp = FastMCP("pr-orchestrator-mcp")
 
@@ -112,6 +119,14 @@ def main() -> None:
 
     logger.info("Registered %d tools", len(dispatch))
 
+    # Serve artifact bundles as binary resources, so clients need not rely
+    # on the base64 copy returned by bundle_artifacts
+    from .tools import artifact_tools
+
+    mcp.resource(
+        artifact_tools.ARTIFACT_RESOURCE_TEMPLATE, mime_type="application/zip"
+    )(artifact_tools.read_artifact)
+
     # Run the MCP server over stdio (blocking)
     # This call handles the MCP protocol and keeps server alive
     mcp.run(transport="stdio")
@@ -10,12 +10,12 @@ instead of creating their own instances.
 
 from __future__ import annotations
 
-from .config import Config
+from .config import Config, get_config
 from .sandbox.workspace_store import WorkspaceStore
 from .telemetry.run_store import RunStore
 
 # Single shared configuration loaded once at import time
-CONFIG: Config = Config.load_from_env()
+CONFIG: Config = get_config()
 
 # Single shared workspace store - all workspace operations go through this
 WORKSPACES: WorkspaceStore = WorkspaceStore(CONFIG)
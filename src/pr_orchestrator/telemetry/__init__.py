@@ -1,6 +1,6 @@
 """Telemetry and logging utilities."""
 
-from .logger import get_logger
+from .logger import configure_logging, get_logger
 from .run_store import RunStore
 
-__all__ = ["get_logger", "RunStore"]
+__all__ = ["configure_logging", "get_logger", "RunStore"]
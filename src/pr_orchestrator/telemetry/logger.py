@@ -1,15 +1,59 @@
 """Logging wrapper for PR Orchestrator MCP."""
 
 import logging
+import logging.config
+import threading
+
+from ..constants import DEFAULT_LOG_LEVEL
+
+_configured = False
+_configure_lock = threading.Lock()
+
+
+def configure_logging(level: str = DEFAULT_LOG_LEVEL) -> None:
+    """Send log records to stderr with the package format, once per process.
+
+    stdout carries the MCP protocol, so the root logger gets a single stderr
+    handler.  Like ``logging.basicConfig`` this does nothing if the root
+    logger already has handlers (an embedding application or the test
+    runner configured logging first), and later calls are no-ops.
+    """
+    global _configured
+    with _configure_lock:
+        if _configured:
+            return
+        _configured = True
+        if logging.getLogger().handlers:
+            return
+        logging.config.dictConfig(
+            {
+                "version": 1,
+                "disable_existing_loggers": False,
+                "formatters": {
+                    "default": {
+                        "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+                    }
+                },
+                "handlers": {
+                    "stderr": {
+                        "class": "logging.StreamHandler",
+                        "formatter": "default",
+                        "stream": "ext://sys.stderr",
+                    }
+                },
+                "root": {
+                    "level": getattr(logging, level.upper(), logging.INFO),
+                    "handlers": ["stderr"],
+                },
+            }
+        )
 
 
 def get_logger(name: str) -> logging.Logger:
-    """Return a configured logger with a default format."""
-    logger = logging.getLogger(name)
-    if not logger.handlers:
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        logger.setLevel(logging.INFO)
-    return logger
+    """Return the logger for ``name``, configuring logging on first use.
+
+    No per-logger handler is attached: records propagate to the single root
+    handler installed by :func:`configure_logging`.
+    """
+    configure_logging()
+    return logging.getLogger(name)
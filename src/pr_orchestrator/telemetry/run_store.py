@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
 
+# Oldest runs are evicted beyond this many, bounding memory for long sessions
+_MAX_RUNS = 10_000
 
-@dataclass
+
+@dataclass(slots=True)
 class RunEntry:
     """Record representing a single run."""
 
@@ -15,13 +19,25 @@ class RunEntry:
 
 
 class RunStore:
-    """Simple in‑memory store for runs.  Not persisted between server restarts."""
-
-    def __init__(self) -> None:
-        self._runs: dict[str, RunEntry] = {}
-
-    def add(self, run_id: str, workspace_id: str, metadata: dict[str, object] | None = None) -> None:
-        self._runs[run_id] = RunEntry(run_id=run_id, workspace_id=workspace_id, metadata=metadata or {})
+    """Simple in‑memory store for runs.  Not persisted between server restarts.
+
+    Holds at most ``max_runs`` entries; adding beyond that evicts the run
+    added least recently.
+    """
+
+    def __init__(self, max_runs: int = _MAX_RUNS) -> None:
+        self._runs: OrderedDict[str, RunEntry] = OrderedDict()
+        self._max_runs = max_runs
+
+    def add(
+        self, run_id: str, workspace_id: str, metadata: dict[str, object] | None = None
+    ) -> None:
+        self._runs[run_id] = RunEntry(
+            run_id=run_id, workspace_id=workspace_id, metadata=metadata or {}
+        )
+        self._runs.move_to_end(run_id)
+        if len(self._runs) > self._max_runs:
+            self._runs.popitem(last=False)
 
     def get(self, run_id: str) -> RunEntry | None:
         return self._runs.get(run_id)
@@ -10,17 +10,10 @@ Usage:
     workspace_tools.workspace_create(...)
 
 The server imports these modules and dispatches requests accordingly.
+Submodules are loaded lazily, on first attribute access or import.
 """
 
-from . import (
-    approval_tools,  # noqa: F401
-    artifact_tools,  # noqa: F401
-    edit_tools,  # noqa: F401
-    github_tools,  # noqa: F401
-    qa_tools,  # noqa: F401
-    repo_tools,  # noqa: F401
-    workspace_tools,  # noqa: F401
-)
+import importlib
 
 __all__ = [
     "workspace_tools",
@@ -31,3 +24,13 @@ __all__ = [
     "approval_tools",
     "artifact_tools",
 ]
+
+
+def __getattr__(name: str) -> object:
+    # Submodules are imported on first access (PEP 562) so that importing the
+    # package does not load every tool group and its dependencies.
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
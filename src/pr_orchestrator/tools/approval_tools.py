@@ -7,16 +7,60 @@ the ``approved`` flag.
 
 from __future__ import annotations
 
-import uuid
-from datetime import datetime
+import heapq
+import secrets
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
 from typing import Any
 
-# In-memory store of approval records.  Each approved request yields a unique
-# UUID which must be supplied to any subsequent tool that performs an
-# irreversible action (e.g. pushing commits or opening a PR).  Approvals are
+
+@dataclass(slots=True)
+class ApprovalRecord:
+    """An approval and which of its irreversible actions have been used."""
+
+    checks: dict[str, object]
+    summary: str
+    unified_diff: str
+    branch_plan: dict[str, object]
+    pr_draft: bool
+    pr_title: str
+    pr_body: str
+    issue_url: str | None
+    notes: str
+    created_at_ns: int
+    approved: bool = True
+    allowed_push: bool = True
+    allowed_open_pr: bool = True
+    used_push: bool = False
+    used_open_pr: bool = False
+    # Allowed actions not yet used; the record is dropped when this hits 0
+    remaining: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.remaining = self.allowed_push + self.allowed_open_pr
+
+
+# In-memory store of approval records.  Each approved request yields a unique,
+# unguessable token which must be supplied to any subsequent tool that performs
+# an irreversible action (e.g. pushing commits or opening a PR).  Approvals are
 # multi-use: they can be used for both "push" and "open_pr" actions, but each
 # action can only be performed once per approval.
-_PENDING_APPROVALS: dict[str, dict[str, Any]] = {}
+_PENDING_APPROVALS: dict[str, ApprovalRecord] = {}
+
+# Approvals not fully consumed within this many seconds are discarded, so
+# abandoned approvals do not accumulate.  _EXPIRY is a min-heap of
+# (monotonic expiry time, approval_id); ids already consumed are skipped.
+_APPROVAL_TTL_S = 3600
+_EXPIRY: list[tuple[float, str]] = []
+
+
+def _evict_expired() -> None:
+    """Drop approvals whose TTL has elapsed."""
+    now = time.monotonic()
+    while _EXPIRY and _EXPIRY[0][0] <= now:
+        _, approval_id = heapq.heappop(_EXPIRY)
+        _PENDING_APPROVALS.pop(approval_id, None)
 
 
 def request_approval(
@@ -39,34 +83,34 @@ def request_approval(
     identifier is generated and stored.  This identifier must be provided to
     tools that perform side effects (e.g., pushing commits or opening
     pull requests).
-    
+
     The approval ID is multi-use: it can be consumed for both "push" and
     "open_pr" actions, but each action can only be performed once per approval.
-    The approval record is only deleted when all allowed actions have been used.
+    The approval record is only deleted when all allowed actions have been used,
+    or when it expires an hour after being granted.
     """
     if summary is None or unified_diff is None or checks is None or branch_plan is None:
         raise ValueError("summary, unified_diff, checks and branch_plan are required")
     if not approved:
         return {"approved": False, "notes": notes or ""}
 
-    approval_id = str(uuid.uuid4())
+    _evict_expired()
+    approval_id = secrets.token_urlsafe(16)
+    heapq.heappush(_EXPIRY, (time.monotonic() + _APPROVAL_TTL_S, approval_id))
 
     # B3: Store structured approval record that allows both push and open_pr
-    _PENDING_APPROVALS[approval_id] = {
-        "approved": True,
-        "allowed_actions": {"push": True, "open_pr": True},
-        "used": {"push": False, "open_pr": False},
-        "checks": checks,
-        "summary": summary,
-        "unified_diff": unified_diff,
-        "branch_plan": branch_plan,
-        "pr_draft": pr_draft,
-        "pr_title": pr_title,
-        "pr_body": pr_body,
-        "issue_url": issue_url,
-        "notes": notes,
-        "created_at": datetime.utcnow().isoformat(),
-    }
+    _PENDING_APPROVALS[approval_id] = ApprovalRecord(
+        checks=checks,
+        summary=summary,
+        unified_diff=unified_diff,
+        branch_plan=branch_plan,
+        pr_draft=pr_draft,
+        pr_title=pr_title,
+        pr_body=pr_body,
+        issue_url=issue_url,
+        notes=notes,
+        created_at_ns=time.time_ns(),
+    )
 
     return {"approved": True, "approval_id": approval_id, "notes": notes or ""}
 
@@ -78,37 +122,30 @@ def consume_approval(approval_id: str, action: str = "push") -> bool:
     action has not already been used.  The action is marked as used, and
     the approval record is deleted only when all allowed actions have been
     consumed.
-    
+
     This helper is used by irreversible actions (push/PR) to validate
     approvals.  Valid actions are "push" and "open_pr".
     """
-    if action not in {"push", "open_pr"}:
-        return False
-
+    _evict_expired()
     record = _PENDING_APPROVALS.get(approval_id)
-    if record is None:
+    if record is None or not record.approved:
         return False
 
-    # Check if approved
-    if not record.get("approved", False):
+    # Check the action is allowed and not yet used, then mark it used
+    if action == "push":
+        if not record.allowed_push or record.used_push:
+            return False
+        record.used_push = True
+    elif action == "open_pr":
+        if not record.allowed_open_pr or record.used_open_pr:
+            return False
+        record.used_open_pr = True
+    else:
         return False
 
-    # Check if action is allowed
-    allowed_actions = record.get("allowed_actions", {})
-    if not allowed_actions.get(action, False):
-        return False
-
-    # Check if action has already been used
-    used = record.get("used", {})
-    if used.get(action, False):
-        return False
-
-    # Mark action as used
-    record["used"][action] = True
-
     # Check if all actions have been used - if so, clean up the record
-    all_used = all(record["used"].get(a, False) for a in record["allowed_actions"] if record["allowed_actions"].get(a))
-    if all_used:
+    record.remaining -= 1
+    if record.remaining == 0:
         del _PENDING_APPROVALS[approval_id]
 
     return True
@@ -116,8 +153,17 @@ def consume_approval(approval_id: str, action: str = "push") -> bool:
 
 def get_approval_record(approval_id: str) -> dict[str, Any] | None:
     """Retrieve an approval record without consuming it.
-    
+
     This is useful for inspecting the approval state, including which
-    actions have been used.
+    actions have been used.  Returns a copy of the record as a dict.
     """
-    return _PENDING_APPROVALS.get(approval_id)
+    _evict_expired()
+    record = _PENDING_APPROVALS.get(approval_id)
+    if record is None:
+        return None
+    # The creation time is formatted only when a record is inspected
+    seconds, ns = divmod(record.created_at_ns, 1_000_000_000)
+    created_at = datetime.fromtimestamp(seconds, UTC).replace(
+        microsecond=ns // 1000, tzinfo=None
+    )
+    return {**asdict(record), "created_at": created_at.isoformat()}
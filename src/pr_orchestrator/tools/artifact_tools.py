@@ -6,15 +6,25 @@ takes care to redact secrets from all included files.
 
 S3: The bundle_artifacts_tool now returns base64-encoded zip bytes so that
 clients can retrieve the artifact bundle directly through the MCP protocol.
+Each bundle is also served as a binary MCP resource (``artifact://<id>``),
+which clients that support resources can read without the base64 payload.
 """
 
 from __future__ import annotations
 
-import base64
+import binascii
+import mmap
 from pathlib import Path
 
 from ..artifacts.bundler import bundle_artifacts
 
+# URI template of the resource serving bundles, registered by the server
+ARTIFACT_RESOURCE_TEMPLATE = "artifact://{bundle_id}"
+
+# Bundles created by this process, by bundle id (the bundle's temp directory
+# name).  Only these paths can be read through the artifact resource.
+_BUNDLES: dict[str, Path] = {}
+
 
 def bundle_artifacts_tool(
     diff_text: str,
@@ -23,23 +33,27 @@ def bundle_artifacts_tool(
     after_failures: dict[str, object],
     logs: dict[str, str],
     secrets: list[str],
+    include_bytes: bool = True,
 ) -> dict[str, object]:
     """Bundle artifacts into a redacted zip and return it as base64.
 
     The caller must provide the diff text, metadata dictionary, before and
     after failure structures, and any logs to include.  A list of secrets
     should be supplied to aid in redaction.
-    
+
     S3: Returns the zip archive as base64-encoded bytes so the client can
     retrieve it directly via the MCP protocol without needing filesystem
-    access to the server.
-    
+    access to the server.  Pass ``include_bytes=False`` to get only the
+    metadata when the caller can read ``artifact_path`` itself.
+
     Returns:
         A dictionary containing:
         - artifact_path: Local filesystem path to the zip (for debugging)
         - zip_filename: The filename of the zip archive
-        - zip_base64: Base64-encoded contents of the zip file
+        - zip_base64: Base64-encoded contents of the zip file (only when
+          ``include_bytes`` is True)
         - size_bytes: Size of the zip file in bytes
+        - resource_uri: URI of the MCP resource serving the zip bytes
     """
     path: Path = bundle_artifacts(
         diff_text=diff_text,
@@ -50,15 +64,30 @@ def bundle_artifacts_tool(
         secrets=secrets,
     )
 
-    # Read the zip file and encode as base64
-    with open(path, "rb") as f:
-        zip_bytes = f.read()
-
-    zip_base64 = base64.b64encode(zip_bytes).decode("ascii")
-
-    return {
+    bundle_id = path.parent.name
+    _BUNDLES[bundle_id] = path
+    result: dict[str, object] = {
         "artifact_path": str(path),
         "zip_filename": path.name,
-        "zip_base64": zip_base64,
-        "size_bytes": len(zip_bytes),
+        "resource_uri": ARTIFACT_RESOURCE_TEMPLATE.format(bundle_id=bundle_id),
     }
+
+    # Encode straight from a memory map rather than reading the zip into a
+    # separate bytes buffer first
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if include_bytes:
+            result["zip_base64"] = binascii.b2a_base64(mm, newline=False).decode(
+                "ascii"
+            )
+        result["size_bytes"] = len(mm)
+
+    return result
+
+
+def read_artifact(bundle_id: str) -> bytes:
+    """Return the zip bytes of a bundle created by ``bundle_artifacts_tool``.
+
+    Served as the ``artifact://{bundle_id}`` resource.  Unknown ids raise
+    ``KeyError``; no other paths can be read.
+    """
+    return _BUNDLES[bundle_id].read_bytes()
@@ -7,7 +7,6 @@ No host filesystem access is used.
 
 from __future__ import annotations
 
-import json
 import logging
 import posixpath
 
@@ -17,16 +16,21 @@ from ..state import CONFIG, WORKSPACES
 
 logger = logging.getLogger(__name__)
 
+_MAX_SEARCH_MATCHES = 100
+
+# Patch file location, relative to repo/
+_PATCH_PATH = ".pr_orchestrator/tmp.patch"
+
 
 def _validate_repo_path(path: str) -> str:
     """Validate and normalize a path to ensure it's within repo/.
-    
+
     Args:
         path: Relative path within the repository
-        
+
     Returns:
         Normalized path prefixed with 'repo/'
-        
+
     Raises:
         ValueError: If path escapes repo/
     """
@@ -94,83 +98,41 @@ def write_file(workspace_id: str, path: str, content: str) -> dict[str, bool]:
         return {"written": False}
 
 
-def search_repo(workspace_id: str, query: str, globs: list[str] | None = None) -> dict[str, object]:
+def _parse_search_output(stdout: str) -> list[dict[str, object]]:
+    """Parse ``path<NUL>line:text`` hits into match dictionaries."""
+    matches: list[dict[str, object]] = []
+    for line in stdout.split("\n"):
+        path, sep, rest = line.partition("\0")
+        line_no, _, text = rest.partition(":")
+        if not sep or not line_no.isdigit():
+            continue
+        matches.append(
+            {
+                "path": path.removeprefix("./"),
+                "line": int(line_no),
+                "snippet": text.strip()[:200],
+            }
+        )
+    return matches
+
+
+def search_repo(
+    workspace_id: str, query: str, globs: list[str] | None = None
+) -> dict[str, object]:
     """Search for ``query`` within files under the repository root.
 
-    Executes a Python search script inside the sandbox to find matches.
-    Limited to a modest time budget and maximum match count.
+    Runs a literal ripgrep (or grep, if ripgrep is not installed) search
+    inside the sandbox.  Limited to a modest time budget and maximum match
+    count.
     """
-    ws = WORKSPACES.get(workspace_id)
-
-    if ws.backend is None:
-        raise RuntimeError("Workspace backend is not configured")
-
-    # Build a Python search script to run inside the sandbox
-    # This avoids requiring ripgrep or similar tools
-    globs_json = json.dumps(globs or ["*"])
-    query_escaped = query.replace("\\", "\\\\").replace("'", "\\'")
-
-    search_script = f'''
-import os
-import fnmatch
-import json
-
-query = '{query_escaped}'
-globs = {globs_json}
-max_matches = 100
-matches = []
-
-for root, dirs, files in os.walk('.'):
-    # Skip hidden directories
-    dirs[:] = [d for d in dirs if not d.startswith('.')]
-    
-    for filename in files:
-        # Check glob patterns
-        if globs and globs != ['*']:
-            if not any(fnmatch.fnmatch(filename, g) for g in globs):
-                continue
-        
-        filepath = os.path.join(root, filename)
-        try:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                for line_no, line in enumerate(f, 1):
-                    if query in line:
-                        matches.append({{
-                            'path': filepath[2:] if filepath.startswith('./') else filepath,
-                            'line': line_no,
-                            'snippet': line.strip()[:200]
-                        }})
-                        if len(matches) >= max_matches:
-                            break
-        except Exception:
-            pass
-        
-        if len(matches) >= max_matches:
-            break
-    
-    if len(matches) >= max_matches:
-        break
-
-print(json.dumps(matches))
-'''
-
-    # Run the search script inside the sandbox
-    result = ws.backend.run(
-        ["python", "-c", search_script],
-        "repo",
-        30  # 30 second timeout
-    )
+    patterns = [] if not globs or globs == ["*"] else list(globs)
+    result = WORKSPACES.run_search(workspace_id, query, patterns, _MAX_SEARCH_MATCHES)
 
     if result.get("exit_code", 1) != 0:
         logger.warning("Search failed: %s", result.get("stderr", ""))
-        return {"matches": [], "error": result.get("stderr", "Search failed")}
-
-    try:
-        matches = json.loads(result.get("stdout", "[]"))
-    except json.JSONDecodeError:
-        matches = []
+        return {"matches": [], "error": result.get("stderr") or "Search failed"}
 
-    return {"matches": matches}
+    return {"matches": _parse_search_output(str(result.get("stdout", "")))}
 
 
 def apply_patch(workspace_id: str, unified_diff: str) -> dict[str, object]:
@@ -188,12 +150,10 @@ def apply_patch(workspace_id: str, unified_diff: str) -> dict[str, object]:
     ws.backend.run(["mkdir", "-p", ".pr_orchestrator"], "repo", 10)
 
     # Write diff to a file inside the sandbox
-    patch_path = "repo/.pr_orchestrator/tmp.patch"
-    ws.backend.write_text(patch_path, unified_diff)
+    ws.backend.write_text(f"repo/{_PATCH_PATH}", unified_diff)
 
-    # Apply the patch using internal git helper
-    # The path is relative to repo/
-    resp = WORKSPACES.run_git_apply(workspace_id, ".pr_orchestrator/tmp.patch")
+    # Apply the patch and collect the changed files and diff in one run
+    resp = WORKSPACES.run_git_apply(workspace_id, _PATCH_PATH)
 
     if resp.get("exit_code", 1) != 0:
         return {
@@ -202,16 +162,15 @@ def apply_patch(workspace_id: str, unified_diff: str) -> dict[str, object]:
             "stderr": resp.get("stderr", ""),
         }
 
-    # Get modified files
-    name_resp = WORKSPACES.run_command(workspace_id, "git diff --name-only", cwd="repo")
-    files = [l for l in name_resp.get("stdout", "").splitlines() if l.strip()]
+    names, _, numstat = resp.get("stdout", "").partition("\0")
+    files = [line for line in names.splitlines() if line.strip()]
 
-    # Count diff lines
-    diff_resp = WORKSPACES.run_command(workspace_id, "git diff", cwd="repo")
-    diff_lines = sum(
-        1 for line in diff_resp.get("stdout", "").splitlines()
-        if line.startswith("+") or line.startswith("-")
-    )
+    # Count added plus deleted lines; binary files report "-" for both
+    diff_lines = 0
+    for row in numstat.splitlines():
+        added, deleted, _ = row.split("\t", 2)
+        if added != "-":
+            diff_lines += int(added) + int(deleted)
 
     # Enforce limits
     enforce_patch_limits(files, diff_lines)
@@ -16,10 +16,13 @@ from ..github import api as github_api
 from ..policy.allowlist import upstream_allowed
 from ..state import CONFIG
 
+# S2: Keywords that would make GitHub auto-close the linked issue
+_AUTO_CLOSE_RE = re.compile(r"\b(closes|fixes|resolves)\s+#\d+", re.IGNORECASE)
+
 
 def _enforce_repo_allowed(repo_slug: str) -> None:
     """Raise PermissionError if repo_slug is not in the allowlist."""
-    if not upstream_allowed(repo_slug, CONFIG.allowed_repos):
+    if not upstream_allowed(repo_slug, CONFIG.allowed_repos_normalized):
         raise PermissionError(f"Repository '{repo_slug}' is not in the allowlist")
 
 
@@ -51,7 +54,7 @@ def github_ensure_fork(repo_slug: str) -> dict[str, object]:
 
 def github_get_issue(repo_slug: str, issue_number: int) -> dict[str, object]:
     """Get issue details from GitHub.
-    
+
     The repository must be in the allowlist.
     """
     _enforce_repo_allowed(repo_slug)
@@ -60,7 +63,7 @@ def github_get_issue(repo_slug: str, issue_number: int) -> dict[str, object]:
 
 def github_find_prs_for_issue(repo_slug: str, issue_number: int) -> dict[str, object]:
     """Find PRs linked to an issue.
-    
+
     The repository must be in the allowlist.
     """
     _enforce_repo_allowed(repo_slug)
@@ -82,7 +85,7 @@ def github_open_pr(
     Requires a valid ``approval_id``, which is consumed prior to performing
     the API call.  Raises ``PermissionError`` if the approval ID is missing or
     invalid.  Delegates to the underlying GitHub API implementation.
-    
+
     Validates that:
     1. The upstream repository is in the allowlist
     2. The fork owner matches the configured GitHub username
@@ -109,8 +112,7 @@ def github_open_pr(
         )
 
     # S2: Enforce no auto-close keywords in PR body
-    auto_close_pattern = r"\b(closes|fixes|resolves)\s+#\d+"
-    if re.search(auto_close_pattern, body, re.IGNORECASE):
+    if _AUTO_CLOSE_RE.search(body):
         raise ValueError(
             "PR body contains auto-close keywords (closes/fixes/resolves #N). "
             "Use 'Related to #N' instead to avoid auto-closing issues."
@@ -1,12 +1,14 @@
 """Quality assurance tool implementations.
 
 This module exposes tools for detecting project type, installing dependencies,
-running tests, linting, type checking, formatting and pre-commit hooks.  The
+running tests, linting, type checking, formatting and pre-commit hooks, plus a
+bundle that runs the lint, type and format checks concurrently.  The
 functions delegate to the underlying ``qa`` package.
 """
 
 from __future__ import annotations
 
+from ..qa.bundle import run_qa_bundle as _run_qa_bundle
 from ..qa.detect import detect_project as _detect_project
 from ..qa.install import install_deps as _install_deps
 from ..qa.lint import run_format as _run_format
@@ -16,7 +18,7 @@ from ..qa.tests import run_tests as _run_tests
 from ..qa.tests import run_typecheck as _run_typecheck
 
 
-def detect_project(workspace_id: str) -> dict[str, str]:  # pylint: disable=unused-argument
+def detect_project(workspace_id: str) -> dict[str, object]:  # pylint: disable=unused-argument
     return _detect_project(workspace_id)
 
 
@@ -42,3 +44,7 @@ def run_format(workspace_id: str, command: str | None = None) -> dict[str, objec
 
 def run_precommit(workspace_id: str) -> dict[str, object]:
     return _run_precommit(workspace_id)
+
+
+def run_qa_bundle(workspace_id: str) -> dict[str, object]:
+    return _run_qa_bundle(workspace_id)
@@ -12,12 +12,86 @@ access is used.
 from __future__ import annotations
 
 import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
+import httpx
+
+from ..github.auth import get_github_client
 from ..policy.allowlist import fork_owner_allowed, upstream_allowed
 from ..state import CONFIG, WORKSPACES
 
 logger = logging.getLogger(__name__)
 
+_GH_API = "https://api.github.com"
+
+# Match https://github.com/owner/repo.git or https://github.com/owner/repo
+_REPO_SLUG_RE = re.compile(r"https?://github\.com/([^/]+/[^/]+?)(?:\.git)?$")
+
+# Clone and report the default branch and HEAD sha in one sandbox round-trip.
+# The default branch comes from origin/HEAD, so it is still reported when a
+# tag or other ref is checked out.  Single-branch clones have no origin/HEAD
+# and ask the remote instead; the checked-out branch is the last resort.
+# $1 is the repository URL; any further arguments are git clone options.
+_CLONE_SCRIPT = """\
+url=$1
+shift
+git clone "$@" -- "$url" repo || exit $?
+cd repo || exit 1
+head_re='s|^ref: refs/heads/\\(.*\\)[[:space:]]HEAD$|\\1|p'
+branch=$(git symbolic-ref --short -q refs/remotes/origin/HEAD) \\
+    && branch=${branch#origin/} \\
+    || branch=$(git ls-remote --symref origin HEAD | sed -n "$head_re")
+[ -n "$branch" ] || branch=$(git symbolic-ref --short -q HEAD)
+printf 'branch: %s\\n' "$branch"
+printf 'sha: %s\\n' "$(git rev-parse -q --verify HEAD)"
+exit 0
+"""
+
+# Clone the fork, add upstream and check out the base branch in one sandbox
+# round-trip.  Only a failed clone is fatal; $1 is the fork URL, $2 the
+# upstream URL, $3 the base branch and any further arguments git clone options.
+_SETUP_REMOTES_SCRIPT = """\
+fork=$1 upstream=$2 base=$3
+shift 3
+git clone "$@" -- "$fork" repo || exit $?
+cd repo || exit 1
+git remote add upstream "$upstream"
+git fetch upstream
+git checkout -B "$base" "upstream/$base"
+exit 0
+"""
+
+# Create and switch to a new branch unless it already exists (exit 3).
+# $1 is the branch name and $2 the starting ref.
+_CREATE_BRANCH_SCRIPT = """\
+cd repo || exit 1
+git show-ref --verify --quiet "refs/heads/$1" && exit 3
+git checkout -b "$1" "$2"
+"""
+
+# Per-file counts, then (when $1 is "patch") a NUL and the unified diff.
+_DIFF_SCRIPT = """\
+cd repo || exit 1
+git diff --numstat
+[ "$1" = patch ] || exit 0
+printf '\\0'
+git diff -U3
+"""
+
+# Stage changes, commit and print the new HEAD on the last line.  $1 is the
+# commit message; further arguments limit staging to those paths.
+_COMMIT_SCRIPT = """\
+cd repo || exit 1
+msg=$1
+shift
+if [ $# -gt 0 ]; then git add -A -- "$@"; else git add -A; fi
+git commit -q -m "$msg"
+git rev-parse HEAD
+"""
+
 
 def ensure_fork(upstream_repo_slug: str) -> dict[str, object]:
     """Ensure a fork exists for the given ``upstream_repo_slug``.
@@ -29,8 +103,10 @@ def ensure_fork(upstream_repo_slug: str) -> dict[str, object]:
     whether a new fork was created.
     """
     # Validate upstream repo is allowed
-    if not upstream_allowed(upstream_repo_slug, CONFIG.allowed_repos):
-        raise PermissionError(f"Upstream repository '{upstream_repo_slug}' is not in the allowlist")
+    if not upstream_allowed(upstream_repo_slug, CONFIG.allowed_repos_normalized):
+        raise PermissionError(
+            f"Upstream repository '{upstream_repo_slug}' is not in the allowlist"
+        )
 
     # Parse owner/repo
     try:
@@ -43,42 +119,48 @@ def ensure_fork(upstream_repo_slug: str) -> dict[str, object]:
     fork_slug = f"{username}/{repo_name}"
 
     # Check if fork is allowed for the user
-    if not fork_owner_allowed(fork_slug, username, CONFIG.allowed_repos):
-        raise PermissionError(f"Fork slug '{fork_slug}' is not permitted for user '{username}'")
+    if not fork_owner_allowed(fork_slug, username, CONFIG.allowed_repos_normalized):
+        raise PermissionError(
+            f"Fork slug '{fork_slug}' is not permitted for user '{username}'"
+        )
 
-    headers = {
-        "Accept": "application/vnd.github+json",
-        "Authorization": f"token {CONFIG.github_token}",
-    }
-    import httpx
-    import time as _time
+    # Reuse the shared, keep-alive client so the GET/POST/poll sequence (and
+    # repeated calls) do not each pay for a fresh TCP + TLS handshake.
+    client = get_github_client(CONFIG)
+    fork_api_url = f"{_GH_API}/repos/{fork_slug}"
 
     # Check if fork exists
     created = False
     try:
-        with httpx.Client(timeout=10.0) as client:
-            resp = client.get(f"https://api.github.com/repos/{fork_slug}", headers=headers)
-            if resp.status_code == 200:
-                created = False
-            elif resp.status_code == 404:
-                # Create the fork
-                create_url = f"https://api.github.com/repos/{upstream_owner}/{repo_name}/forks"
-                create_resp = client.post(create_url, headers=headers)
-                if create_resp.status_code not in {202, 201, 200}:
-                    raise RuntimeError(
-                        f"Failed to create fork: {create_resp.status_code} {create_resp.text}"
-                    )
-                created = True
-                # Poll until fork exists (bounded retries)
-                for _ in range(10):
-                    poll = client.get(f"https://api.github.com/repos/{fork_slug}", headers=headers)
-                    if poll.status_code == 200:
-                        break
-                    _time.sleep(1)
-            else:
+        resp = client.get(fork_api_url)
+        if resp.status_code == 200:
+            created = False
+        elif resp.status_code == 404:
+            # Create the fork
+            create_resp = client.post(
+                f"{_GH_API}/repos/{upstream_owner}/{repo_name}/forks"
+            )
+            if create_resp.status_code not in {202, 201, 200}:
                 raise RuntimeError(
-                    f"Unexpected status checking fork existence: {resp.status_code} {resp.text}"
+                    f"Failed to create fork: {create_resp.status_code} {create_resp.text}"
                 )
+            created = True
+            # Poll until fork exists (bounded retries with exponential backoff).
+            # Re-sending the 404's ETag lets GitHub answer 304 while nothing
+            # has changed, which does not count against the rate limit.
+            etag = resp.headers.get("ETag")
+            poll_headers = {"If-None-Match": etag} if etag else None
+            delay = 0.1
+            for _ in range(10):
+                time.sleep(delay)
+                poll = client.get(fork_api_url, headers=poll_headers)
+                if poll.status_code == 200:
+                    break
+                delay = min(delay * 2, 2.0)
+        else:
+            raise RuntimeError(
+                f"Unexpected status checking fork existence: {resp.status_code} {resp.text}"
+            )
     except httpx.HTTPError as exc:
         raise RuntimeError(f"Failed to ensure fork '{fork_slug}': {exc}") from exc
 
@@ -86,58 +168,95 @@ def ensure_fork(upstream_repo_slug: str) -> dict[str, object]:
     return {"fork_slug": fork_slug, "fork_url": fork_url, "created": created}
 
 
+def ensure_forks(upstream_repo_slugs: list[str]) -> dict[str, object]:
+    """Run :func:`ensure_fork` for several upstream repositories concurrently.
+
+    Results are returned under ``forks`` in the order of
+    ``upstream_repo_slugs``.  The calls share the pooled GitHub client, so
+    their round-trips and fork polling overlap instead of running back to
+    back.  The first failure is raised.
+
+    A thread pool is used rather than an async client because every tool is
+    a synchronous callable and may be dispatched from inside the server's
+    running event loop, where ``asyncio.run`` would fail.
+    """
+    if len(upstream_repo_slugs) <= 1:
+        forks = [ensure_fork(slug) for slug in upstream_repo_slugs]
+    else:
+        workers = min(len(upstream_repo_slugs), 8)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            forks = list(pool.map(ensure_fork, upstream_repo_slugs))
+    return {"forks": forks}
+
+
+@lru_cache(maxsize=256)
 def _extract_repo_slug_from_url(repo_url: str) -> str | None:
     """Extract owner/repo from a GitHub URL."""
-    import re
-    # Match https://github.com/owner/repo.git or https://github.com/owner/repo
-    match = re.match(r"https?://github\.com/([^/]+/[^/]+?)(?:\.git)?$", repo_url)
+    match = _REPO_SLUG_RE.match(repo_url)
     if match:
         return match.group(1)
     return None
 
 
-def repo_clone(workspace_id: str, repo_url: str) -> dict[str, object]:
+def _clone_options(ref: str | None, partial: bool, shallow: bool) -> list[str]:
+    """Build the git clone options shared by repo_clone and repo_setup_remotes."""
+    options: list[str] = []
+    if partial:
+        options.append("--filter=blob:none")
+    if shallow:
+        options.append("--depth=1")
+    if ref:
+        options += ["--single-branch", "--branch", ref]
+    return options
+
+
+def repo_clone(
+    workspace_id: str,
+    repo_url: str,
+    *,
+    ref: str | None = None,
+    partial: bool = False,
+    shallow: bool = False,
+) -> dict[str, object]:
     """Clone a repository into the workspace.
 
     The repository is cloned into the ``repo`` subdirectory within the sandbox.
     All operations happen inside E2B - no host filesystem access.
-    
+
+    ``partial`` makes this a partial clone (``--filter=blob:none``): the full
+    commit history is available but file contents are only downloaded for
+    the checked-out tree and fetched lazily afterwards.  It is off by default
+    because later commands such as ``git log -p`` or a blame then go back to
+    the network.  ``ref`` clones only that branch or tag.  ``shallow`` adds
+    ``--depth=1``, which is smallest but breaks history operations such as
+    ``merge-base`` and ``bisect``, so it is off by default too.
+
     The repository must be in the allowlist.
     """
     # Enforce allowlist
     repo_slug = _extract_repo_slug_from_url(repo_url)
-    if repo_slug and not upstream_allowed(repo_slug, CONFIG.allowed_repos):
+    if repo_slug and not upstream_allowed(repo_slug, CONFIG.allowed_repos_normalized):
         raise PermissionError(f"Repository '{repo_slug}' is not in the allowlist")
 
     ws = WORKSPACES.get(workspace_id)
 
-    # Clone into repo/ directory from workspace root
-    # The clone command runs from workspace root (.) and creates repo/
-    clone_cmd = ["git", "clone", repo_url, "repo"]
-    result = WORKSPACES.run_internal_git(workspace_id, clone_cmd, cwd=".")
+    # Clone into repo/ from the workspace root, then read back HEAD
+    result = WORKSPACES.run_internal_git_script(
+        workspace_id, _CLONE_SCRIPT, [repo_url, *_clone_options(ref, partial, shallow)]
+    )
 
     if result.get("exit_code", 1) != 0:
         raise RuntimeError(f"Failed to clone repository: {result.get('stderr', '')}")
 
-    # Detect default branch by inspecting HEAD
+    # Default to main when no branch could be resolved (e.g. an empty clone)
     default_branch = "main"
-    branch_resp = WORKSPACES.run_internal_git(
-        workspace_id,
-        ["git", "symbolic-ref", "--short", "HEAD"],
-        cwd="repo"
-    )
-    if branch_resp.get("exit_code", 1) == 0:
-        detected = branch_resp.get("stdout", "").strip()
-        if detected:
-            default_branch = detected
-
-    # Get head SHA
-    sha_resp = WORKSPACES.run_internal_git(
-        workspace_id,
-        ["git", "rev-parse", "HEAD"],
-        cwd="repo"
-    )
-    head_sha = sha_resp.get("stdout", "").strip()
+    head_sha = ""
+    for line in result.get("stdout", "").splitlines():
+        key, _, value = line.partition(": ")
+        if key == "branch" and value.strip():
+            default_branch = value.strip()
+        elif key == "sha":
+            head_sha = value.strip()
 
     return {
         "repo_path": "repo",
@@ -151,6 +270,8 @@ def repo_setup_remotes(
     fork_url: str,
     upstream_url: str,
     base_branch: str = "main",
+    *,
+    partial: bool = False,
 ) -> dict[str, object]:
     """Clone the user's fork and add the upstream remote.
 
@@ -160,45 +281,46 @@ def repo_setup_remotes(
     2. Add upstream remote
     3. Fetch upstream
     4. Checkout base branch tracking upstream
-    
-    All operations happen inside E2B sandbox.
+
+    The fork is a partial clone (``--filter=blob:none``) only if ``partial``
+    is true.  All operations happen inside E2B sandbox.
     Both fork and upstream URLs must be in the allowlist.
     """
     # Enforce allowlist on both URLs
     fork_slug = _extract_repo_slug_from_url(fork_url)
     upstream_slug = _extract_repo_slug_from_url(upstream_url)
 
-    if upstream_slug and not upstream_allowed(upstream_slug, CONFIG.allowed_repos):
-        raise PermissionError(f"Upstream repository '{upstream_slug}' is not in the allowlist")
+    if upstream_slug and not upstream_allowed(
+        upstream_slug, CONFIG.allowed_repos_normalized
+    ):
+        raise PermissionError(
+            f"Upstream repository '{upstream_slug}' is not in the allowlist"
+        )
 
     # Fork must be under our username
-    if fork_slug and not fork_owner_allowed(fork_slug, CONFIG.github_username, CONFIG.allowed_repos):
-        raise PermissionError(f"Fork '{fork_slug}' is not permitted for user '{CONFIG.github_username}'")
+    if fork_slug and not fork_owner_allowed(
+        fork_slug, CONFIG.github_username, CONFIG.allowed_repos_normalized
+    ):
+        raise PermissionError(
+            f"Fork '{fork_slug}' is not permitted for user '{CONFIG.github_username}'"
+        )
 
     ws = WORKSPACES.get(workspace_id)
 
-    # Step 1: clone the fork into repo/
-    clone_cmd = ["git", "clone", fork_url, "repo"]
-    clone_result = WORKSPACES.run_internal_git(workspace_id, clone_cmd, cwd=".")
-    if clone_result.get("exit_code", 1) != 0:
-        raise RuntimeError(f"Failed to clone fork: {clone_result.get('stderr', '')}")
-
-    # Step 2: add upstream remote
-    add_remote_cmd = ["git", "remote", "add", "upstream", upstream_url]
-    WORKSPACES.run_internal_git(workspace_id, add_remote_cmd, cwd="repo")
-
-    # Step 3: fetch upstream
-    fetch_cmd = ["git", "fetch", "upstream"]
-    WORKSPACES.run_internal_git(workspace_id, fetch_cmd, cwd="repo")
-
-    # Step 4: checkout base branch tracking upstream
-    checkout_cmd = ["git", "checkout", "-B", base_branch, f"upstream/{base_branch}"]
-    WORKSPACES.run_internal_git(workspace_id, checkout_cmd, cwd="repo")
+    result = WORKSPACES.run_internal_git_script(
+        workspace_id,
+        _SETUP_REMOTES_SCRIPT,
+        [fork_url, upstream_url, base_branch, *_clone_options(None, partial, False)],
+    )
+    if result.get("exit_code", 1) != 0:
+        raise RuntimeError(f"Failed to clone fork: {result.get('stderr', '')}")
 
     return {"repo_path": "repo", "default_branch": base_branch}
 
 
-def repo_list_branches(workspace_id: str, remote: str = "origin", all: bool = True) -> dict[str, object]:
+def repo_list_branches(
+    workspace_id: str, remote: str = "origin", all: bool = True
+) -> dict[str, object]:
     """List branches in the repository."""
     cmd = ["git", "branch", "-a"] if all else ["git", "branch"]
     resp = WORKSPACES.run_internal_git(workspace_id, cmd, cwd="repo")
@@ -211,15 +333,18 @@ def repo_list_branches(workspace_id: str, remote: str = "origin", all: bool = Tr
     return {"branches": branches}
 
 
-def repo_find_existing_branches(workspace_id: str, patterns: list[str]) -> dict[str, object]:
+def repo_find_existing_branches(
+    workspace_id: str, patterns: list[str]
+) -> dict[str, object]:
     """Find branches matching any of the provided patterns."""
     all_branches = repo_list_branches(workspace_id, all=True).get("branches", [])
-    matches: list[str] = []
+    # dict keeps first-match order while making the duplicate check O(1)
+    matches: dict[str, None] = {}
     for pat in patterns:
         for branch in all_branches:
-            if pat in branch and branch not in matches:
-                matches.append(branch)
-    return {"matches": matches}
+            if pat in branch:
+                matches.setdefault(branch)
+    return {"matches": list(matches)}
 
 
 def repo_read_pr_template(workspace_id: str) -> dict[str, object]:
@@ -263,31 +388,37 @@ def repo_checkout(workspace_id: str, ref: str) -> dict[str, str]:
     return {"checked_out": ref}
 
 
-def repo_create_branch(workspace_id: str, branch_name: str, from_ref: str) -> dict[str, bool]:
+def repo_create_branch(
+    workspace_id: str, branch_name: str, from_ref: str
+) -> dict[str, bool]:
     """Create a new branch from a given reference."""
-    # Check if branch exists
-    branches = WORKSPACES.run_internal_git(workspace_id, ["git", "branch", "--list"], cwd="repo")
-    if branch_name in (branches.get("stdout", "")):
-        return {"created": False}
-
-    # Checkout from_ref and create new branch
-    WORKSPACES.run_internal_git(workspace_id, ["git", "checkout", from_ref], cwd="repo")
-    WORKSPACES.run_internal_git(workspace_id, ["git", "checkout", "-b", branch_name], cwd="repo")
-    return {"created": True}
+    # Existence check and checkout share one sandbox round-trip
+    resp = WORKSPACES.run_internal_git_script(
+        workspace_id, _CREATE_BRANCH_SCRIPT, [branch_name, from_ref]
+    )
+    return {"created": resp.get("exit_code", 1) == 0}
 
 
-def repo_diff(workspace_id: str) -> dict[str, object]:
-    """Get the unified diff of all changes in the working directory."""
-    diff_resp = WORKSPACES.run_internal_git(workspace_id, ["git", "diff", "-U3"], cwd="repo")
-    diff_text = diff_resp.get("stdout", "")
+def repo_diff(workspace_id: str, include_patch: bool = True) -> dict[str, object]:
+    """Get the unified diff of all changes in the working directory.
 
-    # Count insertions and deletions
-    insertions = sum(1 for line in diff_text.splitlines() if line.startswith("+") and not line.startswith("+++"))
-    deletions = sum(1 for line in diff_text.splitlines() if line.startswith("-") and not line.startswith("---"))
+    Counts come from ``git diff --numstat``; the unified diff itself is only
+    produced when ``include_patch`` is true, otherwise ``unified_diff`` is
+    empty.
+    """
+    resp = WORKSPACES.run_internal_git_script(
+        workspace_id, _DIFF_SCRIPT, ["patch" if include_patch else "stat"]
+    )
+    numstat, _, diff_text = resp.get("stdout", "").partition("\0")
 
-    # Number of changed files
-    name_resp = WORKSPACES.run_internal_git(workspace_id, ["git", "diff", "--name-only"], cwd="repo")
-    files_changed = len([l for l in name_resp.get("stdout", "").splitlines() if l.strip()])
+    # Binary files report "-" for both counts
+    files_changed = insertions = deletions = 0
+    for row in numstat.splitlines():
+        added, deleted, _ = row.split("\t", 2)
+        files_changed += 1
+        if added != "-":
+            insertions += int(added)
+            deletions += int(deleted)
 
     return {
         "unified_diff": diff_text,
@@ -297,13 +428,20 @@ def repo_diff(workspace_id: str) -> dict[str, object]:
     }
 
 
-def repo_commit(workspace_id: str, message: str) -> dict[str, str]:
-    """Commit staged changes with a commit message."""
-    WORKSPACES.run_internal_git(workspace_id, ["git", "add", "-A"], cwd="repo")
-    cmd = ["git", "commit", "-m", message]
-    WORKSPACES.run_internal_git(workspace_id, cmd, cwd="repo")
-    sha_resp = WORKSPACES.run_internal_git(workspace_id, ["git", "rev-parse", "HEAD"], cwd="repo")
-    return {"commit_sha": sha_resp.get("stdout", "").strip()}
+def repo_commit(
+    workspace_id: str, message: str, paths: list[str] | None = None
+) -> dict[str, str]:
+    """Commit staged changes with a commit message.
+
+    All changes in the working tree are staged first unless ``paths`` is
+    given, in which case only changes under those paths are staged; this
+    avoids scanning the whole tree when the caller knows what it edited.
+    """
+    resp = WORKSPACES.run_internal_git_script(
+        workspace_id, _COMMIT_SCRIPT, [message, *(paths or ())]
+    )
+    lines = resp.get("stdout", "").strip().splitlines()
+    return {"commit_sha": lines[-1].strip() if lines else ""}
 
 
 def repo_push(
@@ -322,7 +460,10 @@ def repo_push(
 
     # Enforce fork-only push
     if remote != "origin":
-        raise PermissionError(f"Only pushing to 'origin' (fork) is allowed. Attempted to push to '{remote}'.")
+        raise PermissionError(
+            "Only pushing to 'origin' (fork) is allowed. "
+            f"Attempted to push to '{remote}'."
+        )
 
     # Note: The fork URL was validated during repo_setup_remotes or repo_clone
     # Additional validation at push time would require reading the remote URL from git config
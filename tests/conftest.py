@@ -24,13 +24,18 @@ import tempfile
 import time
 from collections.abc import Sequence
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
+# Fake workspaces live on tmpfs where available: git init/commit in the tests
+# write many small files, which is noticeably cheaper in memory.
+_WORKSPACE_TMP_ROOT = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+
 
 class FakeBackend:
     """A fake backend for testing that executes locally in a temp directory.
-    
+
     This is ONLY for testing - not used in production.
     """
 
@@ -117,6 +122,12 @@ class FakeBackend:
         with open(full_path, "w", encoding="utf-8") as f:
             f.write(content)
 
+    def file_exists(self, path: str) -> bool:
+        """Return True if ``path`` is a regular file in the test directory."""
+        if path.startswith("/"):
+            return Path(path).is_file()
+        return (self.root / path).is_file()
+
     def destroy(self) -> None:
         """Clean up the test directory."""
         try:
@@ -145,12 +156,12 @@ class FakeWorkspaceImpl:
 @pytest.fixture
 def fake_workspace(monkeypatch):
     """Create a fake workspace for testing.
-    
+
     This fixture patches the state module to use a fake backend instead of
     requiring E2B.
     """
     # Create temp directory
-    tmpdir = Path(tempfile.mkdtemp(prefix="test_ws_"))
+    tmpdir = Path(tempfile.mkdtemp(prefix="test_ws_", dir=_WORKSPACE_TMP_ROOT))
     backend = FakeBackend(tmpdir)
 
     # Create fake workspace
@@ -170,12 +181,13 @@ def fake_workspace(monkeypatch):
         def __init__(self):
             self._store = {ws.id: ws}
             self._run_active = False
-            self.config = type('Config', (), {
-                'github_token': 'test-token',
-                'e2b_api_key': 'test-e2b-key',
-                'github_username': 'test-user',
-                'allowed_repos': ['test/*'],
-            })()
+            self.config = SimpleNamespace(
+                github_token="test-token",
+                e2b_api_key="test-e2b-key",
+                github_username="test-user",
+                allowed_repos=["test/*"],
+                allowed_repos_normalized=frozenset(["test/*"]),
+            )
 
         def get(self, workspace_id: str):
             if workspace_id not in self._store:
@@ -195,6 +207,7 @@ def fake_workspace(monkeypatch):
 
     # Patch state module
     import pr_orchestrator.state as state_module
+
     monkeypatch.setattr(state_module, "WORKSPACES", fake_store)
     monkeypatch.setattr(state_module, "CONFIG", fake_store.config)
 
@@ -204,6 +217,137 @@ def fake_workspace(monkeypatch):
     backend.destroy()
 
 
+@pytest.fixture
+def workspaces(fake_workspace):
+    """The shared ``WORKSPACES`` store, as patched by ``fake_workspace``.
+
+    Depending on ``fake_workspace`` guarantees the patch is in place before
+    the store is looked up, so tests cannot see the real store by accident.
+    """
+    import pr_orchestrator.state as state_module
+
+    return state_module.WORKSPACES
+
+
+@pytest.fixture
+def workspace_store(fake_workspace, monkeypatch):
+    """A real ``WorkspaceStore`` serving ``fake_workspace``, patched into state.
+
+    Use it where the store's own run methods (run lock, redaction) must be
+    exercised rather than stubbed.  Modules that bind ``WORKSPACES`` at
+    import still need it patched in explicitly.
+    """
+    import pr_orchestrator.state as state_module
+    from pr_orchestrator.sandbox.workspace_store import Workspace, WorkspaceStore
+
+    store = WorkspaceStore(state_module.CONFIG)
+    store._store[fake_workspace.id] = Workspace(
+        id=fake_workspace.id, impl=fake_workspace.impl, backend=fake_workspace.backend
+    )
+    monkeypatch.setattr(state_module, "WORKSPACES", store)
+    return store
+
+
+@pytest.fixture(scope="session")
+def _git_repo_template(tmp_path_factory):
+    """Build one committed git repository, copied by ``git_workspace``."""
+    repo = tmp_path_factory.mktemp("git_template") / "repo"
+    repo.mkdir()
+    (repo / "README.md").write_text("# Test Repo\n", encoding="utf-8")
+    backend = FakeBackend(repo)
+    for argv in (
+        ["git", "init", "-q", "-b", "main"],
+        ["git", "add", "README.md"],
+        ["git", "commit", "-q", "-m", "Initial commit"],
+    ):
+        assert backend.run(argv, ".", 10)["exit_code"] == 0
+    return repo
+
+
+@pytest.fixture
+def git_workspace(fake_workspace, _git_repo_template):
+    """A ``fake_workspace`` whose ``repo/`` already holds one commit on ``main``.
+
+    The repository is built once per session and copied, which is much
+    cheaper than running git init/add/commit in every test.
+    """
+    shutil.copytree(_git_repo_template, fake_workspace.impl.path / "repo")
+    return fake_workspace
+
+
+class _StubResponse:
+    """Minimal stand-in for ``httpx.Response`` as used by ``github.api``."""
+
+    def __init__(self, status_code: int, payload: dict[str, object]):
+        self.status_code = status_code
+        self.payload = payload
+        self.text = ""
+
+    def json(self) -> dict[str, object]:
+        return self.payload
+
+
+class _StubGitHubClient:
+    """Records ``request`` calls and answers each with the same response."""
+
+    def __init__(self, response: _StubResponse):
+        self.response = response
+        self.calls: list[tuple[tuple, dict]] = []
+
+    def request(self, *args, **kwargs) -> _StubResponse:
+        self.calls.append((args, kwargs))
+        return self.response
+
+
+@pytest.fixture
+def github_mock_client(mocker):
+    """Patch the GitHub API client with a stub answering every request with 201.
+
+    The response JSON describes PR #1; tests override
+    ``github_mock_client.response.payload`` as needed and inspect
+    ``github_mock_client.calls``.
+    """
+    client = _StubGitHubClient(
+        _StubResponse(
+            201, {"html_url": "https://github.com/upstream/repo/pull/1", "number": 1}
+        )
+    )
+    mocker.patch("pr_orchestrator.github.api.get_github_client", return_value=client)
+    return client
+
+
+@pytest.fixture
+def make_approval():
+    """Return a factory for approvals with minimal defaults.
+
+    Keyword arguments override the defaults.  Approvals created through the
+    factory are discarded when the test finishes.
+    """
+    from pr_orchestrator.tools import approval_tools
+
+    created: list[str] = []
+
+    def _make(**overrides):
+        kwargs = {
+            "summary": "Test",
+            "unified_diff": "diff",
+            "checks": {},
+            "pr_draft": True,
+            "branch_plan": {},
+            "approved": True,
+            **overrides,
+        }
+        result = approval_tools.request_approval(**kwargs)
+        if "approval_id" in result:
+            created.append(result["approval_id"])
+        return result
+
+    yield _make
+
+    for approval_id in created:
+        approval_tools._PENDING_APPROVALS.pop(approval_id, None)
+
+
 @pytest.fixture(autouse=True)
 def setup_test_env(monkeypatch):
     """Set up basic test environment."""
@@ -2,41 +2,62 @@
 
 from __future__ import annotations
 
+import httpx
 import pytest
 
 
+def _mock_config(mocker, allowed: list[str]):
+    """Patch repo_tools.CONFIG for ``testuser`` with the given allowlist."""
+    mock_config = mocker.MagicMock()
+    mock_config.github_token = "test-token"
+    mock_config.github_username = "testuser"
+    mock_config.allowed_repos = allowed
+    mock_config.allowed_repos_normalized = frozenset(allowed)
+    mocker.patch("pr_orchestrator.tools.repo_tools.CONFIG", mock_config)
+    return mock_config
+
+
+def _mock_github(
+    mocker, routes: dict[tuple[str, str], list[httpx.Response]]
+) -> list[httpx.Request]:
+    """Serve GitHub API calls from ``routes`` through an ``httpx.MockTransport``.
+
+    ``routes`` maps ``(method, path)`` to the responses returned in turn; the
+    last one repeats.  Returns the list of requests the client sent.
+    """
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        responses = routes[(request.method, request.url.path)]
+        return responses.pop(0) if len(responses) > 1 else responses[0]
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    mocker.patch(
+        "pr_orchestrator.tools.repo_tools.get_github_client", return_value=client
+    )
+    return seen
+
+
 class TestGithubEnsureForkMocked:
     """Integration tests for github_ensure_fork with mocked GitHub API."""
 
     def test_ensure_fork_creates_fork_if_missing(self, mocker) -> None:
         """Test that ensure_fork creates a fork if it doesn't exist."""
-        # Mock CONFIG
-        mock_config = mocker.MagicMock()
-        mock_config.github_token = "test-token"
-        mock_config.github_username = "testuser"
-        mock_config.allowed_repos = ["*"]
-        mocker.patch("pr_orchestrator.tools.repo_tools.CONFIG", mock_config)
-
-        # First GET returns 404 (fork doesn't exist)
-        # POST creates fork (returns 202)
-        # Second GET returns 200 (fork now exists)
-        mock_get_response_404 = mocker.MagicMock()
-        mock_get_response_404.status_code = 404
-
-        mock_post_response = mocker.MagicMock()
-        mock_post_response.status_code = 202
-
-        mock_get_response_200 = mocker.MagicMock()
-        mock_get_response_200.status_code = 200
-
-        # Create a mock httpx.Client that returns these responses
-        mock_client = mocker.MagicMock()
-        mock_client.get.side_effect = [mock_get_response_404, mock_get_response_200]
-        mock_client.post.return_value = mock_post_response
-        mock_client.__enter__ = mocker.MagicMock(return_value=mock_client)
-        mock_client.__exit__ = mocker.MagicMock(return_value=False)
-
-        mocker.patch("httpx.Client", return_value=mock_client)
+        _mock_config(mocker, ["*"])
+        # First GET returns 404 (fork doesn't exist), POST creates the fork
+        # (202) and the next GET returns 200 (fork now exists)
+        seen = _mock_github(
+            mocker,
+            {
+                ("GET", "/repos/testuser/repo"): [
+                    httpx.Response(404),
+                    httpx.Response(200),
+                ],
+                ("POST", "/repos/upstream-org/repo/forks"): [httpx.Response(202)],
+            },
+        )
+        mocker.patch("time.sleep")
 
         from pr_orchestrator.tools.repo_tools import ensure_fork
 
@@ -47,26 +68,42 @@ class TestGithubEnsureForkMocked:
         assert result["created"] is True
 
         # Verify POST was called to create fork
-        mock_client.post.assert_called_once()
+        assert [r.method for r in seen] == ["GET", "POST", "GET"]
+
+    def test_ensure_fork_polls_with_backoff_and_etag(self, mocker) -> None:
+        """Test that fork polling backs off and sends the 404's ETag."""
+        _mock_config(mocker, ["*"])
+        seen = _mock_github(
+            mocker,
+            {
+                ("GET", "/repos/testuser/repo"): [
+                    httpx.Response(404, headers={"ETag": '"abc"'}),
+                    httpx.Response(304),
+                    httpx.Response(304),
+                    httpx.Response(200),
+                ],
+                ("POST", "/repos/upstream-org/repo/forks"): [httpx.Response(202)],
+            },
+        )
+        mock_sleep = mocker.patch("time.sleep")
 
-    def test_ensure_fork_returns_existing_fork(self, mocker) -> None:
-        """Test that ensure_fork returns existing fork without creating."""
-        mock_config = mocker.MagicMock()
-        mock_config.github_token = "test-token"
-        mock_config.github_username = "testuser"
-        mock_config.allowed_repos = ["*"]
-        mocker.patch("pr_orchestrator.tools.repo_tools.CONFIG", mock_config)
+        from pr_orchestrator.tools.repo_tools import ensure_fork
 
-        # GET returns 200 (fork already exists)
-        mock_get_response = mocker.MagicMock()
-        mock_get_response.status_code = 200
+        result = ensure_fork("upstream-org/repo")
 
-        mock_client = mocker.MagicMock()
-        mock_client.get.return_value = mock_get_response
-        mock_client.__enter__ = mocker.MagicMock(return_value=mock_client)
-        mock_client.__exit__ = mocker.MagicMock(return_value=False)
+        assert result["created"] is True
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.1, 0.2, 0.4]
+        polls = [r for r in seen if r.method == "GET"][1:]
+        assert len(polls) == 3
+        assert all(r.headers["If-None-Match"] == '"abc"' for r in polls)
 
-        mocker.patch("httpx.Client", return_value=mock_client)
+    def test_ensure_fork_returns_existing_fork(self, mocker) -> None:
+        """Test that ensure_fork returns existing fork without creating."""
+        _mock_config(mocker, ["*"])
+        # GET returns 200 (fork already exists)
+        seen = _mock_github(
+            mocker, {("GET", "/repos/testuser/repo"): [httpx.Response(200)]}
+        )
 
         from pr_orchestrator.tools.repo_tools import ensure_fork
 
@@ -76,15 +113,34 @@ class TestGithubEnsureForkMocked:
         assert result["created"] is False
 
         # Verify POST was NOT called
-        mock_client.post.assert_not_called()
+        assert [r.method for r in seen] == ["GET"]
+
+    def test_ensure_forks_returns_results_in_order(self, mocker) -> None:
+        """Test that ensure_forks checks several upstreams and keeps their order."""
+        _mock_config(mocker, ["*"])
+        seen = _mock_github(
+            mocker,
+            {
+                ("GET", f"/repos/testuser/{name}"): [httpx.Response(200)]
+                for name in ("one", "two", "three")
+            },
+        )
+
+        from pr_orchestrator.tools.repo_tools import ensure_forks
+
+        results = ensure_forks(["org-a/one", "org-b/two", "org-c/three"])["forks"]
+
+        assert [r["fork_slug"] for r in results] == [
+            "testuser/one",
+            "testuser/two",
+            "testuser/three",
+        ]
+        assert len(seen) == 3
+        assert all(r.method == "GET" for r in seen)
 
     def test_ensure_fork_rejects_unallowed_upstream(self, mocker) -> None:
         """Test that ensure_fork rejects repos not in allowlist."""
-        mock_config = mocker.MagicMock()
-        mock_config.github_token = "test-token"
-        mock_config.github_username = "testuser"
-        mock_config.allowed_repos = ["allowed-org/*"]  # Only allow specific org
-        mocker.patch("pr_orchestrator.tools.repo_tools.CONFIG", mock_config)
+        _mock_config(mocker, ["allowed-org/*"])  # Only allow specific org
 
         from pr_orchestrator.tools.repo_tools import ensure_fork
 
@@ -93,22 +149,9 @@ class TestGithubEnsureForkMocked:
 
     def test_github_ensure_fork_tool_wrapper(self, mocker) -> None:
         """Test the github_ensure_fork MCP tool wrapper."""
-        mock_config = mocker.MagicMock()
-        mock_config.github_token = "test-token"
-        mock_config.github_username = "testuser"
-        mock_config.allowed_repos = ["*"]
-        mocker.patch("pr_orchestrator.tools.repo_tools.CONFIG", mock_config)
+        mock_config = _mock_config(mocker, ["*"])
         mocker.patch("pr_orchestrator.tools.github_tools.CONFIG", mock_config)
-
-        mock_get_response = mocker.MagicMock()
-        mock_get_response.status_code = 200
-
-        mock_client = mocker.MagicMock()
-        mock_client.get.return_value = mock_get_response
-        mock_client.__enter__ = mocker.MagicMock(return_value=mock_client)
-        mock_client.__exit__ = mocker.MagicMock(return_value=False)
-
-        mocker.patch("httpx.Client", return_value=mock_client)
+        _mock_github(mocker, {("GET", "/repos/testuser/repo"): [httpx.Response(200)]})
 
         from pr_orchestrator.tools.github_tools import github_ensure_fork
 
@@ -116,29 +159,41 @@ class TestGithubEnsureForkMocked:
 
         assert result["fork_repo_slug"] == "testuser/repo"
         assert result["fork_clone_url"] == "https://github.com/testuser/repo.git"
-        assert result["upstream_clone_url"] == "https://github.com/upstream-org/repo.git"
+        assert (
+            result["upstream_clone_url"] == "https://github.com/upstream-org/repo.git"
+        )
 
     def test_ensure_fork_handles_api_error(self, mocker) -> None:
         """Test that ensure_fork handles API errors gracefully."""
-        mock_config = mocker.MagicMock()
-        mock_config.github_token = "test-token"
-        mock_config.github_username = "testuser"
-        mock_config.allowed_repos = ["*"]
-        mocker.patch("pr_orchestrator.tools.repo_tools.CONFIG", mock_config)
-
+        _mock_config(mocker, ["*"])
         # GET returns 500 (server error)
-        mock_get_response = mocker.MagicMock()
-        mock_get_response.status_code = 500
-        mock_get_response.text = "Internal Server Error"
+        _mock_github(
+            mocker,
+            {
+                ("GET", "/repos/testuser/repo"): [
+                    httpx.Response(500, text="Internal Server Error")
+                ],
+            },
+        )
 
-        mock_client = mocker.MagicMock()
-        mock_client.get.return_value = mock_get_response
-        mock_client.__enter__ = mocker.MagicMock(return_value=mock_client)
-        mock_client.__exit__ = mocker.MagicMock(return_value=False)
+        from pr_orchestrator.tools.repo_tools import ensure_fork
 
-        mocker.patch("httpx.Client", return_value=mock_client)
+        with pytest.raises(RuntimeError, match="Unexpected status"):
+            ensure_fork("upstream-org/repo")
+
+    def test_ensure_fork_wraps_transport_errors(self, mocker) -> None:
+        """Test that network failures surface as RuntimeError."""
+        _mock_config(mocker, ["*"])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("connection refused", request=request)
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        mocker.patch(
+            "pr_orchestrator.tools.repo_tools.get_github_client", return_value=client
+        )
 
         from pr_orchestrator.tools.repo_tools import ensure_fork
 
-        with pytest.raises(RuntimeError, match="Unexpected status"):
+        with pytest.raises(RuntimeError, match="Failed to ensure fork 'testuser/repo'"):
             ensure_fork("upstream-org/repo")
@@ -0,0 +1,74 @@
+"""Integration tests for QA helpers that probe the sandbox.
+
+These tests use the FakeBackend and run the probes as real subprocesses.
+"""
+
+import os
+
+
+def test_install_deps_skips_without_manifest(fake_workspace):
+    """Test that installation is skipped when no manifest exists."""
+    from pr_orchestrator.qa.install import install_deps
+
+    ws = fake_workspace
+    ws.backend.run(["mkdir", "-p", "repo"], ".", 10)
+
+    result = install_deps(ws.id)
+
+    assert result == {
+        "success": True,
+        "logs": "No dependency manifests found; skipping install.",
+    }
+
+
+def test_run_precommit_skips_without_config(fake_workspace):
+    """Test that pre-commit is skipped when the repo has no config."""
+    from pr_orchestrator.qa.lint import run_precommit
+
+    ws = fake_workspace
+    ws.backend.run(["mkdir", "-p", "repo"], ".", 10)
+
+    result = run_precommit(ws.id)
+
+    assert result == {
+        "ran": False,
+        "passed": True,
+        "logs": "No pre-commit config; skipped.",
+    }
+
+
+def test_run_qa_bundle_reports_each_check(
+    fake_workspace, workspace_store, monkeypatch, tmp_path
+):
+    """Test that the bundle runs all three checks and reports each separately."""
+    from pr_orchestrator.qa.bundle import run_qa_bundle
+
+    # Stand-in tools: lint passes, type check fails, format check fails
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    (bin_dir / "ruff").write_text(
+        "#!/bin/sh\n"
+        'if [ "$1" = check ]; then echo "All checks passed!"; exit 0; fi\n'
+        'echo "Would reformat: app.py ($*)"; exit 1\n'
+    )
+    # A stray NUL byte in a tool's output must not break the sections apart
+    (bin_dir / "mypy").write_text(
+        '#!/bin/sh\nprintf "app.py:1: error: bad\\0\\n"; exit 1\n'
+    )
+    for tool in bin_dir.iterdir():
+        tool.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}:{os.environ['PATH']}")
+
+    ws = fake_workspace
+    ws.backend.run(["mkdir", "-p", "repo"], ".", 10)
+
+    result = run_qa_bundle(ws.id)
+
+    assert result == {
+        "lint": {"passed": True, "logs": "All checks passed!\n"},
+        "typecheck": {"passed": False, "logs": "app.py:1: error: bad\n"},
+        "format": {
+            "passed": False,
+            "logs": "Would reformat: app.py (format --check --no-cache .)\n",
+        },
+    }
@@ -3,6 +3,8 @@
 These tests use the FakeBackend and verify end-to-end flows.
 """
 
+import os
+
 import pytest
 
 
@@ -50,6 +52,8 @@ def test_path_validation():
     assert normalize_repo_cwd("repo/src") == "repo/src"
     assert normalize_repo_cwd(None) == "repo"
     assert normalize_repo_cwd("") == "repo"
+    assert normalize_repo_cwd(".") == "repo"
+    assert normalize_repo_cwd("./repo/src/") == "repo/src"
 
     # Invalid paths - should raise
     with pytest.raises(PermissionError):
@@ -67,21 +71,304 @@ def test_path_validation():
 
 def test_command_allowlist():
     """Test that command allowlist is enforced."""
+    from pr_orchestrator.sandbox.workspace_store import _SAFE_COMMANDS, _tokenize
 
-    # We can't fully test without a workspace, but we can verify the logic
-    # by checking that certain commands would be blocked
-
-    # Safe prefixes
-    safe_prefixes = ("git", "python", "pytest", "ruff", "mypy", "uv", "pip")
+    # We can't fully test without a workspace, but we can check the program
+    # against the same allowlist run_command uses
 
-    # These should be allowed (start with safe prefix)
-    allowed_commands = ["git status", "python -c 'print(1)'", "pytest -q", "ruff check ."]
+    # These should be allowed (the program is allowlisted)
+    allowed_commands = [
+        "git status",
+        "python -c 'print(1)'",
+        "pytest -q",
+        "ruff check .",
+    ]
     for cmd in allowed_commands:
-        first = cmd.split()[0]
-        assert any(first.startswith(p) for p in safe_prefixes), f"{cmd} should be allowed"
+        assert _tokenize(cmd)[0] in _SAFE_COMMANDS, f"{cmd} should be allowed"
 
-    # These should be blocked
-    blocked_commands = ["ls", "cat /etc/passwd", "rm -rf /"]
+    # These should be blocked, including programs that merely share a prefix
+    blocked_commands = ["ls", "cat /etc/passwd", "rm -rf /", "gitk", "pipx run x"]
     for cmd in blocked_commands:
-        first = cmd.split()[0]
-        assert not any(first.startswith(p) for p in safe_prefixes), f"{cmd} should be blocked"
+        assert _tokenize(cmd)[0] not in _SAFE_COMMANDS, f"{cmd} should be blocked"
+
+
+def test_detect_project_finds_requirements_variants(fake_workspace):
+    """Test that detection reports marker files and requirements*.txt variants."""
+    from pr_orchestrator.qa.detect import detect_project
+
+    ws = fake_workspace
+    ws.backend.run(["mkdir", "-p", "repo"], ".", 10)
+    ws.backend.write_text("repo/pyproject.toml", "[project]\n")
+    ws.backend.write_text("repo/requirements.txt", "")
+    ws.backend.write_text("repo/requirements-test.txt", "")
+    ws.backend.write_text("repo/requirements docs.txt", "")
+    ws.backend.write_text("repo/Pipfile", "")
+
+    detection = detect_project(ws.id)
+
+    assert detection["type"] == "python"
+    # Variants follow requirements.txt, ahead of the later markers
+    assert detection["markers"] == [
+        "pyproject.toml",
+        "requirements.txt",
+        "requirements docs.txt",
+        "requirements-test.txt",
+        "Pipfile",
+    ]
+
+
+def test_search_repo_finds_literal_matches(
+    fake_workspace, workspace_store, monkeypatch
+):
+    """Test that search_repo returns literal hits, honouring globs and hidden dirs."""
+    from pr_orchestrator.tools import edit_tools
+
+    monkeypatch.setattr(edit_tools, "WORKSPACES", workspace_store)
+
+    ws = fake_workspace
+    ws.backend.write_text("repo/src/app.py", 'x = 1\nname = "it\'s $(here)"\n')
+    ws.backend.write_text("repo/notes.txt", "it's $(here) too\n")
+    ws.backend.write_text("repo/.git/config", "it's $(here)\n")
+    # Hidden files, ignored files and colons in paths are searched like any other
+    ws.backend.write_text("repo/.gitignore", "build/\n")
+    ws.backend.write_text("repo/.env.example", "it's $(here)\n")
+    ws.backend.write_text("repo/build/a:b.txt", "it's $(here)\n")
+
+    result = edit_tools.search_repo(ws.id, "it's $(here)")
+    assert sorted(m["path"] for m in result["matches"]) == [
+        ".env.example",
+        "build/a:b.txt",
+        "notes.txt",
+        "src/app.py",
+    ]
+
+    result = edit_tools.search_repo(ws.id, "it's $(here)", globs=["*.py"])
+    assert result["matches"] == [
+        {"path": "src/app.py", "line": 2, "snippet": 'name = "it\'s $(here)"'}
+    ]
+
+    assert edit_tools.search_repo(ws.id, "absent") == {"matches": []}
+
+
+def test_search_repo_reports_search_failure(
+    fake_workspace, workspace_store, monkeypatch, tmp_path
+):
+    """Test that a failing ripgrep surfaces as an error, not as no matches."""
+    from pr_orchestrator.tools import edit_tools
+
+    monkeypatch.setattr(edit_tools, "WORKSPACES", workspace_store)
+
+    # Stand-in rg that prints a match, then fails
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    (bin_dir / "rg").write_text(
+        '#!/bin/sh\nprintf "a.py\\0001:x\\n"\necho "rg: $*" >&2\nexit 2\n'
+    )
+    (bin_dir / "rg").chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}:{os.environ['PATH']}")
+
+    result = edit_tools.search_repo(fake_workspace.id, "x")
+
+    assert result["matches"] == []
+    assert "--hidden --no-ignore" in result["error"]
+    assert "--null" in result["error"]
+
+
+def test_apply_patch_reports_files_and_lines(
+    fake_workspace, workspace_store, monkeypatch
+):
+    """Test that apply_patch applies a diff and reports what it changed."""
+    from pr_orchestrator.tools import edit_tools
+
+    monkeypatch.setattr(edit_tools, "WORKSPACES", workspace_store)
+
+    ws = fake_workspace
+    ws.backend.write_text("repo/app.py", "a = 1\nb = 2\n")
+    ws.backend.run(["git", "init", "-q"], "repo", 10)
+    ws.backend.run(["git", "add", "."], "repo", 10)
+    ws.backend.run(["git", "commit", "-qm", "init"], "repo", 10)
+
+    diff = "--- a/app.py\n+++ b/app.py\n@@ -1,2 +1,2 @@\n a = 1\n-b = 2\n+b = 3\n"
+    result = edit_tools.apply_patch(ws.id, diff)
+
+    assert result["applied"] is True
+    assert result["files_modified"] == ["app.py"]
+    assert result["diff_lines"] == 2
+    assert ws.backend.read_text("repo/app.py") == "a = 1\nb = 3\n"
+
+    result = edit_tools.apply_patch(ws.id, diff)
+    assert result["applied"] is False
+    assert "patch does not apply" in result["stderr"]
+
+    # The apply is a run like any other and waits its turn
+    workspace_store._run_lock.acquire()
+    try:
+        with pytest.raises(RuntimeError, match="only one run"):
+            edit_tools.apply_patch(ws.id, diff)
+    finally:
+        workspace_store._run_lock.release()
+
+
+def test_repo_clone_and_setup_remotes_in_one_run(
+    fake_workspace, workspace_store, monkeypatch, tmp_path
+):
+    """Clone and remote setup each run as a single batched script."""
+    import subprocess
+
+    from pr_orchestrator.tools import repo_tools
+
+    src = tmp_path / "src"
+    src.mkdir()
+    for argv in (
+        ["git", "init", "-q", "-b", "trunk"],
+        [
+            "git",
+            "-c",
+            "user.name=T",
+            "-c",
+            "user.email=t@t",
+            "commit",
+            "-q",
+            "--allow-empty",
+            "-m",
+            "init",
+        ],
+        [
+            "git",
+            "-c",
+            "user.name=T",
+            "-c",
+            "user.email=t@t",
+            "commit",
+            "-q",
+            "--allow-empty",
+            "-m",
+            "two",
+        ],
+    ):
+        subprocess.run(argv, cwd=src, check=True)
+
+    monkeypatch.setattr(repo_tools, "WORKSPACES", workspace_store)
+    calls = []
+    run = fake_workspace.backend.run
+    monkeypatch.setattr(
+        fake_workspace.backend, "run", lambda *a: calls.append(a) or run(*a)
+    )
+
+    result = repo_tools.repo_clone(fake_workspace.id, str(src))
+    assert result["default_branch"] == "trunk"
+    assert result["head_sha"]
+    assert len(calls) == 1
+    # Partial clones are opt-in
+    promisor = run(["git", "config", "remote.origin.promisor"], "repo", 10)
+    assert promisor["stdout"].strip() == ""
+
+    fake_workspace.backend.run(["rm", "-rf", "repo"], ".", 10)
+    repo_tools.repo_clone(fake_workspace.id, f"file://{src}", partial=True)
+    promisor = run(["git", "config", "remote.origin.promisor"], "repo", 10)
+    assert promisor["stdout"].strip() == "true"
+
+    fake_workspace.backend.run(["rm", "-rf", "repo"], ".", 10)
+    calls.clear()
+    result = repo_tools.repo_setup_remotes(
+        fake_workspace.id, str(src), str(src), base_branch="trunk"
+    )
+    assert result["default_branch"] == "trunk"
+    assert len(calls) == 1
+    remotes = run(["git", "remote"], "repo", 10)["stdout"].split()
+    assert remotes == ["origin", "upstream"]
+
+    with pytest.raises(RuntimeError, match="Failed to clone repository"):
+        repo_tools.repo_clone(fake_workspace.id, str(tmp_path / "missing"))
+
+    fake_workspace.backend.run(["rm", "-rf", "repo"], ".", 10)
+    result = repo_tools.repo_clone(
+        fake_workspace.id, f"file://{src}", ref="trunk", shallow=True
+    )
+    assert result["default_branch"] == "trunk"
+    shallow = run(["git", "rev-parse", "--is-shallow-repository"], "repo", 10)["stdout"]
+    assert shallow.strip() == "true"
+
+    # A detached checkout still reports the remote's default branch
+    run(["git", "tag", "v1"], str(src), 10)
+    fake_workspace.backend.run(["rm", "-rf", "repo"], ".", 10)
+    result = repo_tools.repo_clone(fake_workspace.id, str(src), ref="v1")
+    assert result["default_branch"] == "trunk"
+
+
+def test_repo_create_branch_and_commit_in_one_run(
+    git_workspace, workspace_store, monkeypatch
+):
+    """Branch creation and commit each take a single batched script."""
+    from pr_orchestrator.tools import repo_tools
+
+    run = git_workspace.backend.run
+
+    monkeypatch.setattr(repo_tools, "WORKSPACES", workspace_store)
+    calls = []
+    monkeypatch.setattr(
+        git_workspace.backend, "run", lambda *a: calls.append(a) or run(*a)
+    )
+
+    assert repo_tools.repo_create_branch(git_workspace.id, "feature-x", "main") == {
+        "created": True
+    }
+    assert repo_tools.repo_create_branch(git_workspace.id, "feature-x", "main") == {
+        "created": False
+    }
+    # A prefix of an existing branch name is a different branch
+    assert repo_tools.repo_create_branch(git_workspace.id, "feature", "main") == {
+        "created": True
+    }
+    assert len(calls) == 3
+
+    git_workspace.backend.write_text("repo/a.txt", "a\n")
+    calls.clear()
+    result = repo_tools.repo_commit(git_workspace.id, "add a")
+    assert len(calls) == 1
+    assert result["commit_sha"]
+    log = run(["git", "log", "-1", "--format=%s"], "repo", 10)["stdout"]
+    assert log.strip() == "add a"
+
+    # With paths, other changes stay out of the commit
+    git_workspace.backend.write_text("repo/b.txt", "b\n")
+    git_workspace.backend.write_text("repo/c.txt", "c\n")
+    repo_tools.repo_commit(git_workspace.id, "add b", paths=["b.txt"])
+    files = run(["git", "show", "--name-only", "--format="], "repo", 10)[
+        "stdout"
+    ].split()
+    assert files == ["b.txt"]
+    status = run(["git", "status", "--porcelain"], "repo", 10)["stdout"]
+    assert status.strip() == "?? c.txt"
+
+
+def test_repo_diff_counts_from_numstat(git_workspace, workspace_store, monkeypatch):
+    """repo_diff takes one run and can skip the unified diff."""
+    from pr_orchestrator.tools import repo_tools
+
+    run = git_workspace.backend.run
+    git_workspace.backend.write_text("repo/a.txt", "one\ntwo\n")
+    git_workspace.backend.write_text("repo/b.txt", "x\n")
+    run(["git", "add", "-A"], "repo", 10)
+    run(["git", "commit", "-q", "-m", "init"], "repo", 10)
+    git_workspace.backend.write_text("repo/a.txt", "one\nTWO\nthree\n")
+    git_workspace.backend.write_text("repo/b.txt", "")
+
+    monkeypatch.setattr(repo_tools, "WORKSPACES", workspace_store)
+    calls = []
+    monkeypatch.setattr(
+        git_workspace.backend, "run", lambda *a: calls.append(a) or run(*a)
+    )
+
+    result = repo_tools.repo_diff(git_workspace.id)
+    assert len(calls) == 1
+    assert (result["files_changed"], result["insertions"], result["deletions"]) == (
+        2,
+        2,
+        2,
+    )
+    assert result["unified_diff"].startswith("diff --git a/a.txt b/a.txt")
+    assert "+three" in result["unified_diff"]
+
+    counts_only = repo_tools.repo_diff(git_workspace.id, include_patch=False)
+    assert counts_only == {**result, "unified_diff": ""}
@@ -4,6 +4,8 @@ These tests verify that approval IDs can be used for both
 push and open_pr actions, but each action can only be used once.
 """
 
+import re
+from datetime import UTC, datetime
 
 from pr_orchestrator.tools.approval_tools import (
     consume_approval,
@@ -38,16 +40,9 @@ def test_approval_multiuse_push_and_pr():
     assert get_approval_record(approval_id) is None
 
 
-def test_approval_single_action_use():
+def test_approval_single_action_use(make_approval):
     """Test that each action can only be used once per approval."""
-    result = request_approval(
-        summary="Test",
-        unified_diff="diff",
-        checks={},
-        pr_draft=True,
-        branch_plan={},
-        approved=True,
-    )
+    result = make_approval()
 
     approval_id = result["approval_id"]
 
@@ -61,32 +56,17 @@ def test_approval_single_action_use():
     assert consume_approval(approval_id, "open_pr") is True
 
 
-def test_approval_rejected():
+def test_approval_rejected(make_approval):
     """Test that rejected approvals don't generate an approval_id."""
-    result = request_approval(
-        summary="Test",
-        unified_diff="diff",
-        checks={},
-        pr_draft=True,
-        branch_plan={},
-        approved=False,
-        notes="Changes need revision",
-    )
+    result = make_approval(approved=False, notes="Changes need revision")
 
     assert result["approved"] is False
     assert "approval_id" not in result
 
 
-def test_approval_invalid_action():
+def test_approval_invalid_action(make_approval):
     """Test that invalid actions are rejected."""
-    result = request_approval(
-        summary="Test",
-        unified_diff="diff",
-        checks={},
-        pr_draft=True,
-        branch_plan={},
-        approved=True,
-    )
+    result = make_approval()
 
     approval_id = result["approval_id"]
 
@@ -99,15 +79,13 @@ def test_approval_nonexistent_id():
     assert consume_approval("nonexistent-id", "push") is False
 
 
-def test_approval_stores_pr_metadata():
+def test_approval_stores_pr_metadata(make_approval):
     """Test that approval stores PR title, body, and issue URL."""
-    result = request_approval(
+    result = make_approval(
         summary="Fix bug #123",
         unified_diff="diff content",
         checks={"tests": "passed"},
-        pr_draft=True,
         branch_plan={"branch": "fix/issue-123"},
-        approved=True,
         pr_title="Fix: Resolve issue #123",
         pr_body="This PR addresses issue #123.\n\nRelated to #123",
         issue_url="https://github.com/owner/repo/issues/123",
@@ -121,6 +99,42 @@ def test_approval_stores_pr_metadata():
     assert record["pr_body"] == "This PR addresses issue #123.\n\nRelated to #123"
     assert record["issue_url"] == "https://github.com/owner/repo/issues/123"
 
-    # Clean up
+
+def test_approval_ids_unique_and_url_safe(make_approval):
+    """Test that approval IDs are distinct 128-bit URL-safe tokens."""
+    ids = {make_approval()["approval_id"] for _ in range(100)}
+
+    assert len(ids) == 100
+    assert all(len(i) == 22 and re.fullmatch(r"[A-Za-z0-9_-]+", i) for i in ids)
+
+
+def test_approval_record_tracks_used_actions(make_approval):
+    """Test that the inspected record reflects which actions were consumed."""
+    result = make_approval(checks={"tests": "passed"}, pr_draft=False)
+    approval_id = result["approval_id"]
+
     consume_approval(approval_id, "push")
-    consume_approval(approval_id, "open_pr")
+    record = get_approval_record(approval_id)
+
+    assert record is not None
+    assert record["used_push"] is True
+    assert record["used_open_pr"] is False
+    assert record["checks"] == {"tests": "passed"}
+    assert datetime.fromisoformat(record["created_at"]) <= datetime.now(UTC).replace(
+        tzinfo=None
+    )
+
+
+def test_approval_expires_after_ttl(monkeypatch, make_approval):
+    """Test that an approval not fully consumed within its TTL is discarded."""
+    from pr_orchestrator.tools import approval_tools
+
+    now = [1000.0]
+    monkeypatch.setattr(approval_tools.time, "monotonic", lambda: now[0])
+
+    approval_id = make_approval()["approval_id"]
+    assert consume_approval(approval_id, "push") is True
+
+    now[0] += approval_tools._APPROVAL_TTL_S
+    assert get_approval_record(approval_id) is None
+    assert consume_approval(approval_id, "open_pr") is False
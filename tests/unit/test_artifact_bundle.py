@@ -0,0 +1,86 @@
+"""Unit tests for artifact bundling."""
+
+from __future__ import annotations
+
+import json
+import zipfile
+
+from pr_orchestrator.artifacts.bundler import bundle_artifacts
+
+
+def test_bundle_contains_redacted_entries() -> None:
+    """Every entry is written and secrets are scrubbed from all of them."""
+    path = bundle_artifacts(
+        diff_text="+token = 'topsecret'\n",
+        metadata={"note": "topsecret"},
+        before_failures={"failing": ["tests/test_a.py::test_a"]},
+        after_failures={"failing": []},
+        logs={"pytest": "1 passed\n", "ruff": "uses topsecret\n"},
+        secrets=["topsecret"],
+    )
+    with zipfile.ZipFile(path) as zf:
+        assert sorted(zf.namelist()) == [
+            "after_failures.json",
+            "before_failures.json",
+            "diff.patch",
+            "logs/pytest.txt",
+            "logs/ruff.txt",
+            "metadata.json",
+        ]
+        assert zf.read("diff.patch").decode() == "+token = '<REDACTED>'\n"
+        assert json.loads(zf.read("metadata.json")) == {"note": "<REDACTED>"}
+        assert json.loads(zf.read("before_failures.json")) == {
+            "failing": ["tests/test_a.py::test_a"]
+        }
+        assert zf.read("logs/ruff.txt").decode() == "uses <REDACTED>\n"
+
+
+def test_bundle_uses_configured_compression(monkeypatch) -> None:
+    """Entries are compressed according to ARTIFACT_COMPRESSION."""
+    import pr_orchestrator.artifacts.bundler as bundler
+
+    monkeypatch.setattr(bundler, "ARTIFACT_COMPRESSION", "stored")
+    path = bundle_artifacts("diff", {}, {}, {}, {}, [])
+    with zipfile.ZipFile(path) as zf:
+        assert zf.getinfo("diff.patch").compress_type == zipfile.ZIP_STORED
+
+    monkeypatch.setattr(bundler, "ARTIFACT_COMPRESSION", "deflate1")
+    path = bundle_artifacts("diff", {}, {}, {}, {}, [])
+    with zipfile.ZipFile(path) as zf:
+        assert zf.getinfo("diff.patch").compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_bundle_tool_returns_zip_base64() -> None:
+    """The tool returns the zip as base64, or only metadata on request."""
+    import base64
+    import io
+
+    from pr_orchestrator.tools.artifact_tools import bundle_artifacts_tool
+
+    result = bundle_artifacts_tool("diff", {}, {}, {}, {"pytest": "ok\n"}, [])
+    zip_bytes = base64.b64decode(result["zip_base64"])
+    assert len(zip_bytes) == result["size_bytes"]
+    with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zf:
+        assert zf.read("logs/pytest.txt") == b"ok\n"
+
+    result = bundle_artifacts_tool("diff", {}, {}, {}, {}, [], include_bytes=False)
+    assert "zip_base64" not in result
+    assert result["size_bytes"] > 0
+
+
+def test_bundle_served_as_resource() -> None:
+    """Each bundle is readable through its artifact resource, and only those."""
+    import pytest
+
+    from pr_orchestrator.tools.artifact_tools import (
+        bundle_artifacts_tool,
+        read_artifact,
+    )
+
+    result = bundle_artifacts_tool("diff", {}, {}, {}, {}, [], include_bytes=False)
+    bundle_id = result["resource_uri"].removeprefix("artifact://")
+
+    with open(result["artifact_path"], "rb") as f:
+        assert read_artifact(bundle_id) == f.read()
+    with pytest.raises(KeyError):
+        read_artifact("../etc")
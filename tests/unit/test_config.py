@@ -0,0 +1,21 @@
+"""Unit tests for configuration loading."""
+
+from __future__ import annotations
+
+from pr_orchestrator.config import get_config
+
+
+def test_get_config_memoized(monkeypatch) -> None:
+    """Repeated calls share one Config until the cache is cleared."""
+    get_config.cache_clear()
+    try:
+        first = get_config()
+        assert get_config() is first
+
+        monkeypatch.setenv("LOG_LEVEL", "DEBUG")
+        assert get_config().log_level == first.log_level
+
+        get_config.cache_clear()
+        assert get_config().log_level == "DEBUG"
+    finally:
+        get_config.cache_clear()
@@ -0,0 +1,88 @@
+"""Unit tests for the E2B sandbox backend."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from pr_orchestrator.sandbox.backend import E2BBackend
+
+
+def _backend(mocker, stdout: str = "", stderr: str = "", exit_code: int = 0):
+    sandbox = mocker.MagicMock()
+    sandbox.commands.run.return_value = SimpleNamespace(
+        stdout=stdout, stderr=stderr, exit_code=exit_code
+    )
+    config = SimpleNamespace(
+        github_token="gh-secret-token", e2b_api_key="e2b-secret-key"
+    )
+    return E2BBackend(sandbox, config), sandbox
+
+
+class TestE2BBackendRun:
+    """Tests for E2BBackend.run."""
+
+    def test_output_redacted(self, mocker) -> None:
+        """Configured tokens are redacted from stdout and stderr."""
+        backend, _sandbox = _backend(
+            mocker, stdout="token gh-secret-token", stderr="key e2b-secret-key"
+        )
+
+        result = backend.run(["git", "status"], "repo", 10)
+
+        assert result["stdout"] == "token <REDACTED>"
+        assert result["stderr"] == "key <REDACTED>"
+        assert result["exit_code"] == 0
+
+    def test_command_runs_in_sandbox_home(self, mocker) -> None:
+        """Relative cwd resolves under the sandbox home with git auth env set."""
+        backend, sandbox = _backend(mocker)
+
+        backend.run(["git", "status"], "repo", 10)
+
+        args, kwargs = sandbox.commands.run.call_args
+        assert args == ("git status",)
+        assert kwargs["cwd"] == "/home/user/repo"
+        assert kwargs["envs"]["GITHUB_TOKEN"] == "gh-secret-token"
+        assert kwargs["envs"]["GIT_TERMINAL_PROMPT"] == "0"
+
+    def test_run_ids_unique(self, mocker) -> None:
+        """Each run gets a distinct 32-character hex run id."""
+        backend, _sandbox = _backend(mocker)
+
+        run_ids = {backend.run(["true"], ".", 10)["run_id"] for _ in range(3)}
+
+        assert len(run_ids) == 3
+        assert all(len(run_id) == 32 and int(run_id, 16) >= 0 for run_id in run_ids)
+
+    def test_arguments_with_spaces_quoted(self, mocker) -> None:
+        """Arguments that the shell would split are quoted."""
+        backend, sandbox = _backend(mocker)
+
+        backend.run(["git", "commit", "-m", "fix the thing"], "repo", 10)
+
+        assert sandbox.commands.run.call_args.args == ("git commit -m 'fix the thing'",)
+
+    def test_env_shared_read_only(self, mocker) -> None:
+        """Every run receives the same read-only env mapping."""
+        backend, sandbox = _backend(mocker)
+
+        backend.run(["true"], ".", 10)
+        backend.run(["true"], ".", 10)
+
+        first, second = (
+            call.kwargs["envs"] for call in sandbox.commands.run.call_args_list
+        )
+        assert first is second
+        with pytest.raises(TypeError):
+            first["GITHUB_TOKEN"] = "other"
+
+    def test_file_exists_uses_exit_code(self, mocker) -> None:
+        """file_exists runs test -f and reports its exit status."""
+        backend, sandbox = _backend(mocker)
+        assert backend.file_exists("repo/pyproject.toml")
+        assert sandbox.commands.run.call_args.args == ("test -f repo/pyproject.toml",)
+
+        sandbox.commands.run.side_effect = RuntimeError("exit status 1")
+        assert not backend.file_exists("repo/missing.toml")
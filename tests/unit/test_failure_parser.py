@@ -0,0 +1,78 @@
+"""Unit tests for pytest failure parsing."""
+
+from __future__ import annotations
+
+from pr_orchestrator.qa.failure_parser import parse_failing_tests
+
+
+def test_failing_tests_extracted_in_order() -> None:
+    """FAILED lines yield file::test identifiers in order of appearance."""
+    logs = (
+        "tests/test_a.py::test_one PASSED\n"
+        "tests/test_b.py::test_two FAILED\n"
+        "tests/test_a.py::test_three FAILED\n"
+    )
+    assert parse_failing_tests(logs) == [
+        "tests/test_b.py::test_two",
+        "tests/test_a.py::test_three",
+    ]
+
+
+def test_duplicate_failures_reported_once() -> None:
+    """A test reported as failing more than once appears once."""
+    logs = "tests/test_b.py::test_two FAILED\ntests/test_b.py::test_two FAILED\n"
+    assert parse_failing_tests(logs) == ["tests/test_b.py::test_two"]
+
+
+def test_verbose_and_summary_lines() -> None:
+    """Progress suffixes and indentation are dropped; short summaries are ignored."""
+    logs = (
+        "  tests/test_a.py::test_x[a b]  FAILED [ 50%]\n"
+        "FAILED tests/test_a.py::test_y - AssertionError\n"
+    )
+    assert parse_failing_tests(logs) == ["tests/test_a.py::test_x[a b]"]
+
+
+def test_no_failures() -> None:
+    """Logs without failures yield an empty list."""
+    assert parse_failing_tests("") == []
+    assert parse_failing_tests("1 passed in 0.01s\n") == []
+
+
+class TestRunTests:
+    """Tests for run_tests failure extraction."""
+
+    def test_failures_parsed_on_test_failure_exit(self, mocker) -> None:
+        """Exit code 1 extracts failing test identifiers from the logs."""
+        mocker.patch(
+            "pr_orchestrator.tools.workspace_tools.run_command",
+            return_value={
+                "exit_code": 1,
+                "stdout": "tests/test_a.py::test_x FAILED\n",
+                "stderr": "",
+            },
+        )
+        from pr_orchestrator.qa.tests import run_tests
+
+        result = run_tests("ws")
+
+        assert result["failing_tests"] == ["tests/test_a.py::test_x"]
+
+    def test_collection_error_skips_parsing(self, mocker) -> None:
+        """Non-failure pytest exit codes skip the log scan."""
+        mocker.patch(
+            "pr_orchestrator.tools.workspace_tools.run_command",
+            return_value={
+                "exit_code": 2,
+                "stdout": "ERROR collecting tests/test_a.py\n",
+                "stderr": "",
+            },
+        )
+        parse = mocker.patch("pr_orchestrator.qa.failure_parser.parse_failing_tests")
+        from pr_orchestrator.qa.tests import run_tests
+
+        result = run_tests("ws")
+
+        assert result["failing_tests"] == []
+        assert not result["passed"]
+        parse.assert_not_called()
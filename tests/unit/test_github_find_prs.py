@@ -0,0 +1,47 @@
+"""Tests for finding pull requests linked to an issue."""
+
+from __future__ import annotations
+
+
+def _pr(number: int, body: str) -> dict[str, object]:
+    return {
+        "number": number,
+        "html_url": f"https://github.com/org/repo/pull/{number}",
+        "title": "Some change",
+        "body": body,
+        "head": {"ref": f"branch-{number}", "repo": {"full_name": "user/repo"}},
+        "user": {"login": "user"},
+        "state": "open",
+    }
+
+
+class TestFindPrsForIssue:
+    """Tests for find_prs_for_issue."""
+
+    def test_lists_pulls_and_filters_references(self, mocker) -> None:
+        """Every page of the pulls listing is filtered by issue reference."""
+        pages = {
+            1: [_pr(7, "Related to #12"), _pr(8, "Touches 12 files")],
+            2: [_pr(9, "See https://github.com/org/repo/issues/12")],
+        }
+        calls: list[tuple[str, int]] = []
+
+        def fake_request(config, method, path, params=None, **kwargs):
+            calls.append((path, params["page"]))
+            return pages.get(params["page"], [])
+
+        mocker.patch(
+            "pr_orchestrator.github.api._github_request", side_effect=fake_request
+        )
+
+        from pr_orchestrator.github.api import find_prs_for_issue
+
+        result = find_prs_for_issue(mocker.MagicMock(), "org/repo", 12)
+
+        assert [pr["number"] for pr in result["prs"]] == [7, 9]
+        assert result["prs"][0]["head_branch"] == "branch-7"
+        assert calls == [
+            ("/repos/org/repo/pulls", 1),
+            ("/repos/org/repo/pulls", 2),
+            ("/repos/org/repo/pulls", 3),
+        ]
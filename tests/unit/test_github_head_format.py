@@ -2,39 +2,20 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+
+import pytest
+
 
 class TestPRHeadFormat:
     """Tests that PR head is correctly formatted as fork_owner:branch."""
 
-    def test_head_format_uses_fork_owner(self, mocker) -> None:
+    def test_head_format_uses_fork_owner(self, github_mock_client) -> None:
         """PR head should be fork_owner:branch, not repo name."""
-        # Mock the HTTP response
-        mock_response = mocker.MagicMock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {
-            "html_url": "https://github.com/upstream/repo/pull/1",
-            "number": 1,
-        }
-
-        # Create mock httpx client
-        mock_client = mocker.MagicMock()
-        mock_client.request.return_value = mock_response
-        mock_client.__enter__ = mocker.MagicMock(return_value=mock_client)
-        mock_client.__exit__ = mocker.MagicMock(return_value=False)
-
-        mocker.patch(
-            "pr_orchestrator.github.api.get_github_client",
-            return_value=mock_client,
-        )
-
-        # Mock config
-        mock_config = mocker.MagicMock()
-        mock_config.github_token = "test-token"
-
         from pr_orchestrator.github.api import open_pr
 
-        open_pr(
-            config=mock_config,
+        result = open_pr(
+            config=SimpleNamespace(github_token="test-token"),
             upstream_repo_slug="upstream-org/repo",
             base_branch="main",
             fork_repo_slug="my-username/repo",
@@ -45,40 +26,28 @@ class TestPRHeadFormat:
         )
 
         # Verify the request was made with correct head format
-        mock_client.request.assert_called_once()
-        call_kwargs = mock_client.request.call_args
-        json_payload = call_kwargs.kwargs.get("json") or call_kwargs[1].get("json")
+        assert len(github_mock_client.calls) == 1
+        json_payload = github_mock_client.calls[-1][1]["json"]
 
         # Head should be "my-username:feature-branch"
         assert json_payload["head"] == "my-username:feature-branch"
         assert json_payload["base"] == "main"
+        assert result == {
+            "pr_url": "https://github.com/upstream/repo/pull/1",
+            "pr_number": 1,
+        }
 
-    def test_head_format_with_different_fork_owner(self, mocker) -> None:
+    def test_head_format_with_different_fork_owner(self, github_mock_client) -> None:
         """Test with different fork owner name."""
-        mock_response = mocker.MagicMock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {
+        github_mock_client.response.payload = {
             "html_url": "https://github.com/org/repo/pull/42",
             "number": 42,
         }
 
-        mock_client = mocker.MagicMock()
-        mock_client.request.return_value = mock_response
-        mock_client.__enter__ = mocker.MagicMock(return_value=mock_client)
-        mock_client.__exit__ = mocker.MagicMock(return_value=False)
-
-        mocker.patch(
-            "pr_orchestrator.github.api.get_github_client",
-            return_value=mock_client,
-        )
-
-        mock_config = mocker.MagicMock()
-        mock_config.github_token = "test-token"
-
         from pr_orchestrator.github.api import open_pr
 
-        open_pr(
-            config=mock_config,
+        result = open_pr(
+            config=SimpleNamespace(github_token="test-token"),
             upstream_repo_slug="organization/project",
             base_branch="develop",
             fork_repo_slug="saakshigupta2002/project",
@@ -88,20 +57,24 @@ class TestPRHeadFormat:
             draft=False,
         )
 
-        call_kwargs = mock_client.request.call_args
-        json_payload = call_kwargs.kwargs.get("json") or call_kwargs[1].get("json")
+        json_payload = github_mock_client.calls[-1][1]["json"]
 
         # Head should be "saakshigupta2002:fix/bug-123"
         assert json_payload["head"] == "saakshigupta2002:fix/bug-123"
-
-    def test_fork_owner_extracted_correctly(self) -> None:
+        assert result["pr_number"] == 42
+
+    @pytest.mark.parametrize(
+        ("fork_repo_slug", "expected"),
+        [
+            ("myuser/myrepo", "myuser"),
+            # Edge case: org with dash
+            ("my-org-name/my-repo-name", "my-org-name"),
+        ],
+    )
+    def test_fork_owner_extracted_correctly(
+        self, fork_repo_slug: str, expected: str
+    ) -> None:
         """Test that fork owner is extracted correctly from slug."""
-        # Test the extraction logic directly
-        fork_repo_slug = "myuser/myrepo"
-        fork_owner = fork_repo_slug.split("/", 1)[0]
-        assert fork_owner == "myuser"
-
-        # Edge case: org with dash
-        fork_repo_slug = "my-org-name/my-repo-name"
-        fork_owner = fork_repo_slug.split("/", 1)[0]
-        assert fork_owner == "my-org-name"
+        from pr_orchestrator.github.api import _fork_owner
+
+        assert _fork_owner(fork_repo_slug) == expected
@@ -0,0 +1,33 @@
+"""Unit tests for the logging bootstrap."""
+
+from __future__ import annotations
+
+import logging
+
+from pr_orchestrator.telemetry import logger as telemetry_logger
+
+
+def test_configures_root_once(monkeypatch) -> None:
+    """The first call installs one stderr handler; later calls are no-ops."""
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "handlers", [])
+    monkeypatch.setattr(root, "level", root.level)
+    monkeypatch.setattr(telemetry_logger, "_configured", False)
+
+    telemetry_logger.configure_logging("DEBUG")
+    telemetry_logger.get_logger("pr_orchestrator.test")
+
+    assert len(root.handlers) == 1
+    assert root.level == logging.DEBUG
+
+
+def test_keeps_existing_configuration(monkeypatch) -> None:
+    """Logging configured by the host application is left alone."""
+    root = logging.getLogger()
+    existing = logging.NullHandler()
+    monkeypatch.setattr(root, "handlers", [existing])
+    monkeypatch.setattr(telemetry_logger, "_configured", False)
+
+    telemetry_logger.get_logger("pr_orchestrator.test")
+
+    assert root.handlers == [existing]
@@ -0,0 +1,45 @@
+"""Unit tests for patch limit enforcement."""
+
+from __future__ import annotations
+
+import itertools
+
+import pytest
+
+from pr_orchestrator.policy.limits import enforce_patch_limits
+
+
+def test_within_limits() -> None:
+    """Patches inside both limits are accepted."""
+    enforce_patch_limits(["a.py", "b.py"], 10, max_files=2, max_lines=10)
+
+
+def test_too_many_files() -> None:
+    """Exceeding the file limit raises."""
+    with pytest.raises(ValueError, match="files"):
+        enforce_patch_limits(["a.py", "b.py", "c.py"], 1, max_files=2)
+
+
+def test_too_many_lines() -> None:
+    """Exceeding the line limit raises."""
+    with pytest.raises(ValueError, match="lines"):
+        enforce_patch_limits(["a.py"], 11, max_lines=10)
+
+
+def test_unbounded_iterable_stops_at_limit() -> None:
+    """Lazily produced file names are only consumed up to the limit."""
+    files = (f"f{i}.py" for i in itertools.count())
+    with pytest.raises(ValueError, match="files"):
+        enforce_patch_limits(files, 1, max_files=5)
+
+
+def test_lazy_count_message_does_not_claim_total() -> None:
+    """A lazily counted overflow reports the limit, not a partial count."""
+    files = (f"f{i}.py" for i in range(500))
+    with pytest.raises(ValueError) as excinfo:
+        enforce_patch_limits(files, 1, max_files=50)
+    assert str(excinfo.value) == (
+        "Patch modifies more than 50 files which exceeds the limit of 50"
+    )
+    with pytest.raises(ValueError, match="Patch modifies 3 files"):
+        enforce_patch_limits(["a.py", "b.py", "c.py"], 1, max_files=2)
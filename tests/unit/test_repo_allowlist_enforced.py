@@ -7,6 +7,7 @@ import pytest
 from pr_orchestrator.policy.allowlist import (
     fork_owner_allowed,
     is_repo_allowed,
+    normalize_allowlist,
     upstream_allowed,
 )
 
@@ -14,74 +15,110 @@ from pr_orchestrator.policy.allowlist import (
 class TestIsRepoAllowed:
     """Tests for the legacy is_repo_allowed function."""
 
-    def test_allowed_with_wildcard(self) -> None:
-        """Repo under owner with wildcard is allowed."""
-        allowed = ["saakshigupta2002/*"]
-        assert is_repo_allowed("saakshigupta2002/myrepo", allowed)
-
-    def test_allowed_explicit_match(self) -> None:
-        """Repo explicitly in allowlist is allowed."""
-        allowed = ["saakshigupta2002/specific-repo"]
-        assert is_repo_allowed("saakshigupta2002/specific-repo", allowed)
-
-    def test_not_allowed_different_owner(self) -> None:
-        """Repo under different owner is not allowed."""
-        allowed = ["saakshigupta2002/*"]
-        assert not is_repo_allowed("other-user/myrepo", allowed)
-
-    def test_not_allowed_not_in_list(self) -> None:
-        """Repo not in allowlist is not allowed."""
-        allowed = ["saakshigupta2002/allowed-repo"]
-        assert not is_repo_allowed("saakshigupta2002/other-repo", allowed)
+    @pytest.mark.parametrize(
+        ("slug", "allowed", "expected"),
+        [
+            pytest.param(
+                "saakshigupta2002/myrepo",
+                ["saakshigupta2002/*"],
+                True,
+                id="owner-wildcard",
+            ),
+            pytest.param(
+                "saakshigupta2002/specific-repo",
+                ["saakshigupta2002/specific-repo"],
+                True,
+                id="explicit",
+            ),
+            pytest.param(
+                "other-user/myrepo", ["saakshigupta2002/*"], False, id="different-owner"
+            ),
+            pytest.param(
+                "saakshigupta2002/other-repo",
+                ["saakshigupta2002/allowed-repo"],
+                False,
+                id="not-listed",
+            ),
+        ],
+    )
+    def test_is_repo_allowed(
+        self, slug: str, allowed: list[str], expected: bool
+    ) -> None:
+        """Repos must be under the owner and listed or covered by its wildcard."""
+        assert is_repo_allowed(slug, allowed) is expected
 
 
 class TestUpstreamAllowed:
     """Tests for upstream_allowed function."""
 
-    def test_allowed_global_wildcard(self) -> None:
-        """Any repo is allowed with global wildcard."""
-        assert upstream_allowed("any-org/any-repo", ["*"])
-        assert upstream_allowed("any-org/any-repo", ["*/*"])
-
-    def test_allowed_owner_wildcard(self) -> None:
-        """Repo under owner with wildcard is allowed."""
-        allowed = ["myorg/*"]
-        assert upstream_allowed("myorg/repo1", allowed)
-        assert upstream_allowed("myorg/repo2", allowed)
-
-    def test_allowed_explicit_match(self) -> None:
-        """Explicitly listed repo is allowed."""
-        allowed = ["specific-org/specific-repo"]
-        assert upstream_allowed("specific-org/specific-repo", allowed)
-
-    def test_not_allowed_different_owner(self) -> None:
-        """Repo under non-allowed owner is rejected."""
-        allowed = ["allowed-org/*"]
-        assert not upstream_allowed("other-org/repo", allowed)
-
-    def test_case_insensitive(self) -> None:
-        """Matching is case-insensitive."""
-        allowed = ["MyOrg/MyRepo"]
-        assert upstream_allowed("myorg/myrepo", allowed)
+    @pytest.mark.parametrize(
+        ("slug", "allowed", "expected"),
+        [
+            pytest.param("any-org/any-repo", ["*"], True, id="global-wildcard"),
+            pytest.param("any-org/any-repo", ["*/*"], True, id="global-owner-wildcard"),
+            pytest.param("myorg/repo1", ["myorg/*"], True, id="owner-wildcard"),
+            pytest.param(
+                "myorg/repo2", ["myorg/*"], True, id="owner-wildcard-other-repo"
+            ),
+            pytest.param(
+                "specific-org/specific-repo",
+                ["specific-org/specific-repo"],
+                True,
+                id="explicit",
+            ),
+            pytest.param(
+                "other-org/repo", ["allowed-org/*"], False, id="different-owner"
+            ),
+            pytest.param("myorg/myrepo", ["MyOrg/MyRepo"], True, id="case-insensitive"),
+        ],
+    )
+    def test_upstream_allowed(
+        self, slug: str, allowed: list[str], expected: bool
+    ) -> None:
+        """Upstreams match explicitly, by owner wildcard or by global wildcard."""
+        assert upstream_allowed(slug, allowed) is expected
 
 
 class TestForkOwnerAllowed:
     """Tests for fork_owner_allowed function."""
 
-    def test_fork_allowed_under_username(self) -> None:
-        """Fork under the correct username is allowed."""
-        allowed = ["upstream-org/repo"]
-        assert fork_owner_allowed("myuser/repo", "myuser", allowed)
-
-    def test_fork_not_allowed_wrong_username(self) -> None:
-        """Fork under wrong username is rejected."""
-        allowed = ["upstream-org/repo"]
-        assert not fork_owner_allowed("other-user/repo", "myuser", allowed)
-
-    def test_fork_allowed_with_global_wildcard(self) -> None:
-        """Fork is allowed with global wildcard."""
-        allowed = ["*"]
-        assert fork_owner_allowed("myuser/any-repo", "myuser", allowed)
+    @pytest.mark.parametrize(
+        ("slug", "allowed", "expected"),
+        [
+            pytest.param(
+                "myuser/repo", ["upstream-org/repo"], True, id="under-username"
+            ),
+            pytest.param(
+                "other-user/repo", ["upstream-org/repo"], False, id="wrong-username"
+            ),
+            pytest.param("myuser/any-repo", ["*"], True, id="global-wildcard"),
+            pytest.param(
+                "myuser/repo",
+                normalize_allowlist([" Upstream-Org/Repo "]),
+                True,
+                id="normalized-match",
+            ),
+            pytest.param(
+                "myuser/other",
+                normalize_allowlist([" Upstream-Org/Repo "]),
+                False,
+                id="unlisted-name",
+            ),
+            # Distinct allowlists must not be served from the cached index
+            pytest.param(
+                "myuser/any", normalize_allowlist(["org/*"]), True, id="owner-wildcard"
+            ),
+            pytest.param(
+                "myuser/any",
+                normalize_allowlist(["org/repo"]),
+                False,
+                id="owner-listed-only",
+            ),
+        ],
+    )
+    def test_fork_owner_allowed(self, slug: str, allowed, expected: bool) -> None:
+        """Forks must be under the username and match an allowlist entry's repo name."""
+        assert fork_owner_allowed(slug, "myuser", allowed) is expected
 
 
 class TestAllowlistEnforcementInTools:
@@ -92,6 +129,7 @@ class TestAllowlistEnforcementInTools:
         # Mock CONFIG to have restricted allowlist
         mock_config = mocker.MagicMock()
         mock_config.allowed_repos = ["saakshigupta2002/*"]
+        mock_config.allowed_repos_normalized = frozenset(["saakshigupta2002/*"])
         mocker.patch("pr_orchestrator.tools.github_tools.CONFIG", mock_config)
 
         from pr_orchestrator.tools.github_tools import github_get_issue
@@ -103,6 +141,7 @@ class TestAllowlistEnforcementInTools:
         """github_find_prs_for_issue rejects repos not in allowlist."""
         mock_config = mocker.MagicMock()
         mock_config.allowed_repos = ["saakshigupta2002/*"]
+        mock_config.allowed_repos_normalized = frozenset(["saakshigupta2002/*"])
         mocker.patch("pr_orchestrator.tools.github_tools.CONFIG", mock_config)
 
         from pr_orchestrator.tools.github_tools import github_find_prs_for_issue
@@ -112,12 +151,13 @@ class TestAllowlistEnforcementInTools:
 
     def test_github_open_pr_rejects_unallowed_upstream(self, mocker) -> None:
         """github_open_pr rejects unallowed upstream repos.
-        
+
         The allowlist check happens BEFORE approval check, so we don't need to
         mock approval consumption for this test.
         """
         mock_config = mocker.MagicMock()
         mock_config.allowed_repos = ["saakshigupta2002/*"]
+        mock_config.allowed_repos_normalized = frozenset(["saakshigupta2002/*"])
         mock_config.github_username = "saakshigupta2002"
         mocker.patch("pr_orchestrator.tools.github_tools.CONFIG", mock_config)
 
@@ -0,0 +1,241 @@
+"""Tests for WorkspaceStore.run_command validation."""
+
+from __future__ import annotations
+
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from pr_orchestrator.sandbox.workspace_store import Workspace, WorkspaceStore
+
+
+@pytest.fixture
+def store(mocker):
+    """A store holding one workspace whose backend echoes the argv it ran."""
+    config = SimpleNamespace(github_token="gh-token", e2b_api_key="e2b-key")
+    backend = mocker.MagicMock()
+    backend.run.side_effect = lambda argv, cwd, timeout_s: {
+        "exit_code": 0,
+        "stdout": " ".join(argv),
+    }
+    impl = SimpleNamespace(expired=lambda: False)
+    store = WorkspaceStore(config)
+    store._store["ws"] = Workspace(id="ws", impl=impl, backend=backend)
+    return store
+
+
+class TestRunCommandValidation:
+    """Tests for command allowlisting and metacharacter rejection."""
+
+    def test_allowed_command_runs(self, store) -> None:
+        """An allowlisted command runs with its tokens passed through."""
+        result = store.run_command("ws", "pytest -q tests")
+        assert result["exit_code"] == 0
+        assert result["stdout"] == "pytest -q tests"
+
+    def test_quoted_arguments_tokenized_like_shlex(self, store) -> None:
+        """Quoted arguments stay single tokens; plain ones split on whitespace."""
+        backend = store.get("ws").backend
+
+        store.run_command("ws", "git commit -m 'fix the parser'")
+        assert backend.run.call_args.args[0] == [
+            "git",
+            "commit",
+            "-m",
+            "fix the parser",
+        ]
+
+        store.run_command("ws", "  ruff\tcheck  . ")
+        assert backend.run.call_args.args[0] == ["ruff", "check", "."]
+
+    @pytest.mark.parametrize(
+        ("command", "fragment"),
+        [
+            ("git status; ls", ";"),
+            ("pytest && ls", "&&"),
+            ("pytest || ls", "||"),
+            ("pytest | tee out", "|"),
+            ("python -c `id`", "`"),
+            ("python $(id)", "$("),
+            ("pytest > out", ">"),
+            ("python < in", "<"),
+        ],
+    )
+    def test_metacharacters_rejected(self, store, command: str, fragment: str) -> None:
+        """Shell chaining and redirection sequences are rejected."""
+        with pytest.raises(
+            PermissionError, match=f"forbidden sequence '{re.escape(fragment)}'"
+        ):
+            store.run_command("ws", command)
+
+    @pytest.mark.parametrize("word", ["sudo", "rm -rf", "curl", "bash", "wget", "ssh"])
+    def test_dangerous_substrings_rejected(self, store, word: str) -> None:
+        """Dangerous programs are rejected anywhere in the command."""
+        with pytest.raises(PermissionError, match=f"forbidden substring '{word}'"):
+            store.run_command("ws", f"python -m {word}")
+
+
+class TestRunCommandAllowlist:
+    """Tests for the program allowlist."""
+
+    @pytest.mark.parametrize(
+        "command", ["pythonic-evil -c 1", "pip3 install x", "uvx tool", "gitk"]
+    )
+    def test_prefix_lookalikes_rejected(self, store, command: str) -> None:
+        """Programs that merely start with an allowlisted name are rejected."""
+        with pytest.raises(PermissionError, match="is not allowed in safe mode"):
+            store.run_command("ws", command)
+
+    def test_pre_commit_requires_expert_mode(self, store) -> None:
+        """pre-commit is only available in expert mode."""
+        with pytest.raises(PermissionError, match="is not allowed in safe mode"):
+            store.run_command("ws", "pre-commit run --all-files")
+        assert (
+            store.run_command("ws", "pre-commit run --all-files", mode="expert")[
+                "exit_code"
+            ]
+            == 0
+        )
+
+    def test_python3_pip_validated(self, store) -> None:
+        """python3 -m pip gets the same safe-mode flag checks as pip."""
+        with pytest.raises(PermissionError, match="--index-url"):
+            store.run_command("ws", "python3 -m pip install --index-url=http://x y")
+
+
+class TestRunCommandLock:
+    """Tests for the single-active-run lock."""
+
+    def test_concurrent_run_rejected(self, store) -> None:
+        """A command started while another is running is rejected."""
+        backend = store.get("ws").backend
+        backend.run.side_effect = lambda argv, cwd, timeout_s: store.run_command(
+            "ws", "pytest"
+        )
+
+        with pytest.raises(RuntimeError, match="only one run is allowed"):
+            store.run_command("ws", "pytest")
+
+    def test_lock_released_after_failure(self, store) -> None:
+        """A backend error does not leave the lock held."""
+        backend = store.get("ws").backend
+        backend.run.side_effect = OSError("sandbox gone")
+
+        with pytest.raises(OSError):
+            store.run_command("ws", "pytest")
+        backend.run.side_effect = lambda argv, cwd, timeout_s: {"exit_code": 0}
+        assert store.run_command("ws", "pytest")["exit_code"] == 0
+
+
+class TestRunInternalGit:
+    """Tests for internal git argv validation."""
+
+    def test_ssh_url_allowed(self, store) -> None:
+        """Only shell sequences are checked, so ssh remote URLs pass."""
+        argv = ["git", "remote", "add", "origin", "ssh://git@github.com/o/r.git"]
+        assert store.run_internal_git("ws", argv)["exit_code"] == 0
+
+    @pytest.mark.parametrize(
+        ("arg", "fragment"), [("a;b", ";"), ("x||y", "||"), ("$(id)", "$(")]
+    )
+    def test_metacharacters_rejected(self, store, arg: str, fragment: str) -> None:
+        """Shell sequences in any argument are rejected."""
+        with pytest.raises(
+            PermissionError, match=f"forbidden sequence '{re.escape(fragment)}'"
+        ):
+            store.run_internal_git("ws", ["git", "status", arg])
+
+    def test_sequences_do_not_span_arguments(self, store) -> None:
+        """Adjacent arguments ending and starting with '|' are not joined into '||'."""
+        with pytest.raises(PermissionError, match=r"forbidden sequence '\|'"):
+            store.run_internal_git("ws", ["git", "status", "a|", "|b"])
+
+    def test_script_args_passed_positionally(self, store) -> None:
+        """Script arguments reach sh as positional parameters, run from the root."""
+        backend = store.get("ws").backend
+        store.run_internal_git_script(
+            "ws", 'git clone -- "$1" repo', ["https://x/o/r.git"]
+        )
+        assert backend.run.call_args.args[:2] == (
+            ["sh", "-c", 'git clone -- "$1" repo', "sh", "https://x/o/r.git"],
+            ".",
+        )
+
+    def test_script_args_checked_for_sequences(self, store) -> None:
+        """Shell sequences in script arguments are rejected."""
+        with pytest.raises(PermissionError, match="forbidden sequence"):
+            store.run_internal_git_script("ws", 'git clone -- "$1" repo', ["u; id"])
+
+
+class TestRunGitPush:
+    """Tests for the push argv."""
+
+    def test_pushes_single_refspec(self, store) -> None:
+        """Only the given refspec is pushed, without extra options."""
+        store.run_git_push("ws", "origin", "HEAD:topic")
+        assert store.get("ws").backend.run.call_args.args[0] == [
+            "git",
+            "push",
+            "origin",
+            "HEAD:topic",
+        ]
+
+
+class TestRunResult:
+    """Tests for the result returned by the run methods."""
+
+    def test_output_redacted(self, store) -> None:
+        """Configured secrets are redacted from stdout and stderr."""
+        backend = store.get("ws").backend
+        backend.run.side_effect = lambda argv, cwd, timeout_s: {
+            "exit_code": 0,
+            "stdout": "token gh-token",
+            "stderr": "key e2b-key",
+        }
+
+        result = store.run_command("ws", "git status")
+        assert "gh-token" not in result["stdout"]
+        assert "e2b-key" not in result["stderr"]
+
+    def test_missing_output_is_empty(self, store) -> None:
+        """Absent or None output is returned as an empty string."""
+        backend = store.get("ws").backend
+        backend.run.side_effect = lambda argv, cwd, timeout_s: {
+            "exit_code": 0,
+            "stdout": None,
+        }
+
+        result = store.run_internal_git("ws", ["git", "add", "-A"])
+        assert result["stdout"] == ""
+        assert result["stderr"] == ""
+
+    def test_non_int_fields_fall_back(self, store) -> None:
+        """A missing or malformed exit code counts as failure, duration as 0."""
+        backend = store.get("ws").backend
+        backend.run.side_effect = lambda argv, cwd, timeout_s: {"duration_ms": None}
+
+        result = store.run_internal_git("ws", ["git", "add", "-A"])
+        assert result["exit_code"] == 1
+        assert result["duration_ms"] == 0
+
+
+class TestRunCommandFastReject:
+    """Tests for the checks run before tokenizing."""
+
+    @pytest.mark.parametrize("command", ["", "   ", "\t\n"])
+    def test_blank_rejected(self, store, command: str) -> None:
+        """Blank commands are rejected."""
+        with pytest.raises(PermissionError, match="Empty command"):
+            store.run_command("ws", command)
+
+    @pytest.mark.parametrize("command", ["./run.sh", "'git' status", "-rf x"])
+    def test_non_letter_start_rejected(self, store, command: str) -> None:
+        """Commands not starting with a letter cannot name an allowlisted program."""
+        with pytest.raises(PermissionError, match="is not allowed in safe mode"):
+            store.run_command("ws", command)
+
+    def test_overlong_rejected(self, store) -> None:
+        """Commands longer than the cap are rejected."""
+        with pytest.raises(PermissionError, match="exceeds 4096 characters"):
+            store.run_command("ws", "pytest " + "x" * 4096)
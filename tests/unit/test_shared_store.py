@@ -4,13 +4,10 @@ These tests verify that workspace IDs work across tool modules.
 """
 
 
-
-def test_workspace_id_accessible_via_state(fake_workspace):
+def test_workspace_id_accessible_via_state(fake_workspace, workspaces):
     """Test that workspace can be accessed via shared state."""
-    from pr_orchestrator.state import WORKSPACES
-
     # Access workspace via shared store
-    ws = WORKSPACES.get(fake_workspace.id)
+    ws = workspaces.get(fake_workspace.id)
     assert ws is not None
     assert ws.id == fake_workspace.id
     assert ws.backend is not None
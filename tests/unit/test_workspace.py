@@ -6,11 +6,9 @@ These tests use the FakeBackend from conftest.py and don't require E2B.
 import pytest
 
 
-def test_workspace_store_get_returns_workspace(fake_workspace):
+def test_workspace_store_get_returns_workspace(fake_workspace, workspaces):
     """Test that workspace store returns workspace by ID."""
-    from pr_orchestrator.state import WORKSPACES
-
-    ws = WORKSPACES.get(fake_workspace.id)
+    ws = workspaces.get(fake_workspace.id)
     assert ws is not None
     assert ws.id == fake_workspace.id
 
@@ -23,15 +21,13 @@ def test_workspace_store_get_raises_for_unknown():
         WORKSPACES.get("nonexistent-id")
 
 
-def test_workspace_destroy(fake_workspace):
+def test_workspace_destroy(fake_workspace, workspaces):
     """Test workspace destruction."""
-    from pr_orchestrator.state import WORKSPACES
-
-    result = WORKSPACES.destroy(fake_workspace.id)
+    result = workspaces.destroy(fake_workspace.id)
     assert result is True
 
     with pytest.raises(KeyError):
-        WORKSPACES.get(fake_workspace.id)
+        workspaces.get(fake_workspace.id)
 
 
 def test_workspace_destroy_nonexistent():